@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 import os
 import sys
@@ -17,7 +16,7 @@ class SynR_EM_PostAnalyzer:
         return 3 * (self.I ** 2) * (self.R_wdg)
 
     def get_next_state(results, in_state):
-        state_out = copy.deepcopy(in_state)
+        state_out = in_state.copy()
         machine = state_out.design.machine
         op_pt = state_out.design.settings
 
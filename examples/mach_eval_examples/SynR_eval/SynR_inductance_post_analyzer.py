@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 import matplotlib.pyplot as plt
 import scipy.optimize
@@ -6,7 +5,7 @@ import scipy.optimize
 class SynR_Inductance_PostAnalyzer:
     
     def get_next_state(results, in_state):
-        state_out = copy.deepcopy(in_state)
+        state_out = in_state.copy()
 
         ############################ Extract required info ###########################
         flux_linkages = results["coil_flux_linkages"]
@@ -1,4 +1,3 @@
-import copy
 import numpy as np
 import os
 import sys
@@ -22,7 +21,7 @@ class BSPM_EM_PostAnalyzer:
         return 6 * ((self.current_trms / 2) ** 2 + self.current_srms**2) * self.R_coil
 
     def get_next_state(results, in_state):
-        state_out = copy.deepcopy(in_state)
+        state_out = in_state.copy()
         machine = state_out.design.machine
 
         ############################ extract required info ###########################
@@ -0,0 +1,23 @@
+import os
+import sys
+
+# add the directory 3 levels above this file's directory to path for module import
+sys.path.append(os.path.dirname(__file__)+"/../../..")
+
+from mach_eval.analyzers.electromagnetic.maxwell_stress import MaxwellStressAnalyzer
+from mach_eval.analyzers.electromagnetic.bspm_maxwell_stress import (
+    BSPM_MaxwellStressProblemDefinition,
+    BSPM_MaxwellStressPostAnalyzer,
+)
+from mach_eval import AnalysisStep
+
+
+###################### Define low fidelity EMAnalysisStep #####################
+# analytic airgap fields and the Maxwell stress tensor replace the JMAG study of
+# em_step in milliseconds; conditions.em holds torque and force results and the
+# copper loss, but no iron or magnet losses
+maxwell_stress_step = AnalysisStep(
+    BSPM_MaxwellStressProblemDefinition,
+    MaxwellStressAnalyzer(),
+    BSPM_MaxwellStressPostAnalyzer,
+)
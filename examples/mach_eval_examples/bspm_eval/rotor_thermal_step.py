@@ -1,6 +1,5 @@
 import os
 import sys
-from copy import deepcopy
 import numpy as np
 
 # add the directory 3 levels above this file's directory to path for module import
@@ -64,7 +63,7 @@ class MyAirflowPostAnalyzer:
         if results["valid"] is False:
             raise InvalidDesign("Magnet temperature beyond limits")
         else:
-            state_out = deepcopy(in_state)
+            state_out = in_state.copy()
             state_out.conditions.airflow = results
         print("\nMagnet temperature = ", results["magnet Temp"][0], " degC")
         print("Required airflow = ", results["Required Airflow"][0], " m/s")
@@ -72,6 +71,6 @@ class MyAirflowPostAnalyzer:
 
 
 rotor_therm_step = AnalysisStep(
-    MyAirflowProblemDef, therm.AirflowAnalyzer(), MyAirflowPostAnalyzer
+    MyAirflowProblemDef, therm.AirflowAnalyzer(method="root"), MyAirflowPostAnalyzer
 )
 
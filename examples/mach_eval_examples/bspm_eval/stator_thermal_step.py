@@ -1,6 +1,5 @@
 import os
 import sys
-from copy import deepcopy
 import numpy as np
 
 # add the directory 3 levels above this file's directory to path for module import
@@ -67,7 +66,7 @@ class MyStatorThermalPostAnalyzer:
         if results["Coil temperature"] > 300 == True:
             raise InvalidDesign("Coil temperature beyond limits")
         else:
-            stateOut = deepcopy(stateIn)
+            stateOut = stateIn.copy()
             stateOut.conditions.T_coil = results["Coil temperature"]
             stateOut.conditions.T_sy = results["Stator yoke temperature"]
 
@@ -1,6 +1,5 @@
 import os
 import sys
-from copy import deepcopy
 
 # add the directory 3 levels above this file's directory to path for module import
 sys.path.append(os.path.dirname(__file__)+"../../..")
@@ -56,7 +55,7 @@ class MyStructPostAnalyzer:
             print("\n")
             machine = in_state.design.machine
             new_machine = machine.clone(dimensions_dict={"d_sl": results[0]})
-        state_out = deepcopy(in_state)
+        state_out = in_state.copy()
         state_out.design.machine = new_machine
         return state_out
 
@@ -1,6 +1,5 @@
 import os
 import sys
-from copy import deepcopy
 import numpy as np
 
 # add the directory 3 levels above this file's directory to path for module import
@@ -29,7 +28,7 @@ class MyWindageLossPostAnalyzer:
     """Converts a State into a problem"""
 
     def get_next_state(results, in_state):
-        state_out = deepcopy(in_state)
+        state_out = in_state.copy()
         omega = state_out.design.settings.speed * 2 * np.pi / 60
         Pout = state_out.conditions.em["torque_avg"] * omega
         eff = (
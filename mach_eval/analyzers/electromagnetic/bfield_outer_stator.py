@@ -14,7 +14,7 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(__file__))
-from bfield_protocol import BField
+from bfield_protocol import BField, field_from_harmonics
 
 
 class BFieldOuterStatorProblem1:
@@ -74,6 +74,57 @@ class BFieldOuterStatorProblem2:
         self.alpha_so = alpha_so
 
 
+class BFieldOuterStatorProblem3:
+    """Problem class for stator radial B field analyzer
+    Attributes:
+        MMF: Current linkage or Magneto-Motive Force [A-turns]. Leading
+          dimensions follow those of the currents.
+        n: Harmonic corresponding to MMF
+        delta_e: Effective airgap [m]
+        r_si: Inner radius of the stator [m]
+        r_rfe: Outer radius of rotor iron [m]
+        alpha_so: stator slot opening [radians]
+    """
+
+    def __init__(
+        self, winding_layouts, zq, currents, alpha_1, n, delta_e, r_si, r_rfe, alpha_so
+    ):
+        self.MMF = self.mmf(winding_layouts, zq, currents, alpha_1, n)
+        self.n = n
+        self.delta_e = delta_e
+        self.r_si = r_si
+        self.r_rfe = r_rfe
+        self.alpha_so = alpha_so
+
+    def mmf(self, winding_layouts, zq, currents, alpha_1, n):
+        """Determines MMF harmonics from the winding functions of stator circuits
+
+        Args:
+            winding_layouts : winding layout of each circuit, shape (circuits,
+              layers, slots), as described in WindingFactorsProblem
+            zq : number of turns
+            currents : instantaneous circuit currents, shape (..., circuits)
+            alpha_1 : angle of first slot counterclockwise from +x axis
+            n : harmonics of interest
+
+        Returns:
+            mmf: Current linkage or Magneto-Motive Force, shape (..., harmonics)
+        """
+        n = np.asarray(n)
+        winding_layouts = np.asarray(winding_layouts)
+        Q = winding_layouts.shape[-1]
+        # ampere-turns in each slot at each instant
+        slot_current = np.asarray(currents) @ (zq * winding_layouts.sum(axis=1))
+        # spectrum of Q equally spaced slots repeats every Q harmonics
+        current_linkage = (
+            np.fft.fft(slot_current, axis=-1)[..., n % Q]
+            * np.exp(-1j * n * alpha_1)
+            / np.pi
+        )
+        mmf = current_linkage / n * np.exp(-np.pi / 2 * 1j)
+        return mmf
+
+
 class BFieldOuterStatorAnalyzer:
     """Analyzer class to evaluate stator radial B field"""
 
@@ -101,7 +152,8 @@ class BFieldOuterStator(BField):
     """Class representing radial B field across motor airgap and tangential B field at stator inner bore
 
     Attributes:
-        MMF: Current linkage or Magneto-Motive Force [A-turns]
+        MMF: Current linkage or Magneto-Motive Force [A-turns]. Leading dimensions
+          (e.g. time instants) are kept in the calculated fields.
         n: Harmonic corresponding to MMF
         delta_e: Effective airgap [m]
         r_si: Inner radius of the stator [m]
@@ -133,12 +185,12 @@ class BFieldOuterStator(BField):
             b_radial_h = self.radial_harmonics(r)
             n = self.n
         else:
-            mask = np.in1d(self.n, harmonics)  # find array ids at which harmonics exist
+            mask = np.isin(self.n, harmonics)  # find array ids at which harmonics exist
             # n and b_radial_h only take harmonic values
             n = self.n[mask]
-            b_radial_h = self.radial_harmonics(r)[mask]
+            b_radial_h = self.radial_harmonics(r)[..., mask]
 
-        b_radial = self.__field_from_harmonics(b_radial_h, n, alpha)
+        b_radial = field_from_harmonics(b_radial_h, n, alpha)
         return b_radial
 
     def tan(self, alpha, r=None, harmonics=None):
@@ -159,12 +211,12 @@ class BFieldOuterStator(BField):
             b_tan_h = self.tangential_harmonics()
             n = self.n
         else:
-            mask = np.in1d(self.n, harmonics)  # find array ids at which harmonics exist
+            mask = np.isin(self.n, harmonics)  # find array ids at which harmonics exist
             # n and b_radial_h only take harmonic values
             n = self.n[mask]
-            b_tan_h = self.tangential_harmonics()[mask]
+            b_tan_h = self.tangential_harmonics()[..., mask]
 
-        b_tan = self.__field_from_harmonics(b_tan_h, n, alpha)
+        b_tan = field_from_harmonics(b_tan_h, n, alpha)
         return b_tan
 
     def radial_harmonics(self, r=None):
@@ -243,19 +295,3 @@ class BFieldOuterStator(BField):
             / (1 - (self.r_rfe / self.r_si) ** (2 * self.n))
         )
         return k_cu
-
-    def __field_from_harmonics(self, fields, n, alpha):
-        # get phase and magnitude of B field harmonics
-        b_mag = abs(fields)
-        b_phase = np.angle(fields)
-
-        n = n.reshape(len(n), 1)  # reshape n for matrix multilication
-        alpha_t = alpha.reshape(1, len(alpha))  # reshape alpha for matrix multilication
-        # get effective theta at each harmonic based on n, alpha, and phase shift
-        theta = n * alpha_t + b_phase.reshape(len(b_phase), 1)
-        # get cosine asuuming MMF phase is provided relative to cos function
-        cos_array = np.cos(theta)
-
-        # get effective tangential B field at each alpha as a sum of all harmonics
-        b_tan = np.sum(b_mag.reshape(len(b_mag), 1) * cos_array, axis=0)
-        return b_tan
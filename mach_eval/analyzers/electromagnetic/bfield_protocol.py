@@ -18,3 +18,57 @@ class BField(Protocol):
         self, alpha: np.array, r: Union[int, float], harmonics: np.array
     ) -> np.array:
         pass
+
+
+def field_from_harmonics(fields: np.array, n: np.array, alpha: np.array) -> np.array:
+    """Synthesizes a field from its complex harmonics
+
+    Evaluates sum(|fields| * cos(n * alpha + angle(fields))) over all harmonics.
+    An inverse real FFT is used when n holds integers and alpha is a uniform
+    grid whose step divides 2*pi, otherwise the harmonics are summed directly.
+
+    Args:
+        fields: A numpy array of complex field harmonics. Leading dimensions, such
+            as time instants or rotor positions, are kept in the output.
+        n: A numpy array of harmonic orders corresponding to the last axis of fields
+        alpha: A numpy array holding angles at which the field is calculated
+    Returns:
+        field: A numpy array of fields at angle(s) alpha with shape
+            fields.shape[:-1] + (len(alpha),)
+    """
+    fields = np.asarray(fields)
+    n = np.asarray(n)
+    alpha = np.asarray(alpha, dtype=float)
+
+    M = _fft_length(n, alpha)
+    if M is None or M * np.log2(max(M, 2)) > len(n) * len(alpha):
+        return np.real(fields @ np.exp(1j * np.outer(n, alpha)))
+
+    # fold harmonics onto the M points per period, shifted to start at alpha[0]
+    lead = fields.shape[:-1]
+    G = (fields * np.exp(1j * n * alpha[0])).reshape(-1, len(n))
+    S = np.zeros((len(G), M), dtype=complex)
+    np.add.at(S, (slice(None), np.mod(n.astype(int), M)), G)
+
+    # conjugate pairs of the full spectrum give the half spectrum of a real signal
+    half = M // 2 + 1
+    X = S[:, :half].copy()
+    X[:, 1:] = (X[:, 1:] + np.conj(S[:, M - 1 : M - half : -1])) / 2
+    period = np.fft.irfft(X, n=M, axis=-1) * M
+
+    field = period[:, np.arange(len(alpha)) % M]
+    return field.reshape(lead + (len(alpha),))
+
+
+def _fft_length(n: np.array, alpha: np.array):
+    """Number of points per period of a uniform angle grid, None if not applicable"""
+    if len(alpha) < 2 or np.any(n != np.round(n)):
+        return None
+    step = np.diff(alpha)
+    delta = step[0]
+    if delta <= 0 or not np.allclose(step, delta, rtol=1e-9, atol=0):
+        return None
+    M = 2 * np.pi / delta
+    if abs(M - round(M)) > 1e-6:
+        return None
+    return int(round(M))
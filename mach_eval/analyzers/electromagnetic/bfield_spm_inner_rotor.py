@@ -9,7 +9,7 @@ import os
 import sys
 
 sys.path.append(os.path.dirname(__file__))
-from bfield_protocol import BField
+from bfield_protocol import BField, field_from_harmonics
 
 class BFieldSPM_InnerRotorProblem:
     """Problem class for stator radial B field analyzer
@@ -67,6 +67,8 @@ class BFieldSPM_InnerRotor(BField):
 
     Attributes:
         alpha_p: angular length of magnet in pu
+        theta: orientation of rotor d-axis. An array of orientations evaluates
+          several rotor positions at once; its dimensions lead those of r.
         p: Number of pole pairs
         muR: Relative permeability
         r_fe: Outer radius of rotor iron
@@ -93,17 +95,18 @@ class BFieldSPM_InnerRotor(BField):
 
         Args:
             alpha: A numpy array holding angles at which B field is calculated.
-            r: Radius at which B field is calculated.
+            r: Radius or numpy array of radii at which B field is calculated.
             theta: Angular orientation of PM rotor d-axis.
             harmonics: A numpy array holding holding harmonics of interest.
         Returns:
-            b_radial: A numpy array of normal B fields in airgap at radius r and angle(s) alpha
+            b_radial: A numpy array of normal B fields in airgap at radius r and angle(s) alpha,
+              with shape theta.shape + r.shape + (len(alpha),)
         """
         if harmonics is None:
             harmonics = self.p * np.arange(1,15,2)  # first 13 harmonics
         b_radial_h = self.radial_harmonics(r, harmonics)
         n = harmonics
-        b_radial = self.__field_from_harmonics(b_radial_h, n, alpha)
+        b_radial = field_from_harmonics(b_radial_h, n, alpha)
         return b_radial
 
     def tan(self, alpha, r=None, harmonics=None):
@@ -111,81 +114,102 @@ class BFieldSPM_InnerRotor(BField):
 
         Args:
             alpha: A numpy array holding angles at which B field is calculated.
-            r: Radius at which B field is calculated. Should be of type int or float
+            r: Radius or numpy array of radii at which B field is calculated.
             theta: angular orientation of PM rotor d-axis
             harmonics: A numpy array holding holding harmonics of interest
         Returns:
-            b_tan: A numpy array of tangential B fields in airgap at radius r and angle(s) alpha
+            b_tan: A numpy array of tangential B fields in airgap at radius r and angle(s) alpha,
+              with shape theta.shape + r.shape + (len(alpha),)
         """
         if harmonics is None:
             harmonics = self.p * np.arange(1,15,2)  # first 13 harmonics
         b_tan_h = self.tan_harmonics(r, harmonics)
         n = harmonics
-        b_tan = self.__field_from_harmonics(b_tan_h, n, alpha)
+        b_tan = field_from_harmonics(b_tan_h, n, alpha)
         return b_tan
 
     def radial_harmonics(self, r=None, harmonics=None):
         """Determines radial B field harmonics at radius r
 
         Args:
-            r: Radius at which B field is calculated. Should be of type int or float. Defaults to 
+            r: Radius or numpy array of radii at which B field is calculated. Defaults to
               inner bore of stator if not defined.
             theta: angular orientation of PM rotor d-axis
             harmonics: A numpy array holding holding harmonics of interest. Considers 1st thirteen
               harmonics of p if not defined 
         Returns:
-            b_rad_h: A numpy array of radial B field harmonics corresponding harmonics array
+            b_rad_h: A numpy array of radial B field harmonics corresponding harmonics array,
+              with shape theta.shape + r.shape + (len(harmonics),)
         """
-        if r==None:
+        if r is None:
             r = self.Rsi    # stator inner bore
         if harmonics is None:
             harmonics = self.p * np.arange(1,15,2)  # first 13 harmonics
-        r_fe = self.r_fe
-        p = self.p
-        muR = self.muR
+        vp = np.asarray(harmonics)
+        Bov = self.__get_harmonic_coeffs(vp)
         Rmo = self.Rmo # rotor outer radius
         Rsi = self.Rsi # stator inner radius
-        vp = harmonics
-        # get magnetization vector
-        Mv, c3v = self.__get_Mv_c3v(harmonics)
-
-        # calculate radial b field magnitudes using EQUATION 15a
-        Bov = (Mv*vp/(muR*(vp)**2-1))*\
-                (c3v-1+2*(r_fe/Rmo)**(vp+1)-(c3v+1)*(r_fe/Rmo)**(2*vp))*muR/\
-                ((muR+1)*(1-(r_fe/Rsi)**(2*vp))-(muR-1)*((Rmo/Rsi)**(2*vp)-(r_fe/Rmo)**(2*vp)))*\
-                ((r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
+        r = np.asarray(r, dtype=float)[..., None]
 
-        # discard even and fractional harmonics and revise formula for vp=1
-        for i in range(len(vp)):
-            # even harmonics non-existent
-            if harmonics[i]/p % 2 == 0 or harmonics[i]/p % 1 != 0:
-                Bov[i] = 0
-                continue
-            # vp=1 has different field formula
-            elif vp[i] == 1:
-                Bov[i] = ((Mv[i]/(muR*2))*(c3v[i]*(Rmo/Rsi)**2 -(c3v[i])*(r_fe/Rsi)**2 +\
-                            (r_fe/Rsi)**2*np.log((Rmo/r_fe)**2))*muR/((muR+1)*(1-(r_fe/Rsi)**2)-\
-                            (muR-1)*((Rmo/Rsi)**2-(r_fe/Rmo)**2))*(1+(Rsi/r)**2))
-        # rotate based on rotor orientation
-        b_rad_h = np.array(Bov) * np.exp(-self.theta*vp* 1j)
+        # radial dependence of EQUATION 15a, vp=1 has a different field formula
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            r_fac = np.where(
+                vp == 1,
+                1+(Rsi/r)**2,
+                (r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
+        # rotate based on rotor orientation, rotor positions lead the radii
+        theta = np.asarray(self.theta, dtype=float)
+        theta = theta.reshape(theta.shape + (1,) * r.ndim)
+        b_rad_h = Bov * r_fac * np.exp(-theta*vp* 1j)
         return b_rad_h 
     
     def tan_harmonics(self, r=None, harmonics=None):
         """Determines tangential B field harmonics at radius r
 
         Args:
-            r: Radius at which B field is calculated. Should be of type int or float. Defaults to 
+            r: Radius or numpy array of radii at which B field is calculated. Defaults to
               inner bore of stator if not defined.
             theta: angular orientation of PM rotor d-axis
             harmonics: A numpy array holding holding harmonics of interest. Considers 1st thirteen
               harmonics of p if not defined 
         Returns:
-            b_rad_h: A numpy array of tangential B field harmonics corresponding harmonics array
+            b_rad_h: A numpy array of tangential B field harmonics corresponding harmonics array,
+              with shape theta.shape + r.shape + (len(harmonics),)
         """
-        if r==None:
+        if r is None:
             r = self.Rsi    # stator inner bore
         if harmonics is None:
             harmonics = self.p * np.arange(1,15,2)  # first 13 harmonics
+        vp = np.asarray(harmonics)
+        Bov = self.__get_harmonic_coeffs(vp)
+        Rmo = self.Rmo # rotor outer radius
+        Rsi = self.Rsi # stator inner radius
+        r = np.asarray(r, dtype=float)[..., None]
+
+        # radial dependence of EQUATION 15b, vp=1 has a different field formula
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            r_fac = np.where(
+                vp == 1,
+                -1+(Rsi/r)**2,
+                -1*(r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
+        # rotate based on rotor orientation, rotor positions lead the radii
+        theta = np.asarray(self.theta, dtype=float)
+        theta = theta.reshape(theta.shape + (1,) * r.ndim)
+        b_tan_h = Bov * r_fac * np.exp(-theta*vp* 1j)
+        # rotate again considering tan is a sine function 
+        b_tan_h = b_tan_h * np.exp(-np.pi/2* 1j)
+        return b_tan_h 
+
+    def __get_harmonic_coeffs(self, harmonics):
+        """Radius and orientation independent part of EQUATION 15, cached per
+        geometry and harmonics"""
+        key = (self.alpha_p, self.p, self.muR, self.Br, self.r_fe, self.Rmo,
+               self.Rsi, self.mag_dir, tuple(harmonics.tolist()))
+        if not hasattr(self, "_coeff_cache"):
+            self._coeff_cache = {}
+        if key in self._coeff_cache:
+            return self._coeff_cache[key]
+
         r_fe = self.r_fe
         p = self.p
         muR = self.muR
@@ -195,28 +219,20 @@ class BFieldSPM_InnerRotor(BField):
         # get magnetization vector
         Mv, c3v = self.__get_Mv_c3v(harmonics)
 
-        # calculate radial b field magnitudes using EQUATION 15b
-        Bov = (Mv*vp/(muR*(vp)**2-1))*\
-            (c3v-1+2*(r_fe/Rmo)**(vp+1)-(c3v+1)*(r_fe/Rmo)**(2*vp))*muR/\
-            ((muR+1)*(1-(r_fe/Rsi)**(2*vp))-(muR-1)*((Rmo/Rsi)**(2*vp)-(r_fe/Rmo)**(2*vp)))*\
-            (-1*(r/Rsi)**(vp-1)*(Rmo/Rsi)**(vp+1)+(Rmo/r)**(vp+1))
-
-        # discard even harmoincs and revise formula for vp=1
-        for i in range(len(vp)):
-            # even harmonics non-existent
-            if harmonics[i]/p % 2 == 0 or harmonics[i]/p % 1 != 0:
-                Bov[i] = 0
-                continue
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            Bov = (Mv*vp/(muR*(vp)**2-1))*\
+                    (c3v-1+2*(r_fe/Rmo)**(vp+1)-(c3v+1)*(r_fe/Rmo)**(2*vp))*muR/\
+                    ((muR+1)*(1-(r_fe/Rsi)**(2*vp))-(muR-1)*((Rmo/Rsi)**(2*vp)-(r_fe/Rmo)**(2*vp)))
             # vp=1 has different field formula
-            elif vp[i] == 1:
-                Bov[i] = (Mv[i]/(muR*2))*(c3v[i]*(Rmo/Rsi)**2 -(c3v[i])*(r_fe/Rsi)**2 +\
-                            (r_fe/Rsi)**2*np.log((Rmo/r_fe)**2))*muR/((muR+1)*(1-(r_fe/Rsi)**2)-\
-                            (muR-1)*((Rmo/Rsi)**2-(r_fe/Rmo)**2))*(-1+(Rsi/r)**2)
-        # rotate based on rotor orientation
-        b_tan_h = np.array(Bov) * np.exp(-self.theta*vp* 1j)
-        # rotate again considering tan is a sine function 
-        b_tan_h = b_tan_h * np.exp(-np.pi/2* 1j)
-        return b_tan_h 
+            Bov_1 = (Mv/(muR*2))*(c3v*(Rmo/Rsi)**2 -(c3v)*(r_fe/Rsi)**2 +\
+                        (r_fe/Rsi)**2*np.log((Rmo/r_fe)**2))*muR/((muR+1)*(1-(r_fe/Rsi)**2)-\
+                        (muR-1)*((Rmo/Rsi)**2-(r_fe/Rmo)**2))
+        Bov = np.where(vp == 1, Bov_1, Bov)
+        # even and fractional harmonics non-existent
+        Bov = np.where((vp/p % 2 == 0) | (vp/p % 1 != 0), 0, Bov)
+
+        self._coeff_cache[key] = Bov
+        return Bov
 
     def __get_Mv_c3v(self, harmonics):
         alpha_p = self.alpha_p
@@ -226,22 +242,21 @@ class BFieldSPM_InnerRotor(BField):
         v = vp/p
         if self.mag_dir=="parallel":
             # EQUATION 7c and 7d
-            c1v = np.sin((vp+1)*alpha_p*np.pi/(2*p))/((vp+1)*alpha_p*np.pi/(2*p))
-            c2v = np.sin((vp-1)*alpha_p*np.pi/(2*p))/((vp-1)*alpha_p*np.pi/(2*p))
-            for i in range(len(vp)):
-                if vp[i]==1:
-                    c2v[i] = 1
-                    break
+            with np.errstate(divide="ignore", invalid="ignore"):
+                c1v = np.sin((vp+1)*alpha_p*np.pi/(2*p))/((vp+1)*alpha_p*np.pi/(2*p))
+                c2v = np.sin((vp-1)*alpha_p*np.pi/(2*p))/((vp-1)*alpha_p*np.pi/(2*p))
+            c2v = np.where(vp == 1, 1, c2v)
             Mrv = Br*alpha_p*(c1v+c2v)
             Mtv = Br*alpha_p*(c1v-c2v)
             # EQUATION 10b
             Mv = Mrv+vp*Mtv
-            c3v = (vp-1/(vp))*Mrv/Mv + 1/(vp)
-            c3v[i] = 2*Mrv[i]/Mv[i]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                c3v = np.where(vp == 1, 2*Mrv/Mv, (vp-1/(vp))*Mrv/Mv + 1/(vp))
 
         elif self.mag_dir=="radial":
             # EQUATION 7a and 7b
-            Mrv = 2*Br*alpha_p*np.sin(v*np.pi*alpha_p/2)/(v*np.pi*alpha_p/2)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                Mrv = 2*Br*alpha_p*np.sin(v*np.pi*alpha_p/2)/(v*np.pi*alpha_p/2)
             Mtv = 0
             # EQUATION 10b
             Mv = Mrv+vp*Mtv
@@ -249,19 +264,3 @@ class BFieldSPM_InnerRotor(BField):
         else:
             raise NotImplemented("Invalid magnetization direction")
         return Mv, c3v
-
-    def __field_from_harmonics(self, fields, n, alpha):
-        # get phase and magnitude of B field harmonics
-        b_mag = abs(fields)
-        b_phase = np.angle(fields)
-
-        n = n.reshape(len(n), 1)  # reshape n for matrix multilication
-        alpha_t = alpha.reshape(1, len(alpha))  # reshape alpha for matrix multilication
-        # get effective theta at each harmonic based on n, alpha, and phase shift
-        theta = n * alpha_t + b_phase.reshape(len(b_phase), 1)
-        # get cosine asuuming MMF phase is provided relative to cos function
-        cos_array = np.cos(theta)
-
-        # get effective tangential B field at each alpha as a sum of all harmonics
-        b_field = np.sum(b_mag.reshape(len(b_mag), 1) * cos_array, axis=0)
-        return b_field
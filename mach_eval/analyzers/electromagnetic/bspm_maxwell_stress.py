@@ -0,0 +1,244 @@
+########################### source of equations ###############################
+# [1] G. Bergmann and A. Binder, “Design guidelines of bearingless PMSM with
+# two separate poly-phase windings,” in 2016 XXII International Conference on
+# Electrical Machines (ICEM), Lausanne, Switzerland, Sep. 2016, pp. 2588–2594.
+# doi: 10.1109/ICELMACH.2016.7732886.
+###############################################################################
+
+import numpy as np
+
+from mach_eval.analyzers.electromagnetic.bfield_spm_inner_rotor import (
+    BFieldSPM_InnerRotor,
+)
+from mach_eval.analyzers.electromagnetic.bfield_outer_stator import (
+    BFieldOuterStator,
+    BFieldOuterStatorAnalyzer,
+    BFieldOuterStatorProblem3,
+)
+from mach_eval.analyzers.electromagnetic.maxwell_stress import MaxwellStressProblem
+from mach_eval.analyzers.electromagnetic.stator_wdg_res import (
+    StatorWindingResistanceProblem,
+    StatorWindingResistanceAnalyzer,
+)
+
+
+class BSPM_MaxwellStressProblem(MaxwellStressProblem):
+    """Maxwell stress problem of a BSPM machine at an operating point
+
+    The rotor field of the arc magnets and the stator field of the DPNV winding
+    are swept over one electrical period of rotor positions. Each coil of group
+    'a' carries the torque current plus the suspension current and each coil of
+    group 'b' the torque current minus the suspension current. The phases of the
+    currents are derived from the MMF of the winding itself: the torque MMF is
+    placed on the rotor d-q axes by Id and Iq, and the suspension MMF is placed
+    such that the force of the p and ps fields points along Ix, Iy [1].
+
+    Attributes:
+        machine: BSPM_Machine object
+        operating_point: BSPM_Machine_Oper_Pt object
+        theta: rotor positions of the sweep [rad]
+        i_t: peak torque current in each coil [A]
+        i_s: peak suspension current in each coil [A]
+        b_fields: rotor and stator BField objects
+        l_st: Stack length [m]
+        r: Radius of integration contour [m], the stator inner bore
+        n_alpha: Number of points of the integration contour
+    """
+
+    def __init__(self, machine, operating_point, n_theta=90, n_alpha=720):
+        self.machine = machine
+        self.operating_point = operating_point
+        p, ps, Q = machine.p, machine.ps, machine.Q
+        self.theta = np.arange(n_theta) * 2 * np.pi / (p * n_theta)
+
+        magnet = machine.magnet_mat
+        r_fe = machine.r_ro - machine.d_m
+        rotor = BFieldSPM_InnerRotor(
+            alpha_p=machine.alpha_m * p / 180,
+            theta=self.theta,
+            p=p,
+            muR=magnet["mu_r"],
+            Br=magnet["B_r"],
+            r_fe=r_fe,
+            dm=machine.d_m,
+            delta=machine.delta_e,
+            mag_dir=magnet["magnetization_direction"].lower(),
+        )
+        # effective airgap, stator bore, rotor iron radius and slot opening
+        geometry = (
+            machine.r_si - r_fe,
+            machine.r_si,
+            r_fe,
+            machine.alpha_so * np.pi / 180,
+        )
+
+        i_hat = np.sqrt(2) * machine.Rated_current
+        op = operating_point
+        i_dq = i_hat * (op.Id - 1j * op.Iq)
+        i_xy = i_hat * (op.Ix + 1j * op.Iy)
+        self.i_t = np.abs(i_dq)
+        self.i_s = np.abs(i_xy)
+        if ps not in (p - 1, p + 1):
+            raise ValueError("Suspension pole pairs ps must equal p + 1 or p - 1")
+
+        layouts = self.winding_layouts(machine)
+        group_a, group_b = layouts
+        # the torque MMF is placed on the d-q axes of the rotor p field
+        rotor_p = rotor.radial_harmonics(harmonics=np.array([p]))[:, 0]
+        i_torque = self.phase_currents(
+            group_a + group_b, p, rotor_p / np.abs(rotor_p) * i_dq
+        )
+
+        # the force of the p field of rotor and torque currents with radial and
+        # tangential harmonics R, T and of the ps field with MMF harmonic M
+        # follows (R + jT) * conj(g * M) for ps = p + 1 and conj(R - jT) * g * M
+        # for ps = p - 1, where g is real
+        torque_field = BFieldOuterStatorAnalyzer().analyze(
+            BFieldOuterStatorProblem3(
+                group_a + group_b, machine.Z_q, i_torque, 0, np.array([p]), *geometry
+            )
+        )
+        R = rotor_p + torque_field.radial_harmonics()[:, 0]
+        T = torque_field.tangential_harmonics()[:, 0]
+        unit_field = BFieldOuterStator(np.ones(1), np.array([ps]), *geometry)
+        g = np.real(
+            unit_field.radial_harmonics()[0]
+            - np.sign(ps - p) * 1j * unit_field.tangential_harmonics()[0]
+        )
+        if ps == p + 1:
+            suspension_mmf = (R + 1j * T) / np.abs(R + 1j * T) * np.conj(i_xy)
+        else:
+            suspension_mmf = (R - 1j * T) / np.abs(R - 1j * T) * i_xy
+        i_suspension = self.phase_currents(
+            group_a - group_b, ps, np.sign(g) * suspension_mmf
+        )
+
+        currents = np.concatenate(
+            (i_torque + i_suspension, i_torque - i_suspension), axis=-1
+        )
+        stator = BFieldOuterStatorAnalyzer().analyze(
+            BFieldOuterStatorProblem3(
+                np.concatenate(layouts),
+                machine.Z_q,
+                currents,
+                0,
+                np.arange(1, 4 * Q + 1),
+                *geometry,
+            )
+        )
+        super().__init__([rotor, stator], machine.l_st, r=None, n_alpha=n_alpha)
+
+    @staticmethod
+    def winding_layouts(machine):
+        """Winding layouts of coil groups 'a' and 'b' of a DPNV winding
+
+        Args:
+            machine: BSPM_Machine object
+        Returns:
+            layouts: numpy array of shape (2, phases, layers, slots) holding the
+              layouts of groups 'a' and 'b' as described in WindingFactorsProblem
+        """
+        phases = np.array(machine.layer_phases)
+        polarity = np.where(np.array(machine.layer_polarity) == "+", 1, -1)
+        # coil groups are assigned to the first layer, the coil returns through
+        # the next layer pitch slots away
+        groups = np.array(
+            [np.roll(machine.coil_groups, machine.pitch * i) for i in range(len(phases))]
+        )
+        names = sorted(set(phases.flatten()))
+        layouts = np.array(
+            [
+                [polarity * (phases == name) * (groups == group) for name in names]
+                for group in ("a", "b")
+            ]
+        )
+        return layouts
+
+    @staticmethod
+    def phase_currents(layouts, n, mmf):
+        """Balanced phase currents producing an n-th harmonic MMF along mmf
+
+        Args:
+            layouts: winding layout of each phase, shape (phases, layers, slots)
+            n: harmonic of the MMF
+            mmf: complex current space vector whose angle is that of the n-th
+              harmonic MMF and whose magnitude is the peak phase current
+        Returns:
+            currents: numpy array of instantaneous phase currents, shape
+              mmf.shape + (phases,)
+        """
+        m = len(layouts)
+        # n-th harmonic MMF of unit current in each phase
+        unit = BFieldOuterStatorProblem3(
+            layouts, 1, np.eye(m), 0, np.array([n]), 1, 1, 0, 0
+        ).MMF[:, 0]
+        sequence = np.exp(-2j * np.pi * np.arange(m) / m)
+        # positive sequence currents give the MMF of forward, negative sequence
+        # currents that of backward rotating phasors
+        forward = unit @ sequence
+        backward = unit @ np.conj(sequence)
+        mmf = np.asarray(mmf)[..., None]
+        if abs(forward) >= abs(backward):
+            phasor = mmf * abs(forward) / forward
+        else:
+            phasor = np.conj(mmf * abs(backward) / backward)
+        return np.real(phasor * sequence)
+
+
+class BSPM_MaxwellStressProblemDefinition:
+    """Converts a State into a BSPM_MaxwellStressProblem"""
+
+    def get_problem(state):
+        problem = BSPM_MaxwellStressProblem(
+            state.design.machine, state.design.settings
+        )
+        return problem
+
+
+class BSPM_MaxwellStressPostAnalyzer:
+    """Packages MaxwellStressAnalyzer results like the BSPM JMAG post analyzer"""
+
+    def get_next_state(results, in_state):
+        state_out = in_state.copy()
+        machine = state_out.design.machine
+        op = state_out.design.settings
+
+        post_processing = {}
+        for key in ("torque_avg", "torque_ripple", "Fx", "Fy", "force_avg", "Em", "Ea"):
+            post_processing[key] = results[key]
+        rotor_weight = (
+            machine.V_rfe * machine.rotor_iron_mat["core_material_density"]
+            + machine.V_sh * machine.shaft_mat["shaft_material_density"]
+            + machine.V_rPM * machine.magnet_mat["magnet_material_density"]
+        )
+        post_processing["FRW"] = results["force_avg"] / rotor_weight
+
+        # every coil carries the torque current and the suspension current
+        resistance = StatorWindingResistanceAnalyzer().analyze(
+            StatorWindingResistanceProblem(
+                r_si=machine.r_si,
+                d_sp=machine.d_sp,
+                d_st=machine.d_st,
+                w_st=machine.w_st,
+                l_st=machine.l_st,
+                Q=machine.Q,
+                y=machine.pitch,
+                z_Q=machine.Z_q,
+                z_C=1,
+                Kcu=machine.Kcu,
+                Kov=machine.Kov,
+                sigma_cond=machine.coil_mat["copper_elec_conductivity"],
+                slot_area=machine.s_slot,
+                n_layers=machine.no_of_layers,
+            )
+        )
+        n_coils = machine.Q * machine.no_of_layers / 2
+        coil_trms = np.hypot(op.Id, op.Iq) * machine.Rated_current
+        coil_srms = np.hypot(op.Ix, op.Iy) * machine.Rated_current
+        post_processing["copper_loss"] = (
+            n_coils * (coil_trms**2 + coil_srms**2) * resistance["R_coil"]
+        )
+
+        state_out.conditions.em = post_processing
+        state_out.conditions.Q_coil = post_processing["copper_loss"] / machine.Q
+        return state_out
@@ -0,0 +1,112 @@
+########################### source of equations ###############################
+# [1] G. Bergmann and A. Binder, “Design guidelines of bearingless PMSM with
+# two separate poly-phase windings,” in 2016 XXII International Conference on
+# Electrical Machines (ICEM), Lausanne, Switzerland, Sep. 2016, pp. 2588–2594.
+# doi: 10.1109/ICELMACH.2016.7732886.
+###############################################################################
+
+import numpy as np
+
+from mach_eval.analyzers.torque_data import (
+    ProcessTorqueDataProblem,
+    ProcessTorqueDataAnalyzer,
+)
+from mach_eval.analyzers.force_vector_data import (
+    ProcessForceDataProblem,
+    ProcessForceDataAnalyzer,
+)
+
+
+class MaxwellStressProblem:
+    """Problem class for Maxwell stress tensor torque and force analyzer
+    Attributes:
+        b_fields: list of BField objects whose airgap fields are superimposed.
+          Rotor positions or time steps are swept by the leading dimension of
+          each field, e.g. an array of rotor orientations theta for
+          BFieldSPM_InnerRotor and MMF rows for BFieldOuterStator.
+        l_st: Stack length [m]
+        r: Radius of integration contour [m], defaults to the stator inner bore.
+          Stator fields such as BFieldOuterStator only know their tangential
+          field at the stator inner bore, so r must not differ from it when
+          they are present.
+        n_alpha: Number of points of the integration contour
+    """
+
+    def __init__(self, b_fields, l_st, r=None, n_alpha=720):
+        self.b_fields = b_fields
+        self.l_st = l_st
+        self.r = r
+        self.n_alpha = n_alpha
+
+
+class MaxwellStressAnalyzer:
+    """Analyzer class to evaluate torque and forces from airgap B fields"""
+
+    def analyze(self, problem: MaxwellStressProblem):
+        """Determines torque and x, y force waveforms using the Maxwell stress tensor
+
+        Args:
+            problem: object of type MaxwellStressProblem
+        Returns:
+            results: dictionary of torque and force waveforms over the sweep,
+              along with the post processed values of ProcessTorqueDataAnalyzer
+              and ProcessForceDataAnalyzer
+        """
+        r = problem.r
+        if r is None:
+            r = self.__stator_bore(problem.b_fields)
+        for field in problem.b_fields:
+            # stator fields give their tangential field at r_si regardless of r
+            if hasattr(field, "r_si") and not np.isclose(r, field.r_si):
+                raise ValueError(
+                    "Integration contour must lie at the stator inner bore r_si "
+                    "when stator fields are present"
+                )
+
+        mu0 = 4 * np.pi * 10**-7
+        alpha = np.arange(problem.n_alpha) * 2 * np.pi / problem.n_alpha
+        b_radial = sum(field.radial(alpha, r=problem.r) for field in problem.b_fields)
+        b_tan = sum(
+            field.tan(alpha, r=None if hasattr(field, "r_si") else problem.r)
+            for field in problem.b_fields
+        )
+
+        # integrals over the contour of the uniform angle grid
+        def integral(f):
+            return np.mean(f, axis=-1) * 2 * np.pi
+
+        cos, sin = np.cos(alpha), np.sin(alpha)
+        normal = (b_radial**2 - b_tan**2) / (2 * mu0)
+        shear = b_radial * b_tan / mu0
+        torque = problem.l_st * r**2 * integral(shear)
+        Fx = problem.l_st * r * integral(normal * cos - shear * sin)
+        Fy = problem.l_st * r * integral(normal * sin + shear * cos)
+
+        torque_avg, torque_ripple = ProcessTorqueDataAnalyzer().analyze(
+            ProcessTorqueDataProblem(np.atleast_1d(torque))
+        )
+        Fx_avg, Fy_avg, force_avg, Em, Ea = ProcessForceDataAnalyzer().analyze(
+            ProcessForceDataProblem(np.atleast_1d(Fx), np.atleast_1d(Fy))
+        )
+
+        results = {
+            "torque": torque,
+            "force_x": Fx,
+            "force_y": Fy,
+            "torque_avg": torque_avg,
+            "torque_ripple": torque_ripple,
+            "Fx": Fx_avg,
+            "Fy": Fy_avg,
+            "force_avg": force_avg,
+            "Em": Em,
+            "Ea": Ea,
+        }
+        return results
+
+    def __stator_bore(self, b_fields):
+        """Stator inner bore radius at which fields are evaluated by default"""
+        for field in b_fields:
+            for attr in ("r_si", "Rsi"):
+                if hasattr(field, attr):
+                    return getattr(field, attr)
+        raise ValueError("Radius of integration contour could not be determined")
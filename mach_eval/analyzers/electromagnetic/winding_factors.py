@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 
 class WindingFactorsProblem:
     """Problem class for winding factor analyzer
@@ -19,7 +20,23 @@ class WindingFactorsProblem:
         self.alpha_1 = alpha_1
         
         
-            
+
+class WindingFactorsBatchProblem:
+    """Problem class for evaluating winding factors of many winding layouts
+    Attributes:
+        harmonics_list: list of harmonics to be included in calculations []
+        winding_layouts: array of winding layouts with shape (layouts, layers,
+                        teeth), each layout as described in WindingFactorsProblem
+        alpha_1: angle of first slot counterclockwise from +x axis [rad]
+    """
+
+    def __init__(self, harmonics_list, winding_layouts, alpha_1):
+
+        self.harmonics_list = harmonics_list
+        self.winding_layouts = winding_layouts
+        self.alpha_1 = alpha_1
+
+
 class WindingFactorsAnalyzer:
     """Analyzer class to evaluate winding factors"""
     
@@ -44,39 +61,74 @@ class WindingFactorsAnalyzer:
     
     
     
+    def analyze_batch(self, problem="WindingFactorsBatchProblem"):
+        """Determines winding factors of many winding layouts at once
+        
+        Args:
+            Problem class contains all args used in analyze_batch function
+            
+        Returns:
+            kw_final: complex winding factor array, shape (layouts, harmonics)
+        """
+        
+        return self.batch_calculations(
+            problem.harmonics_list, problem.winding_layouts, problem.alpha_1)
+    
+    
+    
     def calculations(self,harmonics_list,winding_layout,alpha_1):
         """Determines winding factors given harmonics requested, winding
             layout, and alpha_1
             
         Variables:
-            n: 1D array from 1-harmonics used in iterations
-            layer: layout of layer for single layer winding
-            top_layer: layout of top layer for double layer winding
-            bottom_layer: layout of bottom layer for double layer winding
-            alpha_c: angle between stator teeth
-            filled_slots: number of slots filled in total layout
-            slot: slot at which each term is calculated
+            layers: number of layers in winding layout
             
         Returns:
             k_w: winding factor array for each winding layout
         """        
         
-        if len(winding_layout[:,0]) == 1:
-            layer = winding_layout[0][:,None]
-            alpha_c = 2*np.pi/len(layer)
-            coil_sides = np.count_nonzero(layer)
-            slot = np.arange(1,len(layer)+1)[:,None]
-            k_w = layer*np.exp(-1j*harmonics_list*((slot-1)*alpha_c+alpha_1))
-        elif len(winding_layout[:,0]) == 2:
-            top_layer = winding_layout[0][:,None]
-            bottom_layer = winding_layout[1][:,None]
-            alpha_c = 2*np.pi/len(top_layer)
-            coil_sides = np.count_nonzero(top_layer) + np.count_nonzero(bottom_layer)
-            slot = np.arange(1,len(top_layer)+1)[:,None]
-            k_w = top_layer*np.exp(-1j*harmonics_list*((slot-1)*alpha_c+alpha_1))+bottom_layer*np.exp(-1j*harmonics_list*((slot-1)*alpha_c+alpha_1))
-        else:
+        winding_layout = np.asarray(winding_layout)
+        layers = len(winding_layout[:,0])
+        if layers != 1 and layers != 2:
             raise Exception("Error: Winding layer must be 1 or 2!")
+        
+        k_w = self.batch_calculations(harmonics_list, winding_layout[None], alpha_1)
+        
+        return k_w[0]
+    
+    
+    
+    def batch_calculations(self, harmonics_list, winding_layouts, alpha_1):
+        """Determines winding factors for a stack of winding layouts with any
+            number of layers
             
-        k_w = sum(k_w)/coil_sides
+        Variables:
+            conductors: conductors in each slot summed over all layers
+            coil_sides: number of coil sides in each layout
+            slot_exp: complex exponential of each slot and harmonic
+            
+        Returns:
+            k_w: winding factor array, shape (layouts, harmonics)
+        """
         
-        return k_w
\ No newline at end of file
+        winding_layouts = np.asarray(winding_layouts)
+        harmonics = np.atleast_1d(harmonics_list)
+        Q = winding_layouts.shape[-1]
+        
+        # conductors of all layers in a slot share the slot angle
+        conductors = winding_layouts.sum(axis=1)
+        coil_sides = np.count_nonzero(winding_layouts, axis=(1, 2))
+        slot_exp = _slot_exponentials(Q, tuple(harmonics.tolist()), alpha_1)
+        k_w = (conductors @ slot_exp) / coil_sides[:, None]
+        
+        return k_w
+
+
+@lru_cache(maxsize=128)
+def _slot_exponentials(Q, harmonics, alpha_1):
+    """Complex exponential table of shape (Q, harmonics) for a slot count"""
+    alpha_c = 2*np.pi/Q
+    slot = np.arange(1,Q+1)[:,None]
+    slot_exp = np.exp(-1j*np.array(harmonics)*((slot-1)*alpha_c+alpha_1))
+    slot_exp.flags.writeable = False
+    return slot_exp
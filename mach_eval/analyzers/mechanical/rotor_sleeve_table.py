@@ -0,0 +1,180 @@
+import numpy as np
+import pickle
+import sys
+import os
+from scipy.interpolate import RegularGridInterpolator
+
+sys.path.append(os.path.dirname(__file__))
+
+from rotor_structural import SPM_RotorSleeveProblem, SPM_RotorSleeveAnalyzer
+
+
+class SPM_RotorSleeveTable:
+    """Lookup table of sleeve designs over a grid of rotor dimensions and speeds.
+
+    Sleeve designs are computed with SPM_RotorSleeveAnalyzer for every grid point
+    of a fixed temperature rise, material dictionary and set of stress limits.
+    Grid points without a feasible sleeve, or with r_ro <= r_sh + d_m, are
+    stored as NaN.
+
+    Attributes:
+        r_sh (np.ndarray): Shaft radius grid [m].
+        d_m (np.ndarray): Magnet thickness grid [m].
+        r_ro (np.ndarray): Outer rotor radius grid [m].
+        N (np.ndarray): Rotational speed grid [RPM].
+        deltaT (float): Temperature rise [K].
+        mat_dict (dict): Material dictionary.
+        stress_limits (dict): Limits for critical stresses.
+        d_sl (np.ndarray): Sleeve thickness at each grid point [m].
+        delta_sl (np.ndarray): Sleeve undersize at each grid point [m].
+    """
+
+    def __init__(
+        self,
+        r_sh: "np.ndarray",
+        d_m: "np.ndarray",
+        r_ro: "np.ndarray",
+        N: "np.ndarray",
+        deltaT: float,
+        mat_dict: dict,
+        stress_limits: dict,
+    ):
+        self.r_sh = np.sort(np.asarray(r_sh, dtype=float))
+        self.d_m = np.sort(np.asarray(d_m, dtype=float))
+        self.r_ro = np.sort(np.asarray(r_ro, dtype=float))
+        self.N = np.sort(np.asarray(N, dtype=float))
+        self.deltaT = deltaT
+        self.mat_dict = mat_dict
+        self.stress_limits = stress_limits
+        self.d_sl = None
+        self.delta_sl = None
+
+    @property
+    def grid(self):
+        return (self.r_sh, self.d_m, self.r_ro, self.N)
+
+    def build(self, analyzer: "SPM_RotorSleeveAnalyzer" = None):
+        """Designs the sleeve at every grid point
+
+        Args:
+            analyzer (SPM_RotorSleeveAnalyzer): Sleeve analyzer, defaults to the
+                "bracket" method with the stress limits of the table.
+
+        Returns:
+            table (SPM_RotorSleeveTable): the table itself
+        """
+        if analyzer is None:
+            analyzer = SPM_RotorSleeveAnalyzer(self.stress_limits, method="bracket")
+
+        shape = tuple(len(axis) for axis in self.grid)
+        self.d_sl = np.full(shape, np.nan)
+        self.delta_sl = np.full(shape, np.nan)
+        for idx in np.ndindex(*shape):
+            r_sh, d_m, r_ro, N = (axis[i] for axis, i in zip(self.grid, idx))
+            if r_ro <= r_sh + d_m:
+                continue
+            problem = SPM_RotorSleeveProblem(
+                r_sh, d_m, r_ro, self.deltaT, self.mat_dict, N
+            )
+            sol = analyzer.analyze(problem)
+            if sol is not False:
+                self.d_sl[idx], self.delta_sl[idx] = sol[0], sol[1]
+        return self
+
+    def save(self, filepath: str):
+        """Saves the table to disk
+
+        Args:
+            filepath (str): path of the table file
+        """
+        with open(filepath, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(filepath: str) -> "SPM_RotorSleeveTable":
+        """Loads a table from disk
+
+        Args:
+            filepath (str): path of the table file
+
+        Returns:
+            table (SPM_RotorSleeveTable): the stored table
+        """
+        with open(filepath, "rb") as f:
+            return pickle.load(f)
+
+
+class SPM_RotorSleeveTableAnalyzer:
+    """Analyzer for designing a rotor sleeve from a lookup table.
+
+    Sleeve designs are linearly interpolated between grid points of the table.
+    The exact analyzer is used instead when the problem lies outside the grid,
+    when any grid point of the surrounding cell has no feasible sleeve, or when
+    the temperature rise or materials differ from those of the table. Materials
+    are compared by their numeric properties only, so material names and file
+    paths do not matter.
+
+    Attributes:
+        table (SPM_RotorSleeveTable): Precomputed sleeve designs.
+        exact_analyzer (SPM_RotorSleeveAnalyzer): Fallback sleeve analyzer.
+    """
+
+    def __init__(
+        self,
+        table: "SPM_RotorSleeveTable",
+        exact_analyzer: "SPM_RotorSleeveAnalyzer" = None,
+    ):
+        if table.d_sl is None:
+            raise ValueError("Sleeve table has not been built")
+        if exact_analyzer is None:
+            exact_analyzer = SPM_RotorSleeveAnalyzer(
+                table.stress_limits, method="bracket"
+            )
+        self.table = table
+        self.exact_analyzer = exact_analyzer
+        self._mat_key = _material_key(table.mat_dict)
+        self._interp = RegularGridInterpolator(
+            table.grid,
+            np.stack((table.d_sl, table.delta_sl), axis=-1),
+            bounds_error=False,
+            fill_value=np.nan,
+        )
+
+    def analyze(self, problem: "SPM_RotorSleeveProblem"):
+        """analyzes input problem to design optimal rotor sleeve
+
+        Args:
+            problem (SPM_RotorSleeveProblem): input problem
+
+        Returns:
+            sol: array of sleeve thickness and undersize, False if infeasible
+        """
+        if (
+            problem.deltaT != self.table.deltaT
+            or _material_key(problem.mat_dict) != self._mat_key
+        ):
+            return self.exact_analyzer.analyze(problem)
+
+        # cells with an infeasible corner or outside the grid interpolate to NaN
+        x = [problem.r_sh, problem.d_m, problem.r_ro, problem.N]
+        sol = self._interp(x)[0]
+        if np.isnan(sol).any():
+            return self.exact_analyzer.analyze(problem)
+        return sol
+
+
+def _material_key(mat_dict: dict) -> tuple:
+    """Hashable key of the numeric material properties of a material dictionary
+
+    Values are compared by their bytes, so equal floats, numpy scalars and
+    single element arrays give the same key, as do NaN values after a pickle
+    round trip.
+    """
+    key = []
+    for name in sorted(mat_dict):
+        value = np.squeeze(mat_dict[name])
+        if value.dtype.kind in "biuf":
+            # adding 0.0 maps -0.0 to 0.0
+            value = value.astype(float) + 0.0
+            key.append((name, value.shape, value.tobytes()))
+    return tuple(key)
@@ -48,21 +48,38 @@ class SPM_RotorSpeedLimitProblem:
 
 
 class SPM_RotorSpeedLimitAnalyzer:
+    # Material Array
+    # ( Must follow this specific order )
+    materials = np.array(
+        ["Shaft",
+        "Core",
+        "Magnet",
+        "Sleeve",
+        "Adhesive"])
+
     def __init__(
             self, 
             N_step: float,
-            node: int
+            node: int,
+            method: str = "sweep"
             ) -> "SPM_RotorSpeedLimitAnalyzer":
         
         """Analyzer Class for SPM_RotorSpeedLimitProblem
         
         Args:
-            N_step (float): RPM evaluation step size [RPM].
+            N_step (float): RPM evaluation step size [RPM]. Only used by the
+                "sweep" method.
             node (int): number of nodes to evaluate 
+            method (str): "sweep" checks speeds in steps of N_step. "exact"
+                solves for the failure speed of each material directly, using
+                that the stresses are affine in the squared speed.
         """
-        
+        if method not in ("sweep", "exact"):
+            raise ValueError("Unknown speed limit method: %s" % method)
+
         self.N_step = N_step
         self.node = node
+        self.method = method
 
 
     def analyze(self, problem: "SPM_RotorSpeedLimitProblem"):
@@ -125,6 +142,9 @@ class SPM_RotorSpeedLimitAnalyzer:
             r_vect_sl,
             r_vect_ah], dtype=object)
 
+        if self.method == "exact":
+            return self.exact_limit()
+
         # Create speed array
         N = np.arange(0,self.N_max,self.N_step) 
 
@@ -145,26 +165,96 @@ class SPM_RotorSpeedLimitAnalyzer:
             # failure material and speed
             return SPM_RotorSpeedLimitResults(failure_mat, speed)
         
-    def check_if_fail(self, speed):
-        """ Check if rotor material failure occured for a given rotational speed
+    def exact_limit(self):
+        """ Determine the rotational speed at which the first material fails
+
+        The stresses are affine in the squared rotational speed s, so each
+        stress is written as sigma(s) = sigma_0 + s*sigma_1 using two
+        structural solves. The failure criteria are then solved for the
+        smallest s at each radial node.
+
+        Returns:
+            results (SPM_RotorSpeedLimitResults): SPM_RotorSpeedLimitResults
+        """
+        N_ref = self.N_max if self.N_max > 0 else 1
+        omega_ref = N_ref * 2 * np.pi / 60
+        stress_0 = self.material_stresses(0)
+        stress_ref = self.material_stresses(N_ref)
+
+        s_fail = np.full(len(self.materials), np.inf)
+        for idx, mat in enumerate(self.materials):
+            if stress_0[idx] is None:
+                continue
+
+            sigma_t0, sigma_r0 = stress_0[idx]
+            sigma_t1 = (stress_ref[idx][0] - sigma_t0) / omega_ref**2
+            sigma_r1 = (stress_ref[idx][1] - sigma_r0) / omega_ref**2
+
+            if mat in ["Shaft", "Core"]:
+                # Use Von Mises Stress for ductile materials
+                s = self.von_mises_limit(
+                    sigma_t0, sigma_r0, sigma_t1, sigma_r1, self.mat_fail_cond[idx])
+            else:
+                # Use MSST Stress for brittle materials, the difference of
+                # any two principal stresses may govern
+                s = np.minimum.reduce([
+                    self.linear_limit(
+                        sigma_t0 - sigma_r0, sigma_t1 - sigma_r1, self.mat_fail_cond[idx]),
+                    self.linear_limit(sigma_t0, sigma_t1, self.mat_fail_cond[idx]),
+                    self.linear_limit(sigma_r0, sigma_r1, self.mat_fail_cond[idx])])
+            s_fail[idx] = np.min(s)
+
+        # np.argmin returns the first material in order for equal speeds
+        idx = np.argmin(s_fail)
+        speed = np.sqrt(s_fail[idx]) * 60 / (2 * np.pi)
+        if speed >= self.N_max:
+            return SPM_RotorSpeedLimitResults(None, None)
+        return SPM_RotorSpeedLimitResults(self.materials[idx], speed)
+
+    @staticmethod
+    def linear_limit(sigma_0, sigma_1, limit):
+        """ Smallest squared speed s >= 0 where |sigma_0 + s*sigma_1| >= limit
+
+        Returns:
+            s (np.array): squared speed for each node, inf if never reached
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = (limit - np.sign(sigma_1) * sigma_0) / np.abs(sigma_1)
+        s = np.where(sigma_1 != 0, s, np.inf)
+        return np.where(np.abs(sigma_0) >= limit, 0, s)
+
+    @staticmethod
+    def von_mises_limit(sigma_t0, sigma_r0, sigma_t1, sigma_r1, limit):
+        """ Smallest squared speed s >= 0 where the Von Mises stress >= limit
+
+        Returns:
+            s (np.array): squared speed for each node, inf if never reached
+        """
+        # sigma_e**2 = sigma_t**2 + sigma_r**2 - sigma_t*sigma_r is quadratic in s
+        a = sigma_t1**2 + sigma_r1**2 - sigma_t1 * sigma_r1
+        b = 2 * sigma_t0 * sigma_t1 + 2 * sigma_r0 * sigma_r1 \
+            - sigma_t0 * sigma_r1 - sigma_r0 * sigma_t1
+        c = sigma_t0**2 + sigma_r0**2 - sigma_t0 * sigma_r0 - limit**2
+
+        # c < 0 and a > 0 leaves exactly one positive root
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sqrt_disc = np.sqrt(b**2 - 4 * a * c)
+            s = np.where(
+                b >= 0, -2 * c / (b + sqrt_disc), (sqrt_disc - b) / (2 * a))
+        s = np.where(a > 0, s, np.inf)
+        return np.where((c >= 0) | (limit <= 0), 0, s)
+
+    def material_stresses(self, speed):
+        """ Determine stresses in all rotor materials for a given rotational speed
 
         Args:
             speed (float): rotational speed of rotor 
 
         Returns:
-            results (tuple): Tuple(True, failure_mat) 
-            results (tuple): Tuple(False, None)
+            stresses (list): Tuple(sigma_t, sigma_r) for each material, None 
+                if the material is not present
         """
 
-        # Material Array
-        # ( Must follow this specific order )
-        materials = np.array(
-            ["Shaft",
-            "Core",
-            "Magnet",
-            "Sleeve",
-            "Adhesive"])
-        
         # Create rotor structral problem
         st_problem = SPM_RotorStructuralProblem(
             self.r_sh, 
@@ -182,51 +272,72 @@ class SPM_RotorSpeedLimitAnalyzer:
         # Analyze rotor structual problem
         st_sigmas = st_analyzer.analyze(st_problem)
 
+        stresses = []
+        for idx, mat in enumerate(self.materials):
+            # Skip the sleeve calculation if not present
+            if mat == "Sleeve" and self.r_vect[idx].size == 0:
+                stresses.append(None)
+                continue
+
+            # Adhesive stresses are taken from the core
+            # (assumed to be at the interface between core and magnet with zero thickness)
+            # (self.r_vect[4] is the radial location of the adhesive)
+            if mat == "Adhesive":
+                sigma = st_sigmas[np.where(self.materials == "Core")[0][0]]
+            else:
+                sigma = st_sigmas[idx]
+
+            # Determine tangential and radial stress
+            stresses.append((
+                sigma.tangential(self.r_vect[idx]),
+                sigma.radial(self.r_vect[idx])))
+
+        return stresses
+
+    def check_if_fail(self, speed):
+        """ Check if rotor material failure occured for a given rotational speed
+
+        Args:
+            speed (float): rotational speed of rotor 
+
+        Returns:
+            results (tuple): Tuple(True, failure_mat) 
+            results (tuple): Tuple(False, None)
+        """
+
+        materials = self.materials
+        stresses = self.material_stresses(speed)
+        ss_analyzer = SteadyStateStressAnalyzer()
+
         sigma_max = np.zeros(len(materials))
         failure_mat = None
 
         # Determine maxmium Von Mises Stress for all rotor materials
         for idx,mat in enumerate(materials):
-            # Skip the adhesive since it has a special case
-            if mat == "Adhesive":
-                continue
-
             # Skip the sleeve calculation if not present
-            if mat == "Sleeve" and self.r_vect[idx].size == 0:
+            if stresses[idx] is None:
                 continue
-            
-            # Determine tangential and radial stress
-            sigma_t = st_sigmas[idx].tangential(self.r_vect[idx])
-            sigma_r = st_sigmas[idx].radial(self.r_vect[idx])
+
+            sigma_t, sigma_r = stresses[idx]
             
             # Create static stress problem 
             ss_problem = SteadyStateStressProblem(sigma_t,sigma_r)
 
             # Analyze static stress problem
-            ss_analyzer = SteadyStateStressAnalyzer()
             ss_stress = ss_analyzer.analyze(ss_problem)
 
             if mat in ["Shaft", "Core"]:
                 # Use Von Mises Stress for ductile materials
                 # [0] index provides Von Mises Stress
                 sigma_max[idx] = np.max(ss_stress[0])
+            elif mat == "Adhesive":
+                # Determine adhesive MSST Stress
+                sigma_max[idx] = np.min(ss_stress[1])
             else:
                 # Use MSST Stress for brittle material
                 # [1] index provides MSST Stress (yield)
                 sigma_max[idx] = np.max(ss_stress[1])
 
-        # Determine adhesive MSST Stress
-        # (assumed to be at the interface between core and magnet with zero thickness)
-        # (self.r_vect[4] is the radial location of the adhesive)
-        core_idx = np.where(materials == "Core")[0][0]
-
-        ss_problem = SteadyStateStressProblem(
-            st_sigmas[core_idx].tangential(self.r_vect[4]),
-            st_sigmas[core_idx].radial(self.r_vect[4]))
-        
-        ss_stress = ss_analyzer.analyze(ss_problem)
-        sigma_max[-1] = np.min(ss_stress[1])
-
         # Determine percenatge to failure for all materials
         pct_to_fail = sigma_max/self.mat_fail_cond
 
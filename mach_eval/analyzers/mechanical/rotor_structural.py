@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 import scipy.optimize as op
 from typing import Tuple, List
@@ -169,7 +171,7 @@ class SPM_RotorStructuralAnalyzer:
             omega (float): rotational speed in rad/s.
 
         Returns:
-            A (np.Array): numpy array of stress coeffiecents.
+            A (np.Array): numpy array of stress coeffiecents, shape (..., 7, 1).
         """
 
         r1 = sh.R_o
@@ -179,14 +181,16 @@ class SPM_RotorStructuralAnalyzer:
         delta_1 = 0
         delta_2 = 0
         delta_3 = sl.Dr
-        K = np.zeros([7, 7])
-        X = np.zeros([7, 1])
+        # leading dimensions hold a batch of rotors, see SPM_RotorStructuralBatchProblem
+        shape = np.broadcast(r1, r2, r3, r4, delta_3, deltaT, omega).shape
+        K = np.zeros(shape + (7, 7))
+        X = np.zeros(shape + (7, 1))
 
         # Stress at interface between shaft and rotor core
-        K[0, 0] = (sh.C1 * sh.h + sh.C2) * (r1 ** (sh.h - 1))
-        K[0, 1] = -(rc.C1 * rc.h + rc.C2) * (r1 ** (rc.h - 1))
-        K[0, 2] = -(rc.C2 - rc.C1 * rc.h) * (r1 ** (-rc.h - 1))
-        X[0] = (
+        K[..., 0, 0] = (sh.C1 * sh.h + sh.C2) * (r1 ** (sh.h - 1))
+        K[..., 0, 1] = -(rc.C1 * rc.h + rc.C2) * (r1 ** (rc.h - 1))
+        K[..., 0, 2] = -(rc.C2 - rc.C1 * rc.h) * (r1 ** (-rc.h - 1))
+        X[..., 0, 0] = (
             (3 * rc.C1 + rc.C2) * rc.Beta * (omega ** 2) * (r1 ** 2)
             + rc.zeta_r * deltaT
             - ((3 * sh.C1 + sh.C2) * sh.Beta * (omega ** 2) * (r1 ** 2))
@@ -194,11 +198,11 @@ class SPM_RotorStructuralAnalyzer:
         )
 
         # Stress at interface between rotor core and magnet array
-        K[1, 1] = (rc.C1 * rc.h + rc.C2) * (r2 ** (rc.h - 1))
-        K[1, 2] = (rc.C2 - rc.C1 * rc.h) * (r2 ** (-rc.h - 1))
-        K[1, 3] = -(pm.C1 * pm.h + pm.C2) * (r2 ** (pm.h - 1))
-        K[1, 4] = -(pm.C2 - pm.C1 * pm.h) * (r2 ** (-pm.h - 1))
-        X[1] = (
+        K[..., 1, 1] = (rc.C1 * rc.h + rc.C2) * (r2 ** (rc.h - 1))
+        K[..., 1, 2] = (rc.C2 - rc.C1 * rc.h) * (r2 ** (-rc.h - 1))
+        K[..., 1, 3] = -(pm.C1 * pm.h + pm.C2) * (r2 ** (pm.h - 1))
+        K[..., 1, 4] = -(pm.C2 - pm.C1 * pm.h) * (r2 ** (-pm.h - 1))
+        X[..., 1, 0] = (
             (3 * pm.C1 + pm.C2) * pm.Beta * (omega ** 2) * (r2 ** 2)
             + pm.zeta_r * deltaT
             - ((3 * rc.C1 + rc.C2) * rc.Beta * (omega ** 2) * (r2 ** 2))
@@ -206,11 +210,11 @@ class SPM_RotorStructuralAnalyzer:
         )
 
         # Stress at interface between magnet array and rotor sleeve
-        K[2, 3] = (pm.C1 * pm.h + pm.C2) * (r3 ** (pm.h - 1))
-        K[2, 4] = (pm.C2 - pm.C1 * pm.h) * (r3 ** (-pm.h - 1))
-        K[2, 5] = -(sl.C1 * sl.h + sl.C2) * (r3 ** (sl.h - 1))
-        K[2, 6] = -(sl.C2 - sl.C1 * sl.h) * (r3 ** (-sl.h - 1))
-        X[2] = (
+        K[..., 2, 3] = (pm.C1 * pm.h + pm.C2) * (r3 ** (pm.h - 1))
+        K[..., 2, 4] = (pm.C2 - pm.C1 * pm.h) * (r3 ** (-pm.h - 1))
+        K[..., 2, 5] = -(sl.C1 * sl.h + sl.C2) * (r3 ** (sl.h - 1))
+        K[..., 2, 6] = -(sl.C2 - sl.C1 * sl.h) * (r3 ** (-sl.h - 1))
+        X[..., 2, 0] = (
             (3 * sl.C1 + sl.C2) * sl.Beta * (omega ** 2) * (r3 ** 2)
             + sl.zeta_r * deltaT
             - ((3 * pm.C1 + pm.C2) * pm.Beta * (omega ** 2) * (r3 ** 2))
@@ -218,43 +222,43 @@ class SPM_RotorStructuralAnalyzer:
         )
 
         # Stress at Outside of rotor sleeve
-        K[3, 5] = (sl.C1 * sl.h + sl.C2) * (r4 ** (sl.h - 1))
-        K[3, 6] = (sl.C2 - sl.C1 * sl.h) * (r4 ** (-sl.h - 1))
-        X[3] = (
+        K[..., 3, 5] = (sl.C1 * sl.h + sl.C2) * (r4 ** (sl.h - 1))
+        K[..., 3, 6] = (sl.C2 - sl.C1 * sl.h) * (r4 ** (-sl.h - 1))
+        X[..., 3, 0] = (
             -((3 * sl.C1 + sl.C2) * sl.Beta * (omega ** 2) * (r4 ** 2))
             - sl.zeta_r * deltaT
         )
 
         # Displacement at interface between shaft and rotor core
-        K[4, 0] = r1 ** sh.h
-        K[4, 1] = -(r1 ** rc.h)
-        K[4, 2] = -(r1 ** -rc.h)
-        X[4] = (
+        K[..., 4, 0] = r1 ** sh.h
+        K[..., 4, 1] = -(r1 ** rc.h)
+        K[..., 4, 2] = -(r1 ** -rc.h)
+        X[..., 4, 0] = (
             delta_1
             + rc.Beta * (omega ** 2) * (r1 ** 3)
             - (sh.Beta * (omega ** 2) * (r1 ** 3))
         )
 
         # Displacement at interface between rotor core and Magnets
-        K[5, 1] = r2 ** rc.h
-        K[5, 2] = r2 ** -rc.h
-        K[5, 3] = -(r2 ** pm.h)
-        K[5, 4] = -(r2 ** -pm.h)
-        X[5] = delta_2 + pm.Beta * (r2 ** 3) - (rc.Beta * (r2 ** 3))
+        K[..., 5, 1] = r2 ** rc.h
+        K[..., 5, 2] = r2 ** -rc.h
+        K[..., 5, 3] = -(r2 ** pm.h)
+        K[..., 5, 4] = -(r2 ** -pm.h)
+        X[..., 5, 0] = delta_2 + pm.Beta * (r2 ** 3) - (rc.Beta * (r2 ** 3))
 
         # Displacement at interface between Magnets and Sleeve
-        K[6, 3] = r3 ** pm.h
-        K[6, 4] = r3 ** -pm.h
-        K[6, 5] = -(r3 ** sl.h)
-        K[6, 6] = -(r3 ** -sl.h)
-        X[6] = (
+        K[..., 6, 3] = r3 ** pm.h
+        K[..., 6, 4] = r3 ** -pm.h
+        K[..., 6, 5] = -(r3 ** sl.h)
+        K[..., 6, 6] = -(r3 ** -sl.h)
+        X[..., 6, 0] = (
             delta_3
             + sl.Beta * (r3 ** 3)
             + sl.zeta_u * deltaT * r3
             - (pm.Beta * (omega ** 2) * (r3 ** 3))
         )
 
-        A = np.dot(np.linalg.inv(K), X)
+        A = np.linalg.solve(K, X)
         return A
 
 
@@ -552,6 +556,157 @@ class Sigma:
         return sigma_t
 
 
+class SPM_RotorStructuralBatchProblem(SPM_RotorStructuralProblem):
+    """Problem class for SPM_RotorStructuralBatchAnalyzer.
+
+    Holds M rotors at once. All dimensions, operating points and numeric
+    material dictionary values are broadcast against each other and flattened
+    to arrays of length M. Other values, e.g. material names, are kept as is.
+
+    Attributes:
+        M (int): Number of rotors.
+        sh (RotorComponent): Shaft RotorComponent object.
+        rc (RotorComponent): Rotor core RotorComponent object.
+        pm (RotorComponent): Magnets RotorComponent object.
+        sl (RotorComponent): Sleeve RotorComponent object.
+        deltaT (np.ndarray): Temperature rise in deg C.
+        omega (np.ndarray): rotational speed in rad/s.
+    """
+
+    def __init__(
+        self,
+        r_sh: "np.ndarray",
+        d_m: "np.ndarray",
+        r_ro: "np.ndarray",
+        d_sl: "np.ndarray",
+        delta_sl: "np.ndarray",
+        deltaT: "np.ndarray",
+        N: "np.ndarray",
+        mat_dict: dict,
+    ) -> "SPM_RotorStructuralBatchProblem":
+        """Creates SPM_RotorStructuralBatchProblem object from input
+
+        Args:
+            r_sh (np.ndarray): Shaft outer radius [m].
+            d_m (np.ndarray): Magnet Thickness [m].
+            r_ro (np.ndarray): Outer Rotor Radius [m].
+            d_sl (np.ndarray): Sleeve Thickness [m].
+            delta_sl (np.ndarray): Sleeve Undersize [m].
+            deltaT (np.ndarray): Temperature Rise [K].
+            N (np.ndarray): Rotor Speed [RPM].
+            mat_dict (dict): Material Dictionary, numeric values may be arrays.
+
+        Returns:
+            problem (SPM_RotorStructuralBatchProblem): SPM_RotorStructuralBatchProblem
+        """
+        # only numeric properties are broadcast, names such as
+        # 'core_material' are passed through unchanged
+        keys = [k for k, v in mat_dict.items() if _is_numeric(v)]
+        arrays = np.broadcast_arrays(
+            *[np.asarray(v, dtype=float) for v in
+              [r_sh, d_m, r_ro, d_sl, delta_sl, deltaT, N]
+              + [mat_dict[k] for k in keys]]
+        )
+        arrays = [np.ravel(a) for a in arrays]
+        self.M = len(arrays[0])
+        mat_dict = dict(mat_dict)
+        mat_dict.update(zip(keys, arrays[7:]))
+        super().__init__(*arrays[:7], mat_dict)
+
+
+def _is_numeric(value) -> bool:
+    """True if value is a number or an array of numbers"""
+    return np.asarray(value).dtype.kind in "biuf"
+
+
+class SPM_RotorStructuralBatchAnalyzer:
+    """Analyzer for a batch of SPM rotors.
+
+    The 7x7 systems of all rotors are solved at once, and stresses are
+    evaluated on a normalized radial grid within each rotor component.
+
+    Attributes:
+        n_points (int): Number of points of the normalized radial grid.
+    """
+
+    def __init__(self, n_points: int = 50):
+        self.n_points = n_points
+
+    def analyze(
+        self, problem: "SPM_RotorStructuralBatchProblem"
+    ) -> "SPM_RotorStructuralBatchResults":
+        """Analyze structural batch problem
+
+        Args:
+            problem (SPM_RotorStructuralBatchProblem): problem for analyzer.
+
+        Returns:
+            results (SPM_RotorStructuralBatchResults): stresses of all rotors
+        """
+        comps = (problem.sh, problem.rc, problem.pm, problem.sl)
+        deltaT = problem.deltaT[:, None]
+        omega = problem.omega[:, None]
+
+        A = SPM_RotorStructuralAnalyzer().DetermineCoeff(
+            *comps, problem.deltaT, problem.omega
+        )[..., 0]
+        # coefficient pairs of each component, the shaft has no r**(-h-1) term
+        coeffs = [(A[:, 0], None), (A[:, 1], A[:, 2]), (A[:, 3], A[:, 4]), (A[:, 5], A[:, 6])]
+
+        xi = np.linspace(0, 1, self.n_points)
+        r = np.zeros((4, problem.M, self.n_points))
+        sigma_r = np.zeros_like(r)
+        sigma_t = np.zeros_like(r)
+        for k, (comp, (A0, A1)) in enumerate(zip(comps, coeffs)):
+            R_i = np.reshape(comp.R_i, (-1, 1))
+            R_o = np.reshape(comp.R_o, (-1, 1))
+            r[k] = R_i + xi * (R_o - R_i)
+
+            C1, C2, C3, h, Beta, zeta_r, zeta_t = [
+                np.reshape(v, (-1, 1))
+                for v in (comp.C1, comp.C2, comp.C3, comp.h,
+                          comp.Beta, comp.zeta_r, comp.zeta_t)
+            ]
+            r_h = np.power(r[k], h - 1)
+            sigma_r[k] = (
+                A0[:, None] * (C1 * h + C2) * r_h
+                + (3 * C1 + C2) * Beta * (omega ** 2) * np.power(r[k], 2)
+                + zeta_r * deltaT
+            )
+            sigma_t[k] = (
+                A0[:, None] * (C2 * h + C3) * r_h
+                + (3 * C2 + C3) * Beta * (omega ** 2) * np.power(r[k], 2)
+                + zeta_t * deltaT
+            )
+            if A1 is not None:
+                r_mh = np.power(r[k], -h - 1)
+                sigma_r[k] += A1[:, None] * (C2 - C1 * h) * r_mh
+                sigma_t[k] += A1[:, None] * (C3 - C2 * h) * r_mh
+
+        return SPM_RotorStructuralBatchResults(xi, r, sigma_r, sigma_t, A)
+
+
+class SPM_RotorStructuralBatchResults:
+    def __init__(self, xi, r, sigma_r, sigma_t, A):
+        """Results class for SPM_RotorStructuralBatchAnalyzer
+
+        Components are ordered shaft, rotor core, magnets and sleeve.
+
+        Attributes:
+            xi (np.ndarray): Normalized radial grid from inner (0) to outer (1)
+                radius of each component, shape (n,).
+            r (np.ndarray): Radius [m], shape (4, M, n).
+            sigma_r (np.ndarray): Radial stress [Pa], shape (4, M, n).
+            sigma_t (np.ndarray): Tangential stress [Pa], shape (4, M, n).
+            A (np.ndarray): Stress coeffiecents, shape (M, 7).
+        """
+        self.xi = xi
+        self.r = r
+        self.sigma_r = sigma_r
+        self.sigma_t = sigma_t
+        self.A = A
+
+
 class SPM_RotorSleeveProblem:
     def __init__(
         self,
@@ -674,10 +829,34 @@ class SPM_RotorSleeveAnalyzer:
     
     Attributes:
         stress_limits: list of limits for critical stresses
+        method: "minimize" designs the sleeve with SLSQP. "bracket" scans the
+            sleeve thickness and solves the undersize from the constraints,
+            which are affine in the undersize for a fixed thickness. It
+            assumes a thicker sleeve never makes a feasible design infeasible,
+            and only supports the default problem_class and analyzer_class of
+            SPM_RotorSleeveProblem.
+        tol: Tolerance on the sleeve thickness of the "bracket" method [m]
     """
 
-    def __init__(self, stress_limits: "List[float,float,float,float]"):
+    # sleeve thicknesses evaluated per batch structural solve of "bracket"
+    n_bracket = 121
+    # reference undersize from which the stress slopes are computed [m]
+    delta_ref = -1e-3
+
+    def __init__(
+        self,
+        stress_limits: "List[float,float,float,float]",
+        method: str = "minimize",
+        tol: float = 1e-8,
+    ):
+        if method not in ("minimize", "bracket"):
+            raise ValueError("Unknown sleeve design method: %s" % method)
         self.stress_limits = stress_limits
+        self.method = method
+        self.tol = tol
+        # batch problems of the "bracket" method, keyed by the numeric
+        # material values, so the RotorComponent coefficients are reused
+        self._batch_problems = {}
 
     def analyze(self, problem: "SPM_RotorSleeveProblem"):
         """ analyzes input problem to design optimal rotor sleeve
@@ -688,6 +867,8 @@ class SPM_RotorSleeveAnalyzer:
         Returns:
             sol: solution from design problem
         """
+        if self.method == "bracket":
+            return self.bracket(problem)
 
         nlc1 = op.NonlinearConstraint(
             problem.rad_sleeve, self.stress_limits["rad_sleeve"], 0
@@ -716,6 +897,134 @@ class SPM_RotorSleeveAnalyzer:
         else:
             return False
 
+    def bracket(self, problem: "SPM_RotorSleeveProblem"):
+        """ designs the thinnest feasible sleeve by bracketing its thickness
+
+        Args:
+            problem (SPM_RotorSleeveProblem): input problem
+
+        Returns:
+            sol: array of sleeve thickness and undersize, False if infeasible
+        """
+        if (problem.problem_class is not SPM_RotorStructuralProblem
+                or problem.analyzer_class is not SPM_RotorStructuralAnalyzer):
+            raise ValueError(
+                'The "bracket" method does not support a custom problem_class '
+                'or analyzer_class, use the "minimize" method instead'
+            )
+
+        batch = self.batch_problem(problem)
+        # geometric scan over the thickness bounds of the "minimize" method
+        d_sl = np.geomspace(1e-6, 1, self.n_bracket)
+        lower, upper = self.undersize_interval(problem, d_sl, batch)
+        feasible = lower <= upper
+        if not feasible.any():
+            return False
+
+        i = np.argmax(feasible)
+        d_hi, delta = d_sl[i], (lower[i] + upper[i]) / 2
+        d_lo = d_sl[i - 1] if i > 0 else d_hi
+        # shrink the bracket by evaluating many thicknesses at once
+        while d_hi - d_lo > self.tol:
+            d_sl = np.linspace(d_lo, d_hi, self.n_bracket + 2)[1:-1]
+            lower, upper = self.undersize_interval(problem, d_sl, batch)
+            feasible = lower <= upper
+            j = np.argmax(feasible) if feasible.any() else len(d_sl)
+            if j < len(d_sl):
+                d_hi, delta = d_sl[j], (lower[j] + upper[j]) / 2
+            if j > 0:
+                d_lo = d_sl[j - 1]
+
+        return np.array([d_hi, delta])
+
+    def batch_problem(self, problem: "SPM_RotorSleeveProblem", n=None):
+        """ creates the batch problem of n sleeves without and with undersize
+
+        The first n rotors have no undersize and the last n the reference
+        undersize delta_ref. The RotorComponents are built once per numeric
+        material values and copied with the radii of the problem, the sleeve
+        thicknesses are set by undersize_interval.
+
+        Args:
+            problem (SPM_RotorSleeveProblem): input problem
+            n (int): number of sleeve thicknesses, n_bracket by default
+
+        Returns:
+            batch (SPM_RotorStructuralBatchProblem): batch problem of 2n rotors
+        """
+        n = self.n_bracket if n is None else n
+        key = (n,) + tuple(
+            (k, tuple(np.ravel(v))) for k, v in sorted(problem.mat_dict.items())
+            if _is_numeric(v)
+        )
+        if key not in self._batch_problems:
+            self._batch_problems[key] = SPM_RotorStructuralBatchProblem(
+                0, 0, 0, np.zeros(2 * n), 0, 0, 0, problem.mat_dict
+            )
+        batch = copy.copy(self._batch_problems[key])
+
+        r_sh, r_m, r_ro = [
+            np.full(2 * n, float(r))
+            for r in (problem.r_sh, problem.r_ro - problem.d_m, problem.r_ro)
+        ]
+        batch.sh, batch.rc, batch.pm, batch.sl = [
+            copy.copy(comp) for comp in (batch.sh, batch.rc, batch.pm, batch.sl)
+        ]
+        batch.sh.R_o = r_sh
+        batch.rc.R_i, batch.rc.R_o = r_sh, r_m
+        batch.pm.R_i, batch.pm.R_o = r_m, r_ro
+        batch.sl.R_i = r_ro
+        batch.sl.set_th(np.zeros(2 * n))
+        batch.sl.set_delta_sl(np.repeat([0, self.delta_ref], n))
+        batch.deltaT = np.full(2 * n, float(problem.deltaT))
+        batch.omega = np.full(2 * n, problem.N * 2 * np.pi / 60)
+        return batch
+
+    def undersize_interval(self, problem: "SPM_RotorSleeveProblem", d_sl, batch=None):
+        """ determines the feasible sleeve undersize for each sleeve thickness
+
+        The stresses are affine in the undersize, so each stress limit bounds
+        the undersize from one or both sides.
+
+        Args:
+            problem (SPM_RotorSleeveProblem): input problem
+            d_sl (np.ndarray): sleeve thicknesses [m]
+            batch (SPM_RotorStructuralBatchProblem): batch problem of
+                len(d_sl) sleeves from batch_problem, created if None
+
+        Returns:
+            lower, upper: bounds of the feasible undersize, empty where lower > upper
+        """
+        n = len(d_sl)
+        if batch is None:
+            batch = self.batch_problem(problem, n)
+        batch.sl.set_th(np.concatenate((d_sl, d_sl)))
+        res = SPM_RotorStructuralBatchAnalyzer(n_points=1).analyze(batch)
+
+        # (stress, lower limit, upper limit) at the inner radius of the
+        # sleeve and magnets, as in SPM_RotorSleeveProblem
+        constraints = [
+            (res.sigma_r[3, :, 0], self.stress_limits["rad_sleeve"], 0),
+            (res.sigma_t[3, :, 0], -np.inf, self.stress_limits["tan_sleeve"]),
+            (res.sigma_r[2, :, 0], -np.inf, self.stress_limits["rad_magnets"]),
+            (res.sigma_t[2, :, 0], -np.inf, self.stress_limits["tan_magnets"]),
+        ]
+
+        lower = np.full(n, -0.01)
+        upper = np.zeros(n)
+        for stress, lo, hi in constraints:
+            s_0 = stress[:n]
+            slope = (stress[n:] - s_0) / self.delta_ref
+            with np.errstate(divide="ignore", invalid="ignore"):
+                b_lo = (lo - s_0) / slope
+                b_hi = (hi - s_0) / slope
+            lower = np.maximum(lower, np.where(slope > 0, b_lo, b_hi))
+            upper = np.minimum(upper, np.where(slope > 0, b_hi, b_lo))
+            # constant stress either satisfies the limits or not for any undersize
+            violated = (slope == 0) & ((s_0 < lo) | (s_0 > hi))
+            upper = np.where(violated, -np.inf, upper)
+        return lower, upper
+
     def cost(self, x):
         """returns sleeve thickness
         
@@ -73,9 +73,14 @@ class SPM_RotorThermalAnalyzer:
 
     Attributes:
         base_ana (tb.ThermalNetworkAnalyzer): Thermal Network Analyzer
+        N_nodes (int): Number of nodes in the rotor network
+        magnet_node (int): Node at the magnet center
 
     """
 
+    N_nodes = 33
+    magnet_node = 5
+
     def __init__(self):
         self.base_ana = tb.ThermalNetworkAnalyzer()
 
@@ -88,29 +93,33 @@ class SPM_RotorThermalAnalyzer:
             T (List): Temperature distribuiton in rotor
         """
 
-        N_nodes = 33
+        N_nodes = self.N_nodes
         Res = self.create_resistance_network(problem)
+        Q_dot = self.create_loss_vector(problem)
+        T_ref = self.create_reference_temps(problem)
+
+        base_prob = tb.ThermalNetworkProblem(Res, Q_dot, T_ref, N_nodes)
+        T = self.base_ana.analyze(base_prob)
+        return T
 
+    def create_loss_vector(self, problem):
         ################################################
         #           Load Losses into loss Vector
         ################################################
-        Q_dot = np.zeros([33, 1])
+        Q_dot = np.zeros([self.N_nodes, 1])
         Q_dot[1] = 0  # No shaft losses
         Q_dot[3] = problem.losses["rotor_iron_loss"]
         Q_dot[5] = problem.losses["magnet_loss"]
+        return Q_dot
 
-        # print('Magnet Losses:',Q_dot[5])
+    def create_reference_temps(self, problem):
         ################################################
         #    Create Reference Temperature Vector
         ################################################
-
         T_ref = [
             [0, problem.T_ref],
         ]
-
-        base_prob = tb.ThermalNetworkProblem(Res, Q_dot, T_ref, N_nodes)
-        T = self.base_ana.analyze(base_prob)
-        return T
+        return T_ref
 
     def create_resistance_network(self, problem):
         ################################################
@@ -376,7 +385,7 @@ class SPM_RotorThermalAnalyzer:
         # Path 28
         ##############
         Descr = "PM center to Hub/PM Interface"
-        A_pmHub = np.pi * (R_3**2 - R_4**2)
+        A_pmHub = np.pi * (R_3**2 - R_2**2)
         Resistances.append(tb.plane_wall(pm_mat, 5, 22, L_1, A_pmHub))
         Resistances[28].Descr = Descr
         ##############
@@ -544,17 +553,16 @@ class AirflowProblem:
         self.therm_prob = SPM_RotorThermalProblem
         self.therm_ana = SPM_RotorThermalAnalyzer()
 
-    def magnet_temp(self, u_z):
-        """Calculate magnet temperature from airflow rate
+    def thermal_problem(self, u_z):
+        """Create rotor thermal problem for an airflow rate
 
         Args:
             u_z (float): Axial airflow rate [m/s]
 
         Returns:
-            T[5] (float): Magnet Temperature
+            prob (SPM_RotorThermalProblem): Rotor thermal problem
         """
-
-        prob = self.therm_prob(
+        return self.therm_prob(
             self.mat_dict,
             self.r_sh,
             self.d_ri,
@@ -568,8 +576,29 @@ class AirflowProblem:
             self.losses,
             self.omega,
         )
-        T = self.therm_ana.analyze(prob)
-        return T[5]
+
+    def temperatures(self, u_z):
+        """Calculate rotor temperature distribution from airflow rate
+
+        Args:
+            u_z (float): Axial airflow rate [m/s]
+
+        Returns:
+            T (np.ndarray): Temperature at each node of the rotor network
+        """
+        return self.therm_ana.analyze(self.thermal_problem(u_z))
+
+    def magnet_temp(self, u_z):
+        """Calculate magnet temperature from airflow rate
+
+        Args:
+            u_z (float): Axial airflow rate [m/s]
+
+        Returns:
+            T[5] (float): Magnet Temperature
+        """
+        T = self.temperatures(u_z)
+        return T[self.therm_ana.magnet_node]
 
     def cost(self, u_z):
         """Returns airflow rate as cost function"""
@@ -577,7 +606,23 @@ class AirflowProblem:
 
 
 class AirflowAnalyzer:
-    """Analyzer to calculate required airflow in SPM machine"""
+    """Analyzer to calculate required airflow in SPM machine
+
+    Attributes:
+        method (str): "minimize" solves for the airflow with a constrained
+            optimization. "root" finds the airflow at which the magnet reaches
+            its maximum temperature with a bracketed root search, which assumes
+            the magnet temperature is monotone in u_z over `bounds`.
+        bounds (tuple): Lower and upper bounds on the airflow rate [m/s]
+        tol (float): Tolerance on the airflow rate [m/s]
+    """
+
+    def __init__(self, method="minimize", bounds=(0.00001, 1.0), tol=1e-6):
+        if method not in ("minimize", "root"):
+            raise ValueError("Unknown airflow solution method: %s" % method)
+        self.method = method
+        self.bounds = bounds
+        self.tol = tol
 
     def analyze(self, problem: AirflowProblem):
         """Analyzes input problem to calculate required airflow to cool rotor
@@ -587,29 +632,72 @@ class AirflowAnalyzer:
         Returns:
             results (dict): dictionary with analyzer solution
         """
+        if self.method == "root":
+            valid, u_z, T = self.solve_root(problem)
+        else:
+            valid, u_z, T = self.solve_minimize(problem)
+
+        results = {
+            "valid": valid,
+            "magnet Temp": T[problem.therm_ana.magnet_node],
+            "Required Airflow": u_z,
+            "Rotor Temperatures": T,
+        }
+        return results
 
+    def solve_minimize(self, problem: AirflowProblem):
         nlc1 = op.NonlinearConstraint(problem.magnet_temp, 0, problem.max_temp)
         const = nlc1
         sol = op.minimize(
-            problem.cost, 0, tol=1e-6, constraints=const, bounds=[(0.00001, 1.0)]
+            problem.cost, 0, tol=self.tol, constraints=const, bounds=[self.bounds]
+        )
+        return sol.success, sol.x, problem.temperatures(sol.x)
+
+    def solve_root(self, problem: AirflowProblem):
+        therm_ana = problem.therm_ana
+        prob = problem.thermal_problem(self.bounds[0])
+        res = therm_ana.create_resistance_network(prob)
+        Q_dot = therm_ana.create_loss_vector(prob)
+        T_ref = therm_ana.create_reference_temps(prob)
+
+        # only the resistances depending on the airflow change between iterations
+        airflow_res = [r for r in res if hasattr(r, "u_z")]
+        fixed_res = [r for r in res if not hasattr(r, "u_z")]
+        G_fixed = tb.ThermalNetworkAnalyzer.conductance_matrix(
+            fixed_res, therm_ana.N_nodes
         )
-        # print(sol.success)
-        # print(sol)
-        if sol.success == True:
-            results = {
-                "valid": sol.success,
-                "magnet Temp": problem.magnet_temp(sol.x),
-                "Required Airflow": sol.x,
-            }
-            return results
-        else:
-            results = {
-                "valid": sol.success,
-                "magnet Temp": problem.magnet_temp(sol.x),
-                "Required Airflow": sol.x,
-            }
 
-            return results
+        def temperatures(u_z):
+            for r in airflow_res:
+                r.u_z = u_z
+            G = G_fixed + tb.ThermalNetworkAnalyzer.conductance_matrix(
+                airflow_res, therm_ana.N_nodes
+            )
+            return therm_ana.base_ana.solve(G, Q_dot, T_ref)
+
+        def excess_temp(u_z):
+            T = temperatures(u_z)
+            return T[therm_ana.magnet_node, 0] - problem.max_temp
+
+        lower, upper = self.bounds
+        excess_lower = excess_temp(lower)
+        excess_upper = excess_temp(upper)
+        # the magnet temperature can rise or fall with the airflow, the cool
+        # end of the bracket is the one with the lower magnet temperature
+        cool = upper if excess_upper < excess_lower else lower
+        if excess_lower <= 0:
+            valid, u_z = True, lower
+        elif min(excess_lower, excess_upper) > 0:
+            # no airflow in the bounds meets the limit, use the coolest one
+            valid, u_z = False, cool
+        else:
+            valid = True
+            u_z = op.brentq(excess_temp, lower, upper, xtol=self.tol)
+            # step toward the cool end so the temperature limit holds
+            if excess_temp(u_z) > 0:
+                step = self.tol if cool == upper else -self.tol
+                u_z = min(max(u_z + step, lower), upper)
+        return valid, np.array([u_z], dtype=float), temperatures(u_z)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
 import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
 from typing import List
 
 
@@ -6,7 +8,8 @@ class ThermalNetworkProblem:
     """Problem class from Thermal Resistance Network Analyzer.
 
     Attributes:
-        res: List of Resistance objects
+        res: List of Resistance objects. Resistances connecting the same pair
+          of nodes are combined in parallel.
         Q_dot: List of Thermal sources at nodal locations
         T_ref: List of [ref_node,ref_temp]
         N_nodes: Number of Nodes in system
@@ -25,8 +28,42 @@ class ThermalNetworkProblem:
         self.N_nodes = N_nodes
 
 
+class ThermalNetworkBatchProblem:
+    """Problem class for solving several load cases of one network topology.
+
+    Attributes:
+        res: List of Resistance objects defining the network topology
+        Q_dot: Thermal sources for each case, shape (N_cases, N_nodes). A
+            single vector of length N_nodes is shared by all cases.
+        T_ref: List of [ref_node,ref_temp]
+        N_nodes: Number of Nodes in system
+        res_values: Optional resistance values [K/W] for each case, shape
+            (N_cases, len(res)). If None, `resistance_value` of each
+            Resistance is used for all cases.
+    """
+
+    def __init__(
+        self,
+        res: List["Resistance"],
+        Q_dot: "np.ndarray",
+        T_ref: "List[List[int,float]]",
+        N_nodes: int,
+        res_values: "np.ndarray" = None,
+    ):
+        self.res = res
+        self.Q_dot = Q_dot
+        self.T_ref = T_ref
+        self.N_nodes = N_nodes
+        self.res_values = res_values
+
+
 class ThermalNetworkAnalyzer:
-    """Thermal Resistance Network Analyzer."""
+    """Thermal Resistance Network Analyzer.
+
+    The network is assembled as a sparse conductance (Laplacian) matrix and the
+    reference temperatures are applied by eliminating the reference nodes, so
+    only the free nodes are factorized.
+    """
 
     def analyze(self, problem: ThermalNetworkProblem):
         """Analyze imported resistance network problem
@@ -35,36 +72,261 @@ class ThermalNetworkAnalyzer:
             problem: ThermalNetworkProblem object to be analyzed
 
         Returns:
-            T: Temperature distribution at each node in system
+            T: Temperature distribution at each node in system, with the same
+                shape as `problem.Q_dot`
         """
-        R_inv = np.zeros([problem.N_nodes, problem.N_nodes])
-        for i, r in enumerate(problem.res):
-            # print("Resistance number", i)
-            N1 = r.Node1
-            N2 = r.Node2
-            res = r.resistance_value
-            R_inv[N1, N2] = 1 / res
-            R_inv[N2, N1] = 1 / res
-        one = np.ones([len(R_inv[:, 1]), 1])
-        Sum_R = np.dot(R_inv, one)
-        G = -R_inv
-        for i, r in enumerate(R_inv[:, 1]):
-            E = np.zeros([len(R_inv[:, 1]), len(R_inv[:, 1])])
-            E[i, i] = 1
-            e = np.zeros([1, len(R_inv[:, 1])])
-            e[0, i] = 1
-            G = G + np.dot(np.dot(E, Sum_R), e)
-
-        G_aug = G
-        for node, temp in problem.T_ref:
-            G_aug[node, :] = np.zeros_like(G_aug[0, :])
-            G_aug[node, node] = 1
-            Q_dot_aug = problem.Q_dot
-            Q_dot_aug[node] = temp
-        T = np.dot(np.linalg.inv(G_aug), Q_dot_aug)
-        # print(T)
+        G = self.conductance_matrix(problem.res, problem.N_nodes)
+        return self.solve(G, problem.Q_dot, problem.T_ref)
+
+    def analyze_batch(self, problem: ThermalNetworkBatchProblem):
+        """Analyze several load cases of one resistance network
+
+        Cases sharing the same resistance values are solved together with a
+        single factorization of the conductance matrix.
+
+        Args:
+            problem: ThermalNetworkBatchProblem object to be analyzed
+
+        Returns:
+            T: Temperature distribution for each case, shape (N_cases, N_nodes)
+        """
+        N_nodes = problem.N_nodes
+        Q_dot = np.asarray(problem.Q_dot, dtype=float)
+        Q_dot = Q_dot.reshape(-1, N_nodes)
+        if problem.res_values is None:
+            values = np.array([[r.resistance_value for r in problem.res]])
+        else:
+            values = np.asarray(problem.res_values, dtype=float)
+            values = values.reshape(-1, len(problem.res))
+        N_cases = max(len(Q_dot), len(values))
+        Q_dot = np.broadcast_to(Q_dot, (N_cases, N_nodes))
+        values = np.broadcast_to(values, (N_cases, len(problem.res)))
+
+        unique, inverse = np.unique(values, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        T = np.zeros((N_cases, N_nodes))
+        for i, row in enumerate(unique):
+            cases = inverse == i
+            G = self.conductance_matrix(problem.res, N_nodes, values=row)
+            T[cases] = self.solve(G, Q_dot[cases].T, problem.T_ref).T
         return T
 
+    @staticmethod
+    def conductance_matrix(res: List["Resistance"], N_nodes: int, values=None):
+        """Assemble the sparse conductance matrix of a resistance network
+
+        Resistances connecting the same pair of nodes are combined in parallel.
+
+        Args:
+            res: List of Resistance objects
+            N_nodes: Number of Nodes in system
+            values: Optional resistance values [K/W] to use instead of
+                `resistance_value` of each Resistance
+
+        Returns:
+            G: Conductance matrix [W/K] in CSR format
+        """
+        n1 = np.array([r.Node1 for r in res], dtype=int)
+        n2 = np.array([r.Node2 for r in res], dtype=int)
+        if values is None:
+            values = [r.resistance_value for r in res]
+        # resistance values may be 1-element arrays, e.g. when u_z is an array
+        g = 1 / np.hstack(values).astype(float)
+        rows = np.concatenate((n1, n2, n1, n2))
+        cols = np.concatenate((n2, n1, n1, n2))
+        data = np.concatenate((-g, -g, g, g))
+        # duplicate entries are summed during the COO -> CSR conversion
+        return sp.coo_matrix((data, (rows, cols)), shape=(N_nodes, N_nodes)).tocsr()
+
+    @staticmethod
+    def solve(G, Q_dot, T_ref: "List[List[int,float]]"):
+        """Solve the network for nodal temperatures
+
+        Args:
+            G: Conductance matrix [W/K]
+            Q_dot: Thermal sources at nodal locations. Additional columns are
+                solved as independent load cases.
+            T_ref: List of [ref_node,ref_temp]
+
+        Returns:
+            T: Temperature distribution with the same shape as `Q_dot`
+        """
+        N_nodes = G.shape[0]
+        Q_dot = np.asarray(Q_dot, dtype=float)
+        Q = Q_dot.reshape(N_nodes, -1)
+
+        ref = np.array([node for node, _ in T_ref], dtype=int)
+        free = np.ones(N_nodes, dtype=bool)
+        free[ref] = False
+
+        T = np.zeros(Q.shape)
+        T[ref] = np.array([temp for _, temp in T_ref], dtype=float)[:, None]
+        G_ff = G[free][:, free].tocsc()
+        rhs = Q[free] - G[free][:, ~free] @ T[~free]
+        T[free] = spla.splu(G_ff).solve(rhs)
+        return T.reshape(Q_dot.shape)
+
+
+class ThermalNetworkTransientProblem:
+    """Problem class for transient thermal resistance network analysis.
+
+    The network obeys C dT/dt + G T = Q_dot, where G is the conductance matrix
+    assembled from `res`.
+
+    Attributes:
+        res: List of Resistance objects
+        C: Thermal capacitance of each node [J/K]. Nodes with zero capacitance
+            are treated as massless.
+        Q_dot: Thermal sources at nodal locations [W]. Either constant with
+            N_nodes entries, sampled at each time point along `Q_dot_axis`,
+            or a callable returning the sources at time t.
+        T_ref: List of [ref_node,ref_temp]
+        N_nodes: Number of Nodes in system
+        t: Time points to evaluate, starting at the initial time [s]
+        T_0: Initial temperature of each node (or a single value for all nodes)
+        Q_dot_axis: Axis of `Q_dot` indexing the time points, e.g. 1 for
+            sources of shape (N_nodes, len(t)). None if `Q_dot` is constant or
+            callable.
+    """
+
+    def __init__(
+        self,
+        res: List["Resistance"],
+        C: "np.ndarray",
+        Q_dot,
+        T_ref: "List[List[int,float]]",
+        N_nodes: int,
+        t: "np.ndarray",
+        T_0,
+        Q_dot_axis: int = None,
+    ):
+        self.res = res
+        self.C = C
+        self.Q_dot = Q_dot
+        self.T_ref = T_ref
+        self.N_nodes = N_nodes
+        self.t = t
+        self.T_0 = T_0
+        self.Q_dot_axis = Q_dot_axis
+
+
+class ThermalNetworkTransientAnalyzer:
+    """Transient Thermal Resistance Network Analyzer.
+
+    Integrates the network with an implicit method. Step matrices are factorized
+    once per distinct step size and reused, so uniform time grids require a
+    single factorization. All resistances must be positive, and node
+    capacitances non-negative, for the response to be stable.
+
+    Attributes:
+        method: Integration method, "backward_euler" or "bdf2"
+    """
+
+    def __init__(self, method: str = "backward_euler"):
+        if method not in ("backward_euler", "bdf2"):
+            raise ValueError("Unknown integration method: %s" % method)
+        self.method = method
+
+    def analyze(self, problem: ThermalNetworkTransientProblem):
+        """Simulate the temperature response of the network
+
+        Args:
+            problem: ThermalNetworkTransientProblem object to be analyzed
+
+        Returns:
+            results: ThermalNetworkTransientResults object
+
+        Raises:
+            ValueError: If a resistance is not positive or a capacitance is
+                negative
+        """
+        N_nodes = problem.N_nodes
+        t = np.asarray(problem.t, dtype=float)
+        values = np.hstack([r.resistance_value for r in problem.res]).astype(float)
+        bad = np.flatnonzero(~(values > 0) | ~np.isfinite(values))
+        if len(bad) > 0:
+            raise ValueError(
+                "Resistances must be positive and finite, got %s for resistance(s) %s"
+                % (values[bad], bad)
+            )
+        G = ThermalNetworkAnalyzer.conductance_matrix(problem.res, N_nodes, values)
+        C = np.broadcast_to(np.asarray(problem.C, dtype=float), (N_nodes,))
+        if np.any(C < 0):
+            raise ValueError("Node capacitances must be non-negative")
+        Q_dot = self._source_profile(problem)
+
+        ref = np.array([node for node, _ in problem.T_ref], dtype=int)
+        free = np.ones(N_nodes, dtype=bool)
+        free[ref] = False
+        T_r = np.array([temp for _, temp in problem.T_ref], dtype=float)
+        G_ff = G[free][:, free].tocsc()
+        b_r = G[free][:, ~free] @ T_r
+        C_f = C[free]
+
+        T = np.zeros((N_nodes, len(t)))
+        T[:, 0] = problem.T_0
+        T[ref] = T_r[:, None]
+
+        lu_cache = {}
+        for n in range(1, len(t)):
+            h = t[n] - t[n - 1]
+            if self.method == "bdf2" and n > 1:
+                # variable step BDF2 coefficients, w is the step size ratio
+                w = h / (t[n - 1] - t[n - 2])
+                a0 = (1 + 2 * w) / ((1 + w) * h)
+                a1 = -(1 + w) / h
+                a2 = w**2 / ((1 + w) * h)
+                hist = -a1 * T[free, n - 1] - a2 * T[free, n - 2]
+            else:
+                a0 = 1 / h
+                hist = a0 * T[free, n - 1]
+
+            key = float("%.12e" % a0)
+            if key not in lu_cache:
+                A = (G_ff + sp.diags(a0 * C_f)).tocsc()
+                lu_cache[key] = spla.splu(A)
+            rhs = C_f * hist + Q_dot(n)[free] - b_r
+            T[free, n] = lu_cache[key].solve(rhs)
+
+        return ThermalNetworkTransientResults(t, T)
+
+    @staticmethod
+    def _source_profile(problem: ThermalNetworkTransientProblem):
+        """Returns a function of the time index n returning the nodal sources"""
+        N_nodes = problem.N_nodes
+        t = np.asarray(problem.t, dtype=float)
+        N_t = len(t)
+        if callable(problem.Q_dot):
+            return lambda n: np.asarray(problem.Q_dot(t[n]), dtype=float).reshape(N_nodes)
+
+        Q = np.asarray(problem.Q_dot, dtype=float)
+        if problem.Q_dot_axis is None:
+            if Q.size != N_nodes:
+                raise ValueError(
+                    "Constant Q_dot must have N_nodes entries, set Q_dot_axis "
+                    "for sources sampled at each time point"
+                )
+            Q = Q.reshape(N_nodes)
+            return lambda n: Q
+        Q = np.moveaxis(Q, problem.Q_dot_axis, 0)
+        if len(Q) != N_t:
+            raise ValueError("Q_dot must have len(t) entries along Q_dot_axis")
+        Q = Q.reshape(N_t, N_nodes)
+        return lambda n: Q[n]
+
+
+class ThermalNetworkTransientResults:
+    """Results class for ThermalNetworkTransientAnalyzer
+
+    Attributes:
+        t: Time points [s]
+        T: Temperature of each node at each time point, shape (N_nodes, len(t))
+    """
+
+    def __init__(self, t: "np.ndarray", T: "np.ndarray"):
+        self.t = t
+        self.T = T
+
 
 class Material:
     """Class holding material parameters.
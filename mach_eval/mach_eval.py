@@ -5,10 +5,20 @@ manner suitable for both machine optimization and evaluation.
 """
 
 from typing import Protocol, runtime_checkable, Any, List, Union
+from collections.abc import Iterator
 from abc import abstractmethod, ABC
-from copy import deepcopy
+from contextlib import contextmanager, nullcontext
+from copy import copy
+from collections import deque
+import numpy as np
+import pandas as pd
+import hashlib
+import inspect
 import os
+import pickle
 import sys
+import time
+import tracemalloc
 
 # add the directory immediately above this file's directory to path for module import
 sys.path.append(os.path.dirname(__file__) + "/..")
@@ -22,6 +32,13 @@ __all__ = [
     "Architect",
     "Machine",
     "MachineEvaluator",
+    "EvaluationResults",
+    "EvaluationMonitor",
+    "StepOrderPolicy",
+    "CostOrderPolicy",
+    "MultiFidelityEvaluator",
+    "PromotionPolicy",
+    "ParetoPromotionPolicy",
     "EvaluationStep",
     "Conditions",
     "State",
@@ -30,6 +47,9 @@ __all__ = [
     "Problem",
     "Analyzer",
     "PostAnalyzer",
+    "CachedAnalyzer",
+    "ResultCache",
+    "CheckpointStore",
 ]
 
 
@@ -117,10 +137,28 @@ class MachineEvaluator(mo.Evaluator):
 
     Attributes:
         steps: Sequential list of steps involved in evaluating a MachineDesign
+        monitor: Optional EvaluationMonitor recording the time and memory used by each step
+        gates: Optional dict mapping steps to predicates gate(results, state_out) -> bool. The design is rejected with
+            InvalidDesign as soon as a predicate returns False, skipping all remaining steps.
+        order_policy: Optional StepOrderPolicy deciding the order in which steps are run. The results of each step
+            are kept at the position of the step in steps, whatever the order in which steps are run.
+        checkpoint: Optional CheckpointStore saving the results of each completed step, so that the evaluation of a
+            design which failed resumes from the step that failed
     """
 
-    def __init__(self, steps: List["EvaluationStep"]):
+    def __init__(
+        self,
+        steps: List["EvaluationStep"],
+        monitor: "EvaluationMonitor" = None,
+        gates: dict = None,
+        order_policy: "StepOrderPolicy" = None,
+        checkpoint: "CheckpointStore" = None,
+    ):
         self.steps = steps
+        self.order = list(range(len(steps))) if order_policy is None else list(order_policy.order(steps))
+        self.monitor = monitor
+        self.gates = {} if gates is None else gates
+        self.checkpoint = checkpoint
 
     def evaluate(self, design: Any):
         """Evaluates a MachineDesign
@@ -132,15 +170,329 @@ class MachineEvaluator(mo.Evaluator):
         Returns:
             full_results: List of results obtained from each evaluation step
         """
+        # results of steps which have not been run are None
+        full_results = EvaluationResults([None] * len(self.steps))
+        key = None
+        if self.checkpoint is not None:
+            key = self.checkpoint.key(design)
+            full_results = self.checkpoint.load(key) or full_results
+
         state_condition = Conditions()
         state_in = State(design, state_condition)
-        full_results = []
-        for evalStep in self.steps:
-            [results, state_out] = evalStep.step(state_in)
-            full_results.append(deepcopy([state_in, results, state_out]))
-            state_in = state_out
+        try:
+            for i in self.order:
+                evalStep = self.steps[i]
+                if full_results[i] is not None:
+                    # resume from the output state of the last completed step
+                    state_in = full_results[i][-1]
+                    continue
+                # post analyzers return a copy of the input state, see State.copy
+                [results, state_out] = self.__measure_step(i, evalStep, state_in, full_results)
+                full_results[i] = [state_in, results, state_out]
+                gate = self.gates.get(evalStep)
+                if gate is not None and not gate(results, state_out):
+                    raise mo.InvalidDesign("Design rejected after step " + str(i) + " (" + step_name(evalStep) + ")")
+                if key is not None:
+                    self.checkpoint.save(key, full_results)
+                state_in = state_out
+        except Exception as e:
+            # invalid designs are not evaluated again, other errors resume from the last completed step
+            # InvalidDesign is compared by class name to also catch those of other copies of mach_opt, as in
+            # DesignProblem
+            if key is not None and type(e).__name__ == mo.InvalidDesign.__name__:
+                self.checkpoint.remove(key)
+            raise e
+        if key is not None:
+            self.checkpoint.remove(key)
         return full_results
 
+    def __measure_step(self, i, evalStep, state_in, full_results):
+        if self.monitor is None:
+            return evalStep.step(state_in)
+        self.monitor.step = i
+        self.monitor.step_name = step_name(evalStep)
+        self.monitor.step_records = full_results.metrics
+        try:
+            # steps which measure their own stages, such as AnalysisStep, accept the monitor
+            if "monitor" in inspect.signature(evalStep.step).parameters:
+                return evalStep.step(state_in, monitor=self.monitor)
+            with self.monitor.measure("step"):
+                return evalStep.step(state_in)
+        finally:
+            self.monitor.step_records = None
+
+
+class StepOrderPolicy(Protocol):
+    """Protocol for a policy deciding the order in which evaluation steps are run"""
+
+    @abstractmethod
+    def order(self, steps: List["EvaluationStep"]) -> List[int]:
+        """Returns the indices of steps in the order in which they are run"""
+        pass
+
+
+class CostOrderPolicy(StepOrderPolicy):
+    """Runs cheap independent steps first, such as gated feasibility checks
+
+    Steps read conditions written by earlier steps, so steps keep their declared relative order unless they are
+    marked independent. Independent steps are run as soon as the steps they depend on have run and no cheaper step is
+    ready.
+
+    Attributes:
+        costs: Dict mapping steps to their relative cost. Steps not in costs have a cost of 1.
+        independent: Steps which neither read conditions written by other steps, apart from those listed in
+            depends_on, nor write conditions read by other steps
+        depends_on: Optional dict mapping independent steps to the list of steps providing the conditions they require
+    """
+
+    def __init__(self, costs: dict, independent: list = None, depends_on: dict = None):
+        self.costs = costs
+        self.independent = [] if independent is None else independent
+        self.depends_on = {} if depends_on is None else depends_on
+
+    def order(self, steps: List["EvaluationStep"]) -> List[int]:
+        """Returns the indices of steps ordered by increasing cost, respecting dependencies; ties keep their order"""
+        remaining = list(range(len(steps)))
+        ordered = []
+        while remaining:
+            ready = []
+            for i in remaining:
+                step = steps[i]
+                if step in self.independent:
+                    deps = [j for j, other in enumerate(steps) if other in self.depends_on.get(step, [])]
+                else:
+                    # all earlier steps which are not independent
+                    deps = [j for j in range(i) if steps[j] not in self.independent]
+                if all(j in ordered for j in deps):
+                    ready.append(i)
+            if not ready:
+                raise Exception("Circular dependency between evaluation steps")
+            i = min(ready, key=lambda i: self.costs.get(steps[i], 1))
+            ordered.append(i)
+            remaining.remove(i)
+        return ordered
+
+
+class MultiFidelityEvaluator(mo.Evaluator):
+    """Screens designs with a low fidelity evaluator, promoting promising designs to a high fidelity evaluator
+
+    Every design is first evaluated by the low fidelity evaluator, e.g. a MachineEvaluator with analytic steps. The
+    promotion policy compares the resulting objectives with the Pareto set of the optimization archive, and only
+    promoted designs are evaluated by the high fidelity evaluator, e.g. a MachineEvaluator with FEA steps. Promoted
+    designs return the results of both fidelities, so that both are archived, with the high fidelity state last.
+    The Pareto set is read from the data handler before each promotion, so worker processes started by
+    DesignProblem.batch_fitness and resumed optimizations all rank designs against the same archive.
+
+    Attributes:
+        low_fidelity: Evaluator run on every design
+        high_fidelity: Evaluator run on promoted designs
+        design_space: DesignSpace whose get_objectives accepts the results of either fidelity
+        dh: DataHandler of the optimization archive, usually the one passed to DesignProblem
+        policy: PromotionPolicy deciding which designs are promoted, defaults to ParetoPromotionPolicy()
+        n_low: Number of designs evaluated with low fidelity
+        n_high: Number of designs promoted to high fidelity
+    """
+
+    def __init__(
+        self,
+        low_fidelity: "mo.Evaluator",
+        high_fidelity: "mo.Evaluator",
+        design_space: "mo.DesignSpace",
+        dh: "mo.DataHandler",
+        policy: "PromotionPolicy" = None,
+    ):
+        self.low_fidelity = low_fidelity
+        self.high_fidelity = high_fidelity
+        self.design_space = design_space
+        self.dh = dh
+        self.policy = ParetoPromotionPolicy() if policy is None else policy
+        self.n_low = 0
+        self.n_high = 0
+
+    def evaluate(self, design: Any):
+        """Evaluates a MachineDesign with low fidelity, and with high fidelity if it is promoted
+
+        Args:
+            design: MachineDesign object to be evaluated
+        Returns:
+            full_results: EvaluationResults of the low fidelity evaluation followed by those of the high fidelity
+                evaluation if the design was promoted. The fidelity attribute is "low" or "high" accordingly.
+        """
+        results = self.low_fidelity.evaluate(design)
+        low_results = EvaluationResults(results)
+        low_results.metrics = list(getattr(results, "metrics", []))
+        low_results.fidelity = "low"
+        self.n_low += 1
+        objs = self.design_space.get_objectives(low_results)
+        with self.dh.archive_lock():
+            pareto = self.dh.read_pareto()
+        if not self.policy.promote(objs, pareto):
+            return low_results
+
+        high_results = self.high_fidelity.evaluate(design)
+        self.n_high += 1
+        full_results = EvaluationResults(low_results + list(high_results))
+        full_results.metrics = low_results.metrics + list(getattr(high_results, "metrics", []))
+        full_results.fidelity = "high"
+        return full_results
+
+
+class PromotionPolicy(Protocol):
+    """Protocol for a policy deciding which designs are promoted to high fidelity evaluation"""
+
+    @abstractmethod
+    def promote(self, objs: "tuple", pareto: "mo.ParetoSet") -> bool:
+        pass
+
+
+class ParetoPromotionPolicy(PromotionPolicy):
+    """Promotes designs whose low fidelity objectives could be non-dominated by the Pareto set of the archive
+
+    Attributes:
+        margin: Relative error of the low fidelity objectives. A design is promoted unless a design of the Pareto set
+            dominates its objectives reduced by margin times their magnitude.
+        min_size: Every design is promoted while the Pareto set holds fewer designs than min_size
+    """
+
+    def __init__(self, margin: float = 0.05, min_size: int = 1):
+        self.margin = margin
+        self.min_size = min_size
+
+    def promote(self, objs: "tuple", pareto: "mo.ParetoSet") -> bool:
+        """Returns True if the design with low fidelity objectives objs is promoted, assuming minimization"""
+        if len(pareto.fitness) < self.min_size:
+            return True
+        objs = np.hstack(objs).astype(float)
+        optimistic = objs - self.margin * np.abs(objs)
+        fitness = np.array(pareto.fitness)
+        dominated = np.all(fitness <= optimistic, axis=1) & np.any(fitness < optimistic, axis=1)
+        return not np.any(dominated)
+
+
+class EvaluationResults(list):
+    """List of [state_in, results, state_out] of each evaluation step
+
+    Attributes:
+        metrics: Records of the time and memory used by each evaluation stage, see EvaluationMonitor
+        fidelity: Fidelity of the evaluation set by MultiFidelityEvaluator, "low" or "high", None otherwise
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.metrics = []
+        self.fidelity = None
+
+
+class EvaluationMonitor:
+    """Records wall time, CPU time and peak memory of the stages of each evaluation step
+
+    Analysis steps are measured in three stages, get_problem, analyze and get_next_state, while other evaluation
+    steps are measured as a single stage named step. Each measurement is recorded as a dict with keys step (index of
+    the step), name, stage, wall_time [s], cpu_time [s] and peak_memory [bytes]. The measurements of each design are
+    also stored in the metrics of its results, which are archived with the design, so the monitor only keeps the most
+    recent ones.
+
+    Attributes:
+        trace_memory: Record peak memory allocated during each stage using tracemalloc. Disabled by default as
+            tracing slows down evaluation. If tracemalloc is already tracing, its peak is reset at the start of each
+            stage and tracing is left running afterwards.
+        max_records: Number of most recent measurements kept in records
+        records: Deque of recorded measurements
+        step: Index of the step currently measured
+        step_name: Name of the step currently measured
+        step_records: Optional list also receiving the measurements of the current step
+    """
+
+    def __init__(self, trace_memory: bool = False, records: list = None, max_records: int = 10000):
+        self.trace_memory = trace_memory
+        self.max_records = max_records
+        self.records = deque([] if records is None else records, maxlen=max_records)
+        self.step = None
+        self.step_name = None
+        self.step_records = None
+        self.__peaks = []
+
+    @contextmanager
+    def measure(self, stage: str):
+        """Context manager measuring a stage of the current step"""
+        started_tracing = False
+        if self.trace_memory:
+            if tracemalloc.is_tracing():
+                # keep the peak of an enclosing stage, which is lost on reset
+                if self.__peaks:
+                    self.__peaks[-1] = max(self.__peaks[-1], tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                started_tracing = True
+            memory_start = tracemalloc.get_traced_memory()[0]
+            self.__peaks.append(memory_start)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            record = {
+                "step": self.step,
+                "name": self.step_name,
+                "stage": stage,
+                "wall_time": time.perf_counter() - wall_start,
+                "cpu_time": time.process_time() - cpu_start,
+                "peak_memory": np.nan,
+            }
+            if self.trace_memory:
+                peak = max(self.__peaks.pop(), tracemalloc.get_traced_memory()[1])
+                record["peak_memory"] = peak - memory_start
+                if self.__peaks:
+                    self.__peaks[-1] = max(self.__peaks[-1], peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            self.records.append(record)
+            if self.step_records is not None:
+                self.step_records.append(record)
+
+    def histograms(self, bins: int = 10) -> dict:
+        """Histograms of the recorded wall time, CPU time and peak memory of each stage of each step
+
+        Args:
+            bins: Number of bins of each histogram
+        Returns:
+            histograms: Dict mapping (step, name, stage) to a dict mapping each metric to (counts, bin_edges)
+        """
+        histograms = {}
+        df = pd.DataFrame(list(self.records))
+        for key, group in df.groupby(["step", "name", "stage"], sort=True):
+            histograms[key] = {}
+            for metric in ("wall_time", "cpu_time", "peak_memory"):
+                values = group[metric].dropna().to_numpy(dtype=float)
+                if len(values) > 0:
+                    histograms[key][metric] = np.histogram(values, bins=bins)
+        return histograms
+
+    def export_histograms(self, filepath: str, bins: int = 10):
+        """Export histograms of each stage of each step to a CSV file, one row per bin
+
+        Args:
+            filepath: CSV file to write
+            bins: Number of bins of each histogram
+        """
+        rows = []
+        for (step, name, stage), metrics in self.histograms(bins).items():
+            for metric, (counts, edges) in metrics.items():
+                for count, low, high in zip(counts, edges[:-1], edges[1:]):
+                    rows.append([step, name, stage, metric, low, high, count])
+        df = pd.DataFrame(rows, columns=["step", "name", "stage", "metric", "bin_low", "bin_high", "count"])
+        df.to_csv(filepath, index=False)
+
+
+def step_name(step: "EvaluationStep") -> str:
+    """Returns a name describing an evaluation step, the name of its analyzer for analysis steps"""
+    obj = step.analyzer if isinstance(step, AnalysisStep) else step
+    # cached analyzers are named after the analyzer they wrap
+    while isinstance(obj, CachedAnalyzer):
+        obj = obj.analyzer
+    return getattr(obj, "__name__", type(obj).__name__)
+
 
 @runtime_checkable
 class EvaluationStep(Protocol):
@@ -155,11 +507,27 @@ class Conditions:
     """Class to hold state conditions during machine evaluation.
 
     This is a dummy class whose purpose is hold attributes required by subsequent steps involved in evaluating a machine
-    design.
+    design. Conditions created from a parent only hold the attributes set on them, and look up all other attributes in
+    the parent.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, parent: "Conditions" = None):
+        self._parent = parent
+
+    def __getattr__(self, name):
+        # only called for attributes not set on this object
+        parent = self.__dict__.get("_parent")
+        if parent is None:
+            raise AttributeError(name)
+        return getattr(parent, name)
+
+    def copy(self) -> "Conditions":
+        """Returns new Conditions which share all attributes of this object"""
+        return Conditions(self)
+
+    def changes(self) -> dict:
+        """Returns attributes set on this object, excluding those provided by its parents"""
+        return {name: value for name, value in self.__dict__.items() if name != "_parent"}
 
 
 class State:
@@ -177,6 +545,15 @@ class State:
         self.design = design
         self.conditions = conditions
 
+    def copy(self) -> "State":
+        """Returns a copy-on-write copy of the state
+
+        Post analyzers create the output state of a step with this method, so that the input state recorded by
+        MachineEvaluator is left untouched. Attributes assigned to the design or conditions of the copy do not affect this state. Objects held by them
+        are shared between both states, and should be replaced rather than modified in place.
+        """
+        return State(copy(self.design), self.conditions.copy())
+
 
 class AnalysisStep(EvaluationStep):
     """Class representing a step which involves detailed analysis.
@@ -194,18 +571,23 @@ class AnalysisStep(EvaluationStep):
         self.analyzer = analyzer
         self.post_analyzer = post_analyzer
 
-    def step(self, state_in: "State") -> Union[Any, "State"]:
+    def step(self, state_in: "State", monitor: "EvaluationMonitor" = None) -> Union[Any, "State"]:
         """Method to evaluate design using a analyzer
 
         Args:
             state_in: input state which is to be evaluated.
+            monitor: optional monitor measuring each stage of the step.
         Returns:
             results: Results obtained from the analyzer.
             state_out: Output state to be used by the next step involved in the machine design evaluation.
         """
-        problem = self.problem_definition.get_problem(state_in)
-        results = self.analyzer.analyze(problem)
-        state_out = self.post_analyzer.get_next_state(results, state_in)
+        measure = monitor.measure if monitor is not None else lambda stage: nullcontext()
+        with measure("get_problem"):
+            problem = self.problem_definition.get_problem(state_in)
+        with measure("analyze"):
+            results = self.analyzer.analyze(problem)
+        with measure("get_next_state"):
+            state_out = self.post_analyzer.get_next_state(results, state_in)
         return results, state_out
 
 
@@ -238,6 +620,263 @@ class PostAnalyzer(Protocol):
         pass
 
 
+class CachedAnalyzer(Analyzer):
+    """Analyzer wrapper returning stored results for problems which were analyzed before
+
+    Use in place of the wrapped analyzer when creating an AnalysisStep. The attributes of the analyzer are part of the
+    cache key, along with the problem. Problems holding objects which cannot be encoded by the cache, see
+    ResultCache.key, are always analyzed.
+
+    Attributes:
+        analyzer: class or object analyzing problems on a cache miss
+        cache: ResultCache holding the results of analyzed problems
+    """
+
+    def __init__(self, analyzer, cache: "ResultCache"):
+        self.analyzer = analyzer
+        self.cache = cache
+
+    def analyze(self, problem: "Problem") -> Any:
+        key = self.cache.key(self.analyzer, problem)
+        if key is not None:
+            hit, results = self.cache.load(key)
+            if hit:
+                return results
+        results = self.analyzer.analyze(problem)
+        if key is not None:
+            self.cache.store(key, results)
+        return results
+
+
+class ResultCache:
+    """On-disk cache of analyzer results, content-addressed by a hash of the analyzer and the analyzed problem
+
+    Results are stored in one pickle file per problem. When the total size of the cached results exceeds max_size,
+    the least recently used results are removed. The size is tracked by each process from the results it stores, and
+    the directory is only scanned again once the tracked size exceeds max_size, so results stored by other processes,
+    e.g. the workers of DesignProblem.batch_fitness, may take the cache over max_size until then.
+
+    Attributes:
+        directory: directory holding the cached results
+        max_size: maximum total size of the cached results [bytes]
+    """
+
+    def __init__(self, directory: str, max_size: float = 1e9):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+        self.__size = None
+
+    def key(self, analyzer, problem: "Problem") -> str:
+        """Returns the hash identifying the results of analyzer for problem, None if problem cannot be encoded
+
+        The analyzer and problem are hashed by value: numbers, strings, numpy arrays, containers and the attributes of
+        objects are encoded independently of their type of float, memory layout, dict insertion order or pickle
+        representation. Functions and classes are encoded by their qualified name, and other objects by the values
+        pickle would save for them. Problems holding objects which cannot be pickled are not cached.
+        """
+        h = hashlib.sha256()
+        try:
+            _hash_value(analyzer, h, [])
+            _hash_value(problem, h, [])
+        except _Unhashable:
+            return None
+        return h.hexdigest()
+
+    def filepath(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def load(self, key: str):
+        """Load cached results
+
+        Args:
+            key: hash identifying the results
+        Returns:
+            hit: True if the results were found in the cache
+            results: cached results, None on a cache miss
+        """
+        filepath = self.filepath(key)
+        try:
+            with open(filepath, "rb") as f:
+                results = pickle.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (EOFError, pickle.UnpicklingError):
+            self.__remove(filepath)
+            return False, None
+        # mark results as recently used
+        os.utime(filepath)
+        return True, results
+
+    def store(self, key: str, results: Any):
+        """Store results in the cache, removing least recently used results if the cache is full"""
+        try:
+            data = pickle.dumps(results, -1)
+        except Exception:
+            return
+        if self.__size is None:
+            self.evict()
+        filepath = self.filepath(key)
+        try:
+            self.__size -= os.path.getsize(filepath)
+        except FileNotFoundError:
+            pass
+        temp_filepath = filepath + "." + str(os.getpid()) + ".tmp"
+        with open(temp_filepath, "wb") as f:
+            f.write(data)
+        os.replace(temp_filepath, filepath)
+        self.__size += len(data)
+        if self.__size > self.max_size:
+            self.evict()
+
+    def evict(self):
+        """Scan the cache and remove least recently used results until the cache is within max_size"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, filepath in sorted(entries):
+            if size <= self.max_size:
+                break
+            self.__remove(filepath)
+            size -= entry_size
+        self.__size = size
+
+    def __remove(self, filepath):
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+
+
+class _Unhashable(Exception):
+    """Raised for values which ResultCache cannot encode"""
+
+
+def _hash_value(value, h, path):
+    """Feeds a canonical encoding of value to hash h
+
+    Args:
+        value: value to encode
+        h: hashlib hash object
+        path: containers and objects enclosing value, used to encode reference cycles
+    """
+    for depth, enclosing in enumerate(path):
+        if enclosing is value:
+            h.update(b"cycle%d;" % depth)
+            return
+    if value is None or isinstance(value, (bool, np.bool_)):
+        h.update(b"b" + repr(None if value is None else bool(value)).encode() + b";")
+    elif isinstance(value, (int, np.integer)):
+        h.update(b"i" + str(int(value)).encode() + b";")
+    elif isinstance(value, (float, np.floating)):
+        # 0.0 is added to encode -0.0 as 0.0
+        h.update(b"f" + repr(float(value) + 0.0).encode() + b";")
+    elif isinstance(value, (complex, np.complexfloating)):
+        h.update(b"c" + repr(complex(value) + 0.0).encode() + b";")
+    elif isinstance(value, str):
+        h.update(b"s%d:" % len(value) + value.encode("utf-8", "surrogatepass"))
+    elif isinstance(value, bytes):
+        h.update(b"y%d:" % len(value) + value)
+    elif isinstance(value, np.ndarray) and value.dtype.kind != "O":
+        h.update(b"a" + value.dtype.str.encode() + repr(value.shape).encode() + b":")
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, type) or callable(value) and hasattr(value, "__qualname__"):
+        h.update(b"q" + (getattr(value, "__module__", "") + "." + value.__qualname__).encode() + b";")
+    else:
+        path.append(value)
+        if isinstance(value, (list, tuple, np.ndarray)):
+            h.update(b"l%d:" % len(value))
+            for item in value:
+                _hash_value(item, h, path)
+        elif isinstance(value, dict):
+            # items are ordered by the hash of their key
+            items = []
+            for k, v in value.items():
+                k_hash = hashlib.sha256()
+                _hash_value(k, k_hash, path)
+                items.append((k_hash.digest(), v))
+            h.update(b"d%d:" % len(items))
+            for k_digest, v in sorted(items, key=lambda item: item[0]):
+                h.update(k_digest)
+                _hash_value(v, h, path)
+        elif isinstance(value, (set, frozenset)):
+            digests = []
+            for item in value:
+                item_hash = hashlib.sha256()
+                _hash_value(item, item_hash, path)
+                digests.append(item_hash.digest())
+            h.update(b"e%d:" % len(digests) + b"".join(sorted(digests)))
+        else:
+            # objects are encoded by the values pickle would save
+            try:
+                reduced = value.__reduce_ex__(4)
+            except Exception:
+                raise _Unhashable(type(value).__qualname__)
+            if isinstance(reduced, str):
+                h.update(b"g" + reduced.encode() + b";")
+            else:
+                # list and dict items are given as iterators
+                reduced = [list(item) if isinstance(item, Iterator) else item for item in reduced]
+                h.update(b"r")
+                _hash_value(reduced, h, path)
+        path.pop()
+
+
+class CheckpointStore:
+    """On-disk store of the partial results of designs whose evaluation has not completed
+
+    The results of each completed step of a design are saved in one pickle file per design, which is removed once
+    the evaluation completes or the design is found invalid.
+
+    Attributes:
+        directory: directory holding the checkpoints
+        design_key: Optional function returning a string identifying a design. By default designs are identified by
+            a hash of the pickled design, so that only identical designs resume from each other's checkpoints.
+    """
+
+    def __init__(self, directory: str, design_key=None):
+        self.directory = directory
+        self.design_key = design_key
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, design: Any) -> str:
+        """Returns the key identifying the checkpoint of design"""
+        if self.design_key is not None:
+            return str(self.design_key(design))
+        return hashlib.sha256(pickle.dumps(design, protocol=4)).hexdigest()
+
+    def filepath(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pkl")
+
+    def load(self, key: str) -> "EvaluationResults":
+        """Returns the results of the completed steps of a design, None if no checkpoint exists"""
+        try:
+            with open(self.filepath(key), "rb") as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save(self, key: str, full_results: "EvaluationResults"):
+        """Save the results of the completed steps of a design"""
+        temp_filepath = self.filepath(key) + "." + str(os.getpid()) + ".tmp"
+        with open(temp_filepath, "wb") as f:
+            pickle.dump(full_results, f, -1)
+        os.replace(temp_filepath, self.filepath(key))
+
+    def remove(self, key: str):
+        """Remove the checkpoint of a design"""
+        try:
+            os.remove(self.filepath(key))
+        except FileNotFoundError:
+            pass
+
+
 # class Error(Exception):
 #     """Base class for exceptions in this module."""
 
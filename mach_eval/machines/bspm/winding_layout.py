@@ -1,3 +1,281 @@
+import numpy as np
+from collections import namedtuple
+from functools import lru_cache
+from math import gcd
+
+from ...analyzers.electromagnetic.winding_factors import (
+    WindingFactorsAnalyzer,
+    WindingFactorsBatchProblem,
+)
+
+
+StarOfSlotsLayout = namedtuple(
+    "StarOfSlotsLayout",
+    [
+        "Qs",
+        "p",
+        "m",
+        "ps",
+        "no_winding_layer",
+        "y",
+        "rightlayer_phase",
+        "rightlayer_polarity",
+        "leftlayer_phase",
+        "leftlayer_polarity",
+        "grouping_a",
+        "Kw",
+        "Kw_s",
+    ],
+)
+StarOfSlotsLayout.__doc__ = """Winding layout derived from the star of slots
+
+Phases and polarities are tuples of length Qs indexed by slot. The coil whose
+right layer side lies in slot i returns through the left layer of slot
+(i + y) % Qs with the opposite polarity. grouping_a is None for windings
+without DPNV coil groups, otherwise coils in group 'a' carry the suspension
+current in the opposite direction to coils in group 'b'. Kw and Kw_s are the
+magnitudes of the torque (p) and suspension (ps) winding factors.
+"""
+
+
+def _phase_names(m):
+    return ("U", "V", "W") if m == 3 else tuple(chr(ord("A") + k) for k in range(m))
+
+
+def star_of_slots_layout(Qs, p, m=3, ps=None, no_winding_layer=2, y=None, DPNV=True):
+    """Derives a winding layout from the star of slots
+
+    Slots are assigned to the phase belts of width pi/m around the phase axes
+    of the star of slots. For DPNV windings the coils of each phase are split
+    into two groups with equal torque back-EMF so that the suspension current
+    produces no p pole pair field, choosing the split which maximizes the ps
+    pole pair suspension winding factor. Results are memoized per combination.
+
+    Args:
+        Qs (int): Number of stator slots.
+        p (int): Number of torque pole pairs.
+        m (int): Number of phases, must be odd.
+        ps (int): Number of suspension pole pairs, the better of p - 1 and
+            p + 1 if None. Ignored if DPNV is False.
+        no_winding_layer (int): Number of winding layers, 1 or 2. Single layer
+            windings are restricted to full pitch coils.
+        y (int): Coil pitch in slots, defaults to the longest pitch not
+            exceeding the full pitch for which a balanced layout exists.
+        DPNV (bool): Whether to derive the DPNV coil groups.
+
+    Returns:
+        layout (StarOfSlotsLayout): Winding layout.
+
+    Raises:
+        ValueError: if no balanced layout exists for the combination.
+    """
+    layout = _star_of_slots_layout(Qs, p, m, ps, no_winding_layer, y, DPNV)
+    if layout is None:
+        raise ValueError(
+            "No balanced %d layer winding for Qs=%d, p=%d, m=%d, ps=%s"
+            % (no_winding_layer, Qs, p, m, ps)
+        )
+    return layout
+
+
+def enumerate_winding_layouts(
+    Qs_range, p_range, m=3, ps=None, no_winding_layer=2, y=None, DPNV=True
+):
+    """Derives the winding layouts of all feasible slot and pole pair counts
+
+    Args:
+        Qs_range (iterable): Numbers of stator slots.
+        p_range (iterable): Numbers of torque pole pairs.
+        m, ps, no_winding_layer, y, DPNV: see star_of_slots_layout.
+
+    Returns:
+        layouts (list): StarOfSlotsLayout of each feasible (Qs, p) combination.
+    """
+    layouts = []
+    for Qs in Qs_range:
+        for p in p_range:
+            layout = _star_of_slots_layout(Qs, p, m, ps, no_winding_layer, y, DPNV)
+            if layout is not None:
+                layouts.append(layout)
+    return layouts
+
+
+@lru_cache(maxsize=None)
+def _star_of_slots_layout(Qs, p, m, ps, no_winding_layer, y, DPNV):
+    if m % 2 == 0 or Qs < m or p < 1 or no_winding_layer not in (1, 2):
+        return None
+    # balanced windings require the same number of spokes per phase
+    t = gcd(Qs, p)
+    if Qs % (m * t):
+        return None
+    if no_winding_layer == 1:
+        if Qs % (2 * p):
+            return None
+        y = Qs // (2 * p)
+    elif y is None:
+        # longest feasible pitch not exceeding the full pitch
+        for y in range(max(Qs // (2 * p), 1), 0, -1):
+            layout = _star_of_slots_layout(Qs, p, m, ps, no_winding_layer, y, DPNV)
+            if layout is not None:
+                return layout
+        return None
+    if not 0 < y < Qs:
+        return None
+
+    # phase belt of each slot, even belts are positive phase axes
+    slot = np.arange(Qs)
+    belt = (2 * p * m * slot // Qs) % (2 * m)
+    phase = np.where(belt % 2 == 0, belt // 2, ((belt - m) // 2) % m)
+    polarity = np.where(belt % 2 == 0, 1, -1)
+
+    # coil c runs from slot start[c] to slot end[c]
+    if no_winding_layer == 1:
+        start = slot[polarity > 0]
+        left_phase, left_polarity = phase, polarity
+    else:
+        start = slot
+        left_phase = np.roll(phase, y)
+        left_polarity = -np.roll(polarity, y)
+    end = (start + y) % Qs
+    if no_winding_layer == 1 and np.any(
+        (phase[end] != phase[start]) | (polarity[end] != -polarity[start])
+    ):
+        return None
+
+    coil_phase = phase[start]
+    coil_polarity = polarity[start]
+    torque = _coil_layouts(Qs, no_winding_layer, start, end, coil_polarity)
+    torque_u = torque * (coil_phase == 0)[:, None, None]
+    Kw = abs(_winding_factors(p, torque_u.sum(axis=0)[None])[0])
+    if Kw < 1e-9:
+        return None
+
+    grouping, Kw_s = None, 0.0
+    if DPNV:
+        if ps is None:
+            candidates = [q for q in (p - 1, p + 1) if q > 0]
+        else:
+            candidates = [ps]
+        best = None
+        for q in candidates:
+            group = _dpnv_groups(Qs, p, m, q, torque, coil_phase)
+            if group is not None and (best is None or group[1] > best[1] + 1e-9):
+                best = group + (q,)
+        if best is None:
+            return None
+        coil_group, Kw_s, ps = best
+        # both sides of a single layer coil share the group of the coil
+        grouping = np.empty(Qs, dtype="<U1")
+        grouping[end] = np.where(coil_group, "a", "b")
+        grouping[start] = np.where(coil_group, "a", "b")
+        grouping = tuple(grouping.tolist())
+
+    names = _phase_names(m)
+    signs = {1: "+", -1: "-"}
+    return StarOfSlotsLayout(
+        Qs=Qs,
+        p=p,
+        m=m,
+        ps=ps if DPNV else None,
+        no_winding_layer=no_winding_layer,
+        y=y,
+        rightlayer_phase=tuple(names[k] for k in phase),
+        rightlayer_polarity=tuple(signs[k] for k in polarity),
+        leftlayer_phase=tuple(names[k] for k in left_phase),
+        leftlayer_polarity=tuple(signs[k] for k in left_polarity),
+        grouping_a=grouping,
+        Kw=float(Kw),
+        Kw_s=float(Kw_s),
+    )
+
+
+def _coil_layouts(Qs, no_winding_layer, start, end, coil_polarity):
+    """Layout of each coil with shape (coils, layers, slots)"""
+    coils = np.arange(len(start))
+    layouts = np.zeros((len(start), no_winding_layer, Qs))
+    layouts[coils, 0, start] = coil_polarity
+    layouts[coils, no_winding_layer - 1, end] = -coil_polarity
+    return layouts
+
+
+def _winding_factors(n, layouts):
+    problem = WindingFactorsBatchProblem([n], layouts, 0)
+    return WindingFactorsAnalyzer().analyze_batch(problem)[:, 0]
+
+
+def _dpnv_groups(Qs, p, m, ps, torque, coil_phase):
+    """Splits the coils of each phase into DPNV groups a and b
+
+    Coils are assigned to group a when their ps pole pair phasor points away
+    from the suspension axis of their phase. The suspension axes are swept over
+    all offsets giving distinct splits for both phase sequences; splits with
+    unequal group back-EMF or asymmetric suspension phases are rejected.
+
+    Returns:
+        (group, Kw_s): boolean group a flag per coil and suspension winding
+            factor of the best split, None if no split is balanced
+    """
+    coil_p = _winding_factors(p, torque)
+    coil_ps = _winding_factors(ps, torque)
+
+    # coil angles relative to the suspension axis of their phase
+    seq = np.array([1, -1])[:, None]
+    rel = np.angle(coil_ps) - seq * 2 * np.pi * coil_phase / m
+    # group membership only changes where a coil is normal to its axis, so
+    # one offset between each pair of consecutive edges covers all splits
+    edges = np.sort(np.mod(np.hstack((rel + np.pi / 2, rel - np.pi / 2)), 2 * np.pi))
+    offset = (edges + np.hstack((edges[:, 1:], edges[:, :1] + 2 * np.pi))) / 2
+    group = np.cos(rel[:, None, :] - offset[:, :, None]) < 0
+    group = group.reshape(-1, len(coil_phase))
+    # coil groups are interchangeable, keep the first coil in group b
+    group = group ^ group[:, :1]
+
+    sign = np.where(group, -1, 1)
+    per_phase = coil_phase == np.arange(m)[:, None]
+    # equal back-EMF and number of coils in both groups of each phase
+    emf = (sign * coil_p) @ per_phase.T
+    count = sign @ per_phase.T
+    suspension = np.abs((sign * coil_ps) @ per_phase.T)
+    n_coils = per_phase.sum(axis=1)
+    balanced = (
+        np.all(np.abs(emf) < 1e-9, axis=1)
+        & np.all(count == 0, axis=1)
+        & np.all(np.abs(suspension - suspension[:, :1]) < 1e-9, axis=1)
+        & (suspension[:, 0] > 1e-9)
+    )
+    if not balanced.any():
+        return None
+    Kw_s = suspension[:, 0] / n_coils[0]
+    best = np.argmax(np.where(balanced, Kw_s, -1))
+    return group[best], Kw_s[best]
+
+
+def _excitation_bias_compensation_deg(layout):
+    """Initial excitation bias compensation of a layout in mechanical degrees
+
+    The stator is drawn with a tooth on the x-axis, so slot k (from 0) is
+    centred at (k + 0.5) * 360 / Qs. The angle of the p pole pair winding
+    factor of phase U gives the centre of its positive coil sides, and the
+    compensation lies 90 electrical degrees behind it, as the U phase current
+    is zero at t = 0. The result is wrapped into [-180 / p, 180 / p).
+    """
+    Qs, p = layout.Qs, layout.p
+    u_phase = _phase_names(layout.m)[0]
+    sign = {"+": 1, "-": -1}
+    layers = (
+        (layout.rightlayer_phase, layout.rightlayer_polarity),
+        (layout.leftlayer_phase, layout.leftlayer_polarity),
+    )[: layout.no_winding_layer]
+    u_layout = np.array([
+        [sign[pol] if ph == u_phase else 0 for ph, pol in zip(phases, polarities)]
+        for phases, polarities in layers
+    ])
+    k_w = _winding_factors(p, u_layout[None])[0]
+    if abs(k_w) < 1e-9:
+        raise ValueError("Phase U links no p pole pair flux")
+    deg = -np.degrees(np.angle(k_w)) / p + 180 / Qs - 90 / p
+    return round(float((deg + 180 / p) % (360 / p) - 180 / p), 9)
+
 
 class WindingLayout(object):
     def __init__(self, DPNV_or_SEPA, Qs, p, ps=None):
@@ -152,11 +430,10 @@ class WindingLayout(object):
 
         # combined winding
         # concentrated winding
-        ps = 5 # ps should be specified in future revision
         if DPNV_or_SEPA == True \
         and Qs == 12 \
         and p == 4 \
-        and ps == 5:
+        and ps in (None, 5):
             # DPNV winding implemented as DPNV winding (GroupAC means it experiences flip phasor excitation from suspension inverter, while GroupBD does not.)
             # self.rightlayer_phase = ['U', 'V', 'W', 'U', 'V', 'W', 'U', 'V', 'W', 'U', 'V', 'W'] # torque winding right layer
             # self.rightlayer_polarity = ['+', '+', '+', '+', '+', '+', '+', '+', '+', '+', '+', '+'] # This configuration gives negative torque
@@ -221,12 +498,54 @@ class WindingLayout(object):
             self.l21 = self.leftlayer_phase
             self.l22 = self.leftlayer_polarity
 
-        try: 
-            self.y
+        # any other winding is derived from the star of slots
+        if not hasattr(self, 'rightlayer_phase'):
+            self.from_star_of_slots(DPNV_or_SEPA, Qs, p, ps)
+        elif not hasattr(self, 'y'):
+            self.y = self.coil_pitch
             # self.distributed_or_concentrated = False if abs(self.y) == 1 else True
-        except:
+
+    def from_star_of_slots(self, DPNV_or_SEPA, Qs, p, ps=None):
+        """Sets the winding attributes from the star of slots layout
+
+        Separate windings use a single layer torque winding where possible.
+
+        Raises:
+            Exception: if no balanced winding exists for Qs and p.
+        """
+        layers = (2,) if DPNV_or_SEPA else (1, 2)
+        for no_winding_layer in layers:
+            layout = _star_of_slots_layout(
+                Qs, p, 3, ps, no_winding_layer, None, bool(DPNV_or_SEPA)
+            )
+            if layout is not None:
+                break
+        else:
             raise Exception('Error: Not implemented for this winding.')
 
+        self.rightlayer_phase = list(layout.rightlayer_phase)
+        self.rightlayer_polarity = list(layout.rightlayer_polarity)
+        self.leftlayer_phase = list(layout.leftlayer_phase)
+        self.leftlayer_polarity = list(layout.leftlayer_polarity)
+        if DPNV_or_SEPA:
+            self.grouping_a = list(layout.grouping_a)
+        self.ps = layout.ps
+        self.coil_pitch = layout.y
+        self.y = layout.y
+        self.Kw = layout.Kw
+        self.CommutatingSequenceD = 1
+        self.CommutatingSequenceB = 0
+        self.number_parallel_branch = 2. if DPNV_or_SEPA else 1.
+        self.bool_3PhaseCurrentSource = not DPNV_or_SEPA
+        self.no_winding_layer = layout.no_winding_layer
+        self.initial_excitation_bias_compensation_deg = _excitation_bias_compensation_deg(layout)
+
+        # backward compatibility
+        self.l41 = self.rightlayer_phase
+        self.l42 = self.rightlayer_polarity
+        self.l21 = self.leftlayer_phase
+        self.l22 = self.leftlayer_polarity
+
 
         # # combined winding
         # if DPNV_or_SEPA == True \
@@ -0,0 +1,73 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.electromagnetic.bfield_outer_stator import (
+    BFieldOuterStatorProblem1,
+    BFieldOuterStatorProblem3,
+)
+from mach_eval.analyzers.electromagnetic.winding_factors import (
+    WindingFactorsAnalyzer,
+    WindingFactorsBatchProblem,
+)
+from mach_eval.machines.bspm.winding_layout import star_of_slots_layout
+
+
+def phase_layouts(layout):
+    """Winding layout of each phase with shape (phases, layers, slots)"""
+    sign = {"+": 1, "-": -1}
+    layers = [
+        (layout.rightlayer_phase, layout.rightlayer_polarity),
+        (layout.leftlayer_phase, layout.leftlayer_polarity),
+    ]
+    return np.array([
+        [[sign[pol] if ph == name else 0 for ph, pol in zip(phases, polarities)]
+         for phases, polarities in layers]
+        for name in "UVW"
+    ])
+
+
+class TestBFieldOuterStatorProblem3(unittest.TestCase):
+    def setUp(self):
+        layout = star_of_slots_layout(24, 2)
+        self.layouts = phase_layouts(layout)
+        self.Q, self.p = layout.Qs, layout.p
+        self.zq, self.I_hat, self.alpha_1 = 10, 5.0, 0.1
+        self.args = dict(delta_e=1e-3, r_si=20e-3, r_rfe=15e-3, alpha_so=0.1)
+
+    def test_matches_problem1_for_balanced_currents(self):
+        # p and slot harmonics of the balanced winding
+        n = np.array([self.p, self.Q - self.p, self.Q + self.p, 2 * self.Q - self.p])
+        currents = self.I_hat * np.cos(2 * np.pi / 3 * np.arange(3))
+        problem3 = BFieldOuterStatorProblem3(
+            self.layouts, self.zq, currents, self.alpha_1, n, **self.args
+        )
+
+        k_w = WindingFactorsAnalyzer().analyze_batch(
+            WindingFactorsBatchProblem(n, self.layouts[:1], self.alpha_1)
+        )[0]
+        coils_per_phase = np.count_nonzero(self.layouts[0]) / 2
+        problem1 = BFieldOuterStatorProblem1(
+            3, self.zq, coils_per_phase, k_w, self.I_hat, n, **self.args
+        )
+        np.testing.assert_allclose(problem3.MMF, problem1.MMF, rtol=1e-12, atol=1e-12)
+
+    def test_instants_lead_harmonics(self):
+        n = np.array([self.p, self.Q - self.p])
+        wt = np.linspace(0, 2 * np.pi, 4, endpoint=False)[:, None]
+        currents = self.I_hat * np.cos(wt - 2 * np.pi / 3 * np.arange(3))
+        mmf = BFieldOuterStatorProblem3(
+            self.layouts, self.zq, currents, self.alpha_1, n, **self.args
+        ).MMF
+        self.assertEqual(mmf.shape, (4, 2))
+        for i in range(4):
+            single = BFieldOuterStatorProblem3(
+                self.layouts, self.zq, currents[i], self.alpha_1, n, **self.args
+            ).MMF
+            np.testing.assert_allclose(mmf[i], single, rtol=1e-12)
+        # a balanced winding produces a rotating field of constant amplitude
+        np.testing.assert_allclose(np.abs(mmf), np.abs(mmf[:1]).repeat(4, axis=0), rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
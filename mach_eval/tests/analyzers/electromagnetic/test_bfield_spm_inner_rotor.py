@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.electromagnetic.bfield_spm_inner_rotor import (
+    BFieldSPM_InnerRotor,
+)
+
+
+def make_field(p=2, theta=0.3, mag_dir="parallel"):
+    return BFieldSPM_InnerRotor(
+        alpha_p=0.9, theta=theta, p=p, muR=1.05, Br=1.2, r_fe=10e-3, dm=3e-3, delta=2e-3, mag_dir=mag_dir
+    )
+
+
+def radial_reference(field, r, vp):
+    """EQUATION 15a evaluated one harmonic at a time for radial magnetization and vp > 1"""
+    p, muR, alpha_p, Br = field.p, field.muR, field.alpha_p, field.Br
+    r_fe, Rmo, Rsi = field.r_fe, field.Rmo, field.Rsi
+    b = np.zeros(len(vp), dtype=complex)
+    for i, v in enumerate(vp):
+        if (v / p) % 2 == 0:
+            continue
+        Mv = 2 * Br * alpha_p * np.sin(v / p * np.pi * alpha_p / 2) / (v / p * np.pi * alpha_p / 2)
+        c3v = v
+        Bov = (
+            (Mv * v / (muR * v**2 - 1))
+            * (c3v - 1 + 2 * (r_fe / Rmo) ** (v + 1) - (c3v + 1) * (r_fe / Rmo) ** (2 * v))
+            * muR
+            / ((muR + 1) * (1 - (r_fe / Rsi) ** (2 * v)) - (muR - 1) * ((Rmo / Rsi) ** (2 * v) - (r_fe / Rmo) ** (2 * v)))
+        )
+        r_fac = (r / Rsi) ** (v - 1) * (Rmo / Rsi) ** (v + 1) + (Rmo / r) ** (v + 1)
+        b[i] = Bov * r_fac * np.exp(-1j * field.theta * v)
+    return b
+
+
+class TestBFieldSPM_InnerRotor(unittest.TestCase):
+    def test_matches_per_harmonic_formula(self):
+        field = make_field(p=2, mag_dir="radial")
+        vp = 2 * np.arange(1, 15)
+        for r in (11e-3, 14e-3):
+            np.testing.assert_allclose(field.radial_harmonics(r, vp), radial_reference(field, r, vp), rtol=1e-12)
+
+    def test_even_harmonics_vanish(self):
+        field = make_field(p=2)
+        vp = 2 * np.arange(1, 15)
+        b = field.radial_harmonics(None, vp)
+        np.testing.assert_array_equal(b[1::2], 0)
+        self.assertTrue(np.all(b[::2] != 0))
+
+    def test_default_radius_is_stator_bore(self):
+        field = make_field()
+        np.testing.assert_array_equal(field.radial_harmonics(), field.radial_harmonics(field.Rsi))
+        np.testing.assert_array_equal(field.tan_harmonics(), field.tan_harmonics(field.Rsi))
+
+    def test_array_of_radii(self):
+        field = make_field(p=1)
+        alpha = np.linspace(0, 2 * np.pi, 90, endpoint=False)
+        r = np.array([11e-3, 12.5e-3, 14e-3])
+        b_radial = field.radial(alpha, r)
+        b_tan = field.tan(alpha, r)
+        self.assertEqual(b_radial.shape, (3, 90))
+        for i, r_i in enumerate(r):
+            np.testing.assert_allclose(b_radial[i], field.radial(alpha, r_i), atol=1e-14)
+            np.testing.assert_allclose(b_tan[i], field.tan(alpha, r_i), atol=1e-14)
+
+    def test_array_of_rotor_orientations(self):
+        theta = np.linspace(0, np.pi / 2, 5)
+        alpha = np.linspace(0, 2 * np.pi, 90, endpoint=False)
+        b_radial = make_field(theta=theta).radial(alpha)
+        self.assertEqual(b_radial.shape, (5, 90))
+        for i, theta_i in enumerate(theta):
+            np.testing.assert_allclose(b_radial[i], make_field(theta=theta_i).radial(alpha), atol=1e-14)
+
+    def test_rotor_orientations_and_radii(self):
+        theta = np.linspace(0, np.pi / 2, 5)
+        r = np.array([11e-3, 12.5e-3, 14e-3])
+        alpha = np.linspace(0, 2 * np.pi, 90, endpoint=False)
+        field = make_field(theta=theta)
+        self.assertEqual(field.radial_harmonics(r).shape, (5, 3, 7))
+        self.assertEqual(field.tan_harmonics(r).shape, (5, 3, 7))
+        b_radial = field.radial(alpha, r)
+        b_tan = field.tan(alpha, r)
+        self.assertEqual(b_radial.shape, (5, 3, 90))
+        for i, theta_i in enumerate(theta):
+            for j, r_j in enumerate(r):
+                single = make_field(theta=theta_i)
+                np.testing.assert_allclose(b_radial[i, j], single.radial(alpha, r_j), atol=1e-14)
+                np.testing.assert_allclose(b_tan[i, j], single.tan(alpha, r_j), atol=1e-14)
+
+    def test_rotation(self):
+        # turning the rotor by one pole pitch reverses the field
+        alpha = np.linspace(0, 2 * np.pi, 90, endpoint=False)
+        b = make_field(p=2, theta=0.0).radial(alpha)
+        np.testing.assert_allclose(make_field(p=2, theta=np.pi / 2).radial(alpha), -b, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+import unittest
+
+import numpy as np
+
+from mach_eval import AnalysisStep, Conditions, MachineDesign, State
+from mach_eval.analyzers.electromagnetic.bspm_maxwell_stress import (
+    BSPM_MaxwellStressProblem,
+    BSPM_MaxwellStressProblemDefinition,
+    BSPM_MaxwellStressPostAnalyzer,
+)
+from mach_eval.analyzers.electromagnetic.maxwell_stress import MaxwellStressAnalyzer
+from mach_eval.machines.bspm import BSPM_Machine, BSPM_Machine_Oper_Pt
+from mach_eval.machines.bspm.winding_layout import star_of_slots_layout
+from mach_eval.machines.materials.electric_steels import Arnon5
+from mach_eval.machines.materials.jmag_library_magnets import N40H
+from mach_eval.machines.materials.miscellaneous_materials import (
+    CarbonFiber,
+    Steel,
+    Copper,
+    Hub,
+    Air,
+)
+
+# dimensions and winding of the ECCE 2020 prototype with p = 1 and ps = 2
+DIMENSIONS = {
+    "alpha_st": 44.5,
+    "d_so": 0.00542,
+    "w_st": 0.00909,
+    "d_st": 0.0169,
+    "d_sy": 0.0135,
+    "alpha_m": 178.78,
+    "d_m": 0.00371,
+    "d_mp": 0.00307,
+    "d_ri": 0.00489,
+    "alpha_so": 22.25,
+    "d_sp": 0.00813,
+    "r_si": 0.01416,
+    "alpha_ms": 178.78,
+    "d_ms": 0,
+    "r_sh": 0.00281,
+    "l_st": 0.0115,
+    "d_sl": 0.00067,
+    "delta_sl": 0.00011,
+}
+PARAMETERS = {
+    "p": 1,
+    "ps": 2,
+    "n_m": 1,
+    "Q": 6,
+    "rated_speed": 16755.16,
+    "rated_power": 5500.0,
+    "rated_voltage": 240,
+    "rated_current": 10.0,
+    "name": "ECCE2020",
+}
+MATERIALS = {
+    "air_mat": Air,
+    "rotor_iron_mat": Arnon5,
+    "stator_iron_mat": Arnon5,
+    "magnet_mat": N40H,
+    "rotor_sleeve_mat": CarbonFiber,
+    "coil_mat": Copper,
+    "shaft_mat": Steel,
+    "rotor_hub": Hub,
+}
+WINDING = {
+    "no_of_layers": 2,
+    "layer_phases": [["U", "W", "V", "U", "W", "V"], ["W", "V", "U", "W", "V", "U"]],
+    "layer_polarity": [["+", "-", "+", "-", "+", "-"], ["-", "+", "-", "+", "-", "+"]],
+    "coil_groups": ["b", "a", "b", "a", "b", "a"],
+    "pitch": 2,
+    "Z_q": 49,
+    "Kov": 1.8,
+    "Kcu": 0.5,
+    "phase_current_offset": 0,
+}
+
+
+def make_machine():
+    return BSPM_Machine(DIMENSIONS, PARAMETERS, MATERIALS, WINDING)
+
+
+def make_p2_ps1_machine():
+    """Concentrated winding machine with p = 2 and ps = 1"""
+    layout = star_of_slots_layout(6, 2, ps=1, y=1)
+    winding = dict(
+        WINDING,
+        layer_phases=[list(layout.rightlayer_phase), list(layout.leftlayer_phase)],
+        layer_polarity=[list(layout.rightlayer_polarity), list(layout.leftlayer_polarity)],
+        coil_groups=list(layout.grouping_a),
+        pitch=1,
+    )
+    dimensions = dict(DIMENSIONS, alpha_m=89.0, alpha_ms=89.0)
+    parameters = dict(PARAMETERS, p=2, ps=1)
+    return BSPM_Machine(dimensions, parameters, MATERIALS, winding)
+
+
+def analyze(machine, **currents):
+    problem = BSPM_MaxwellStressProblem(machine, BSPM_Machine_Oper_Pt(**currents))
+    return MaxwellStressAnalyzer().analyze(problem)
+
+
+class TestBSPM_MaxwellStressProblem(unittest.TestCase):
+    def test_winding_layouts_split_coil_groups(self):
+        machine = make_machine()
+        layouts = BSPM_MaxwellStressProblem.winding_layouts(machine)
+        self.assertEqual(layouts.shape, (2, 3, 2, 6))
+        # each coil side belongs to one phase of one group
+        np.testing.assert_array_equal(np.abs(layouts).sum(axis=(0, 1)), np.ones((2, 6)))
+        # the coil of group 'b' in slot 0 of phase U returns through slot 2
+        self.assertEqual(layouts[1, 0, 0, 0], 1)
+        self.assertEqual(layouts[1, 0, 1, 2], -1)
+
+    def test_torque_follows_q_axis_current(self):
+        machine = make_machine()
+        full = analyze(machine, Iq=0.95, Iy=0)
+        half = analyze(machine, Iq=0.475, Iy=0)
+        reverse = analyze(machine, Iq=-0.95, Iy=0)
+        self.assertGreater(full["torque_avg"], 0)
+        self.assertAlmostEqual(half["torque_avg"], full["torque_avg"] / 2)
+        self.assertAlmostEqual(reverse["torque_avg"], -full["torque_avg"])
+        # d-axis current does not produce torque
+        self.assertAlmostEqual(analyze(machine, Iq=0, Id=0.5, Iy=0)["torque_avg"], 0)
+        self.assertAlmostEqual(full["force_avg"], 0)
+
+    def test_force_follows_suspension_current(self):
+        for machine in (make_machine(), make_p2_ps1_machine()):
+            with self.subTest(p=machine.p, ps=machine.ps):
+                for Ix, Iy in [(0.5, 0), (0, 0.5), (0.3, -0.4)]:
+                    results = analyze(machine, Iq=0, Ix=Ix, Iy=Iy)
+                    direction = np.arctan2(results["Fy"], results["Fx"])
+                    self.assertAlmostEqual(direction, np.arctan2(Iy, Ix), places=3)
+                    self.assertGreater(results["force_avg"], 0)
+
+    def test_rejects_suspension_pole_pairs(self):
+        machine = make_machine().clone(parameters_dict={"ps": 3})
+        with self.assertRaises(ValueError):
+            BSPM_MaxwellStressProblem(machine, BSPM_Machine_Oper_Pt())
+
+
+class TestBSPM_MaxwellStressStep(unittest.TestCase):
+    def test_step_returns_em_conditions(self):
+        machine = make_machine()
+        state = State(MachineDesign(machine, BSPM_Machine_Oper_Pt()), Conditions())
+        step = AnalysisStep(
+            BSPM_MaxwellStressProblemDefinition,
+            MaxwellStressAnalyzer(),
+            BSPM_MaxwellStressPostAnalyzer,
+        )
+        results, state_out = step.step(state)
+
+        em = state_out.conditions.em
+        for key in ("torque_avg", "torque_ripple", "Fx", "Fy", "force_avg", "Em", "Ea"):
+            self.assertEqual(em[key], results[key])
+        rotor_weight = (
+            machine.V_rfe * Arnon5["core_material_density"]
+            + machine.V_sh * Steel["shaft_material_density"]
+            + machine.V_rPM * N40H["magnet_material_density"]
+        )
+        self.assertAlmostEqual(em["FRW"], results["force_avg"] / rotor_weight)
+        self.assertGreater(em["copper_loss"], 0)
+        self.assertAlmostEqual(state_out.conditions.Q_coil, em["copper_loss"] / machine.Q)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.electromagnetic.bfield_protocol import field_from_harmonics
+
+
+def direct_sum(fields, n, alpha):
+    """Sum of |fields| * cos(n * alpha + angle(fields)) over all harmonics"""
+    return np.sum(np.abs(fields)[..., None] * np.cos(np.outer(n, alpha) + np.angle(fields)[..., None]), axis=-2)
+
+
+class TestFieldFromHarmonics(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.n = np.arange(1, 80, 2)
+        self.fields = rng.standard_normal((3, len(self.n))) + 1j * rng.standard_normal((3, len(self.n)))
+
+    def check(self, alpha, n=None):
+        n = self.n if n is None else n
+        fields = self.fields[:, : len(n)]
+        field = field_from_harmonics(fields, n, alpha)
+        self.assertEqual(field.shape, (3, len(alpha)))
+        np.testing.assert_allclose(field, direct_sum(fields, n, alpha), atol=1e-10)
+
+    def test_full_period(self):
+        self.check(np.linspace(0, 2 * np.pi, 720, endpoint=False))
+
+    def test_shifted_partial_period(self):
+        self.check(np.pi / 7 + np.arange(100) * 2 * np.pi / 360)
+
+    def test_multiple_periods(self):
+        self.check(np.arange(1000) * 2 * np.pi / 360)
+
+    def test_harmonics_above_nyquist(self):
+        # harmonics fold onto the 64 points per period
+        self.check(np.linspace(0, 2 * np.pi, 64, endpoint=False))
+
+    def test_non_uniform_grid(self):
+        self.check(np.sort(np.random.default_rng(1).uniform(0, 2 * np.pi, 200)))
+
+    def test_non_integer_harmonics(self):
+        self.check(np.linspace(0, 2 * np.pi, 720, endpoint=False), n=self.n + 0.5)
+
+    def test_single_field(self):
+        alpha = np.linspace(0, 2 * np.pi, 360, endpoint=False)
+        field = field_from_harmonics(self.fields[0], self.n, alpha)
+        self.assertEqual(field.shape, (360,))
+        np.testing.assert_allclose(field, direct_sum(self.fields[0], self.n, alpha), atol=1e-10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.electromagnetic.bfield_spm_inner_rotor import (
+    BFieldSPM_InnerRotor,
+)
+from mach_eval.analyzers.electromagnetic.bfield_outer_stator import BFieldOuterStator
+from mach_eval.analyzers.electromagnetic.maxwell_stress import (
+    MaxwellStressProblem,
+    MaxwellStressAnalyzer,
+)
+
+
+def make_rotor_field(theta=0.0):
+    return BFieldSPM_InnerRotor(
+        alpha_p=0.9, theta=theta, p=2, muR=1.05, Br=1.2, r_fe=10e-3, dm=3e-3, delta=2e-3, mag_dir="radial"
+    )
+
+
+def make_stator_field(rotor):
+    n = np.array([2])
+    mmf = np.array([500 * np.exp(-1j * np.pi / 2)])
+    return BFieldOuterStator(mmf, n, delta_e=rotor.Rsi - rotor.Rmo, r_si=rotor.Rsi, r_rfe=rotor.r_fe, alpha_so=0.1)
+
+
+class TestMaxwellStressAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.rotor = make_rotor_field()
+        self.stator = make_stator_field(self.rotor)
+        self.analyzer = MaxwellStressAnalyzer()
+
+    def test_default_radius_is_stator_bore(self):
+        fields = [self.rotor, self.stator]
+        default = self.analyzer.analyze(MaxwellStressProblem(fields, l_st=0.05))
+        at_bore = self.analyzer.analyze(MaxwellStressProblem(fields, l_st=0.05, r=self.rotor.Rsi))
+        np.testing.assert_allclose(at_bore["torque"], default["torque"])
+        self.assertNotEqual(default["torque"], 0)
+
+    def test_rejects_radius_off_bore_with_stator_field(self):
+        r = self.rotor.Rmo + 0.5 * (self.rotor.Rsi - self.rotor.Rmo)
+        problem = MaxwellStressProblem([self.rotor, self.stator], l_st=0.05, r=r)
+        with self.assertRaises(ValueError):
+            self.analyzer.analyze(problem)
+
+    def test_torque_of_single_harmonic_pair(self):
+        # T = pi r^2 l / mu0 |B_r||B_t| cos(phi_r - phi_t) for p harmonics alone
+        mu0 = 4 * np.pi * 1e-7
+        theta = np.linspace(0, np.pi, 16, endpoint=False)
+        rotor = make_rotor_field(theta)
+        results = self.analyzer.analyze(MaxwellStressProblem([rotor, self.stator], l_st=0.05))
+
+        B_r = rotor.radial_harmonics(harmonics=np.array([2]))[:, 0]
+        B_t = self.stator.tangential_harmonics()[0]
+        expected = (
+            np.pi * rotor.Rsi**2 * 0.05 / mu0 * np.abs(B_r) * np.abs(B_t)
+            * np.cos(np.angle(B_r) - np.angle(B_t))
+        )
+        np.testing.assert_allclose(results["torque"], expected, rtol=1e-9, atol=1e-12)
+        # the torque changes sign as the rotor turns against the stator field
+        self.assertGreater(expected.max(), 0)
+        self.assertLess(expected.min(), 0)
+
+    def test_suspension_force_of_p_and_ps_fields(self):
+        # radial R, S and tangential T harmonics of the p and ps fields give a
+        # force pi r l / (2 mu0) R conj(S - jT) for ps = p + 1 and
+        # pi r l / (2 mu0) conj(R) (S + jT) for ps = p - 1
+        mu0 = 4 * np.pi * 1e-7
+        theta = np.linspace(0, np.pi, 16, endpoint=False)
+        rotor = make_rotor_field(theta)
+        R = rotor.radial_harmonics(harmonics=np.array([2]))[:, 0]
+        for ps in (1, 3):
+            with self.subTest(ps=ps):
+                stator = BFieldOuterStator(
+                    np.array([300 * np.exp(0.7j)]),
+                    np.array([ps]),
+                    delta_e=rotor.Rsi - rotor.Rmo,
+                    r_si=rotor.Rsi,
+                    r_rfe=rotor.r_fe,
+                    alpha_so=0.1,
+                )
+                results = self.analyzer.analyze(MaxwellStressProblem([rotor, stator], l_st=0.05))
+                S = stator.radial_harmonics()[0]
+                T = stator.tangential_harmonics()[0]
+                if ps == 3:
+                    force = R * np.conj(S - 1j * T)
+                else:
+                    force = np.conj(R) * (S + 1j * T)
+                force = force * np.pi * rotor.Rsi * 0.05 / (2 * mu0)
+                np.testing.assert_allclose(results["force_x"], force.real, rtol=1e-9, atol=1e-9)
+                np.testing.assert_allclose(results["force_y"], force.imag, rtol=1e-9, atol=1e-9)
+                self.assertGreater(np.abs(force).min(), 1)
+
+    def test_rotor_field_alone_accepts_any_radius(self):
+        # a rotor field alone exerts no torque or force on itself at any radius
+        r = self.rotor.Rmo + 0.5 * (self.rotor.Rsi - self.rotor.Rmo)
+        results = self.analyzer.analyze(MaxwellStressProblem([self.rotor], l_st=0.05, r=r))
+        self.assertAlmostEqual(float(results["torque"]), 0, places=9)
+        self.assertAlmostEqual(float(results["force_x"]), 0, places=9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.electromagnetic.winding_factors import (
+    WindingFactorsProblem,
+    WindingFactorsBatchProblem,
+    WindingFactorsAnalyzer,
+)
+
+
+def reference_winding_factors(harmonics, winding_layout, alpha_1):
+    """Sum over the slots of each layer, one layout at a time"""
+    Q = winding_layout.shape[1]
+    slot = np.arange(Q)[:, None]
+    slot_exp = np.exp(-1j * np.asarray(harmonics) * (slot * 2 * np.pi / Q + alpha_1))
+    k_w = sum(np.sum(layer[:, None] * slot_exp, axis=0) for layer in winding_layout)
+    return k_w / np.count_nonzero(winding_layout)
+
+
+class TestWindingFactorsAnalyzerBatch(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.harmonics = np.array([1, 2, 4, 5, 7, 2.5])
+        self.alpha_1 = 0.2
+        # U phase of a Q12p4 concentrated winding and random layouts
+        concentrated = np.array([[1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0],
+                                 [0, -1, 0, 0, -1, 0, 0, -1, 0, 0, -1, 0]])
+        self.double_layer = np.concatenate(
+            (concentrated[None], rng.integers(-1, 2, size=(7, 2, 12)))
+        )
+        self.single_layer = rng.integers(-1, 2, size=(5, 1, 12))
+        # each layout needs at least one coil side
+        self.double_layer[:, 0, 0] = 1
+        self.single_layer[:, 0, 0] = 1
+
+    def test_matches_calculations(self):
+        analyzer = WindingFactorsAnalyzer()
+        for layouts in (self.double_layer, self.single_layer):
+            problem = WindingFactorsBatchProblem(self.harmonics, layouts, self.alpha_1)
+            k_w = analyzer.analyze_batch(problem)
+            self.assertEqual(k_w.shape, (len(layouts), len(self.harmonics)))
+            for layout, k_w_i in zip(layouts, k_w):
+                single = WindingFactorsProblem(self.harmonics, layout, self.alpha_1)
+                np.testing.assert_allclose(k_w_i, analyzer.analyze(single), atol=1e-14)
+                np.testing.assert_allclose(
+                    k_w_i, reference_winding_factors(self.harmonics, layout, self.alpha_1), atol=1e-14
+                )
+
+    def test_concentrated_winding_factor(self):
+        problem = WindingFactorsBatchProblem([4], self.double_layer[:1], 0)
+        k_w = WindingFactorsAnalyzer().analyze_batch(problem)
+        self.assertAlmostEqual(abs(k_w[0, 0]), 0.866, places=3)
+
+    def test_three_layers_only_in_batch(self):
+        layouts = np.concatenate((self.double_layer[:, :1], self.double_layer), axis=1)
+        problem = WindingFactorsBatchProblem(self.harmonics, layouts, self.alpha_1)
+        k_w = WindingFactorsAnalyzer().analyze_batch(problem)
+        for layout, k_w_i in zip(layouts, k_w):
+            np.testing.assert_allclose(
+                k_w_i, reference_winding_factors(self.harmonics, layout, self.alpha_1), atol=1e-14
+            )
+        with self.assertRaises(Exception):
+            WindingFactorsAnalyzer().analyze(WindingFactorsProblem(self.harmonics, layouts[0], self.alpha_1))
+
+
+if __name__ == "__main__":
+    unittest.main()
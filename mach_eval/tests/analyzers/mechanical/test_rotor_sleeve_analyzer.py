@@ -0,0 +1,110 @@
+import contextlib
+import io
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.rotor_structural import (
+    SPM_RotorSleeveProblem,
+    SPM_RotorSleeveAnalyzer,
+    SPM_RotorStructuralProblem,
+)
+from mach_eval.machines.materials.electric_steels import Arnon5
+from mach_eval.machines.materials.jmag_library_magnets import N40H
+from mach_eval.machines.materials.miscellaneous_materials import CarbonFiber, Steel
+
+mat_dict = {**Arnon5, **N40H, **CarbonFiber, **Steel}
+stress_limits = {
+    "rad_sleeve": -100e6,
+    "tan_sleeve": 1300e6,
+    "rad_magnets": 0,
+    "tan_magnets": 80e6,
+}
+
+
+def design(problem, method):
+    # the "minimize" method prints the optimizer output
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SPM_RotorSleeveAnalyzer(stress_limits, method=method).analyze(problem)
+
+
+class TestSPM_RotorSleeveAnalyzerBracket(unittest.TestCase):
+    def assertFeasible(self, problem, x):
+        self.assertGreaterEqual(problem.rad_sleeve(x), stress_limits["rad_sleeve"] - 1)
+        self.assertLessEqual(problem.rad_sleeve(x), 1)
+        self.assertLessEqual(problem.tan_sleeve(x), stress_limits["tan_sleeve"] + 1)
+        self.assertLessEqual(problem.rad_magnet(x), stress_limits["rad_magnets"] + 1)
+        self.assertLessEqual(problem.tan_magnet(x), stress_limits["tan_magnets"] + 1)
+
+    def test_matches_minimize(self):
+        for r_sh, d_m, r_ro, deltaT, N in [(5e-3, 3e-3, 12.5e-3, 0, 100e3), (3e-3, 4e-3, 15e-3, 50, 80e3)]:
+            problem = SPM_RotorSleeveProblem(r_sh, d_m, r_ro, deltaT, mat_dict, N)
+            x_min = design(problem, "minimize")
+            x_br = design(problem, "bracket")
+            np.testing.assert_allclose(x_br, x_min, rtol=1e-4)
+            self.assertFeasible(problem, x_br)
+
+    def test_not_thicker_than_minimize(self):
+        for N in (50e3, 150e3):
+            problem = SPM_RotorSleeveProblem(5e-3, 3e-3, 12.5e-3, 0, mat_dict, N)
+            x_min = design(problem, "minimize")
+            x_br = design(problem, "bracket")
+            self.assertLessEqual(x_br[0], x_min[0] + 1e-8)
+            self.assertFeasible(problem, x_br)
+
+    def test_infeasible(self):
+        problem = SPM_RotorSleeveProblem(5e-3, 3e-3, 12.5e-3, 0, mat_dict, 100e3)
+        limits = dict(stress_limits, tan_magnets=-1e9)
+        self.assertIs(SPM_RotorSleeveAnalyzer(limits, method="bracket").analyze(problem), False)
+
+    def test_undersize_interval(self):
+        problem = SPM_RotorSleeveProblem(5e-3, 3e-3, 12.5e-3, 0, mat_dict, 100e3)
+        analyzer = SPM_RotorSleeveAnalyzer(stress_limits, method="bracket")
+        d_sl = np.array([1e-4, 5e-4, 1e-3])
+        lower, upper = analyzer.undersize_interval(problem, d_sl)
+        self.assertFalse(lower[0] <= upper[0])
+        for d, lo, hi in zip(d_sl[1:], lower[1:], upper[1:]):
+            self.assertLessEqual(lo, hi)
+            for delta in (lo, (lo + hi) / 2, hi):
+                self.assertFeasible(problem, [d, delta])
+
+    def test_batch_problem_cached_per_material(self):
+        analyzer = SPM_RotorSleeveAnalyzer(stress_limits, method="bracket")
+        problems = [
+            SPM_RotorSleeveProblem(5e-3, 3e-3, 12.5e-3, 0, mat_dict, 100e3),
+            SPM_RotorSleeveProblem(3e-3, 4e-3, 15e-3, 50, mat_dict, 80e3),
+        ]
+        x_cached = [analyzer.analyze(problem) for problem in problems]
+        self.assertEqual(len(analyzer._batch_problems), 1)
+        # a cached batch problem gives the same design as a new analyzer
+        for problem, x in zip(problems, x_cached):
+            x_new = SPM_RotorSleeveAnalyzer(stress_limits, method="bracket").analyze(problem)
+            np.testing.assert_array_equal(x, x_new)
+
+        other = dict(mat_dict, sleeve_youngs_th_direction=100e9)
+        analyzer.analyze(SPM_RotorSleeveProblem(5e-3, 3e-3, 12.5e-3, 0, other, 100e3))
+        self.assertEqual(len(analyzer._batch_problems), 2)
+
+    def test_undersize_interval_reuses_batch(self):
+        problem = SPM_RotorSleeveProblem(5e-3, 3e-3, 12.5e-3, 0, mat_dict, 100e3)
+        analyzer = SPM_RotorSleeveAnalyzer(stress_limits, method="bracket")
+        batch = analyzer.batch_problem(problem, 3)
+        for d_sl in (np.array([1e-4, 5e-4, 1e-3]), np.array([2e-4, 3e-4, 4e-4])):
+            np.testing.assert_allclose(
+                analyzer.undersize_interval(problem, d_sl, batch),
+                analyzer.undersize_interval(problem, d_sl),
+            )
+
+    def test_custom_classes_not_supported(self):
+        class CustomProblem(SPM_RotorStructuralProblem):
+            pass
+
+        problem = SPM_RotorSleeveProblem(
+            5e-3, 3e-3, 12.5e-3, 0, mat_dict, 100e3, problem_class=CustomProblem
+        )
+        with self.assertRaises(ValueError):
+            SPM_RotorSleeveAnalyzer(stress_limits, method="bracket").analyze(problem)
+
+
+if __name__ == "__main__":
+    unittest.main()
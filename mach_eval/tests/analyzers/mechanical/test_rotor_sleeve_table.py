@@ -0,0 +1,98 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.rotor_structural import (
+    SPM_RotorSleeveProblem,
+    SPM_RotorSleeveAnalyzer,
+)
+from mach_eval.analyzers.mechanical.rotor_sleeve_table import (
+    SPM_RotorSleeveTable,
+    SPM_RotorSleeveTableAnalyzer,
+)
+from mach_eval.machines.materials.electric_steels import Arnon5
+from mach_eval.machines.materials.jmag_library_magnets import N40H
+from mach_eval.machines.materials.miscellaneous_materials import CarbonFiber, Steel
+
+mat_dict = {**Arnon5, **N40H, **CarbonFiber, **Steel}
+stress_limits = {
+    "rad_sleeve": -100e6,
+    "tan_sleeve": 1300e6,
+    "rad_magnets": 0,
+    "tan_magnets": 80e6,
+}
+
+
+class CountingAnalyzer:
+    """Exact analyzer counting the problems it is asked to solve"""
+
+    def __init__(self):
+        self.analyzer = SPM_RotorSleeveAnalyzer(stress_limits, method="bracket")
+        self.calls = 0
+
+    def analyze(self, problem):
+        self.calls += 1
+        return self.analyzer.analyze(problem)
+
+
+class TestSPM_RotorSleeveTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.table = SPM_RotorSleeveTable(
+            [4e-3, 5e-3], [3e-3, 4e-3], [12e-3, 13e-3], [80e3, 100e3], 0, mat_dict, stress_limits
+        ).build()
+
+    def setUp(self):
+        self.exact = CountingAnalyzer()
+        self.analyzer = SPM_RotorSleeveTableAnalyzer(self.table, self.exact)
+
+    def test_build_with_material_names(self):
+        self.assertFalse(np.isnan(self.table.d_sl).any())
+        self.assertTrue(np.all(self.table.delta_sl <= 0))
+
+    def test_grid_point_matches_exact_analyzer(self):
+        problem = SPM_RotorSleeveProblem(5e-3, 3e-3, 13e-3, 0, mat_dict, 100e3)
+        sol = self.analyzer.analyze(problem)
+        self.assertEqual(self.exact.calls, 0)
+        np.testing.assert_allclose(sol, self.exact.analyzer.analyze(problem), rtol=1e-12)
+
+    def test_interpolates_within_cell(self):
+        problem = SPM_RotorSleeveProblem(4.5e-3, 3.5e-3, 12.5e-3, 0, mat_dict, 90e3)
+        sol = self.analyzer.analyze(problem)
+        self.assertEqual(self.exact.calls, 0)
+        exact = self.exact.analyzer.analyze(problem)
+        self.assertLess(abs(sol[0] - exact[0]), 0.1 * exact[0])
+
+    def test_falls_back_outside_grid(self):
+        self.analyzer.analyze(SPM_RotorSleeveProblem(5e-3, 3e-3, 13e-3, 0, mat_dict, 120e3))
+        self.assertEqual(self.exact.calls, 1)
+
+    def test_falls_back_on_different_conditions(self):
+        self.analyzer.analyze(SPM_RotorSleeveProblem(5e-3, 3e-3, 13e-3, 20, mat_dict, 100e3))
+        mats = dict(mat_dict, sleeve_youngs_th_direction=100e9)
+        self.analyzer.analyze(SPM_RotorSleeveProblem(5e-3, 3e-3, 13e-3, 0, mats, 100e3))
+        self.assertEqual(self.exact.calls, 2)
+
+    def test_equal_materials_use_table(self):
+        # array values and other material names describe the same materials
+        mats = dict(mat_dict, core_youngs_modulus=np.array([185e9]), core_material="M19")
+        self.analyzer.analyze(SPM_RotorSleeveProblem(5e-3, 3e-3, 13e-3, 0, mats, 100e3))
+        self.assertEqual(self.exact.calls, 0)
+
+    def test_save_load(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = os.path.join(tmp, "sleeve_table.pkl")
+            self.table.save(filepath)
+            table = SPM_RotorSleeveTable.load(filepath)
+        analyzer = SPM_RotorSleeveTableAnalyzer(table, self.exact)
+        problem = SPM_RotorSleeveProblem(4.5e-3, 3.5e-3, 12.5e-3, 0, mat_dict, 90e3)
+        np.testing.assert_array_equal(analyzer.analyze(problem), self.analyzer.analyze(problem))
+        self.assertEqual(self.exact.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
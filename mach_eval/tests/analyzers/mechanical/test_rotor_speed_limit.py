@@ -0,0 +1,80 @@
+import unittest
+
+from mach_eval.analyzers.mechanical.rotor_speed_limit import (
+    SPM_RotorSpeedLimitProblem,
+    SPM_RotorSpeedLimitAnalyzer,
+)
+
+# example of the SPM Rotor Speed Limit Analyzer docs
+mat_dict = {
+    "core_material_density": 7650,
+    "core_youngs_modulus": 185e9,
+    "core_poission_ratio": 0.3,
+    "alpha_rc": 1.2e-5,
+    "magnet_material_density": 7450,
+    "magnet_youngs_modulus": 160e9,
+    "magnet_poission_ratio": 0.24,
+    "alpha_pm": 5e-6,
+    "sleeve_material_density": 1800,
+    "sleeve_youngs_th_direction": 125e9,
+    "sleeve_youngs_p_direction": 8.8e9,
+    "sleeve_poission_ratio_p": 0.015,
+    "sleeve_poission_ratio_tp": 0.28,
+    "alpha_sl_t": -4.7e-7,
+    "alpha_sl_r": 0.3e-6,
+    "sleeve_max_tan_stress": 1950e6,
+    "sleeve_max_rad_stress": -100e6,
+    "shaft_material_density": 7870,
+    "shaft_youngs_modulus": 206e9,
+    "shaft_poission_ratio": 0.3,
+    "alpha_sh": 1.2e-5,
+}
+mat_failure_dict = {
+    "core_yield_strength": 359e6,
+    "magnet_ultimate_strength": 80e6,
+    "sleeve_ultimate_strength": 1380e6,
+    "shaft_yield_strength": 405e6,
+    "adhesive_ultimate_strength": 17.9e6,
+}
+
+
+def speed_limit_problem(d_sl, delta_sl):
+    return SPM_RotorSpeedLimitProblem(
+        5e-3, 2e-3, 12.5e-3, d_sl, delta_sl, 0, 100e3, mat_dict, mat_failure_dict
+    )
+
+
+class TestSPM_RotorSpeedLimitAnalyzerExact(unittest.TestCase):
+    N_step = 100
+
+    def test_matches_sweep_without_sleeve(self):
+        problem = speed_limit_problem(0, 0)
+        sweep = SPM_RotorSpeedLimitAnalyzer(self.N_step, 1000).analyze(problem)
+        analyzer = SPM_RotorSpeedLimitAnalyzer(self.N_step, 1000, method="exact")
+        exact = analyzer.analyze(problem)
+
+        self.assertEqual(sweep.failure_mat, "Adhesive")
+        self.assertEqual(exact.failure_mat, sweep.failure_mat)
+        self.assertEqual(sweep.speed, 77700)
+        self.assertAlmostEqual(exact.speed, 77666.4457, places=2)
+        # the sweep returns the first step at or above the failure speed
+        self.assertLessEqual(exact.speed, sweep.speed)
+        self.assertLess(sweep.speed - exact.speed, self.N_step)
+        # the exact speed is the boundary of the failure check
+        self.assertFalse(analyzer.check_if_fail(exact.speed - 1)[0])
+        self.assertEqual(analyzer.check_if_fail(exact.speed + 1), (True, "Adhesive"))
+
+    def test_no_failure_with_sleeve(self):
+        problem = speed_limit_problem(1e-3, -2.4e-5)
+        for method in ("sweep", "exact"):
+            result = SPM_RotorSpeedLimitAnalyzer(self.N_step, 1000, method=method).analyze(problem)
+            self.assertIsNone(result.failure_mat)
+            self.assertIsNone(result.speed)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            SPM_RotorSpeedLimitAnalyzer(self.N_step, 1000, method="bisect")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.rotor_structural import (
+    SPM_RotorStructuralProblem,
+    SPM_RotorStructuralAnalyzer,
+    SPM_RotorStructuralBatchProblem,
+    SPM_RotorStructuralBatchAnalyzer,
+)
+from mach_eval.machines.materials.electric_steels import Arnon5
+from mach_eval.machines.materials.jmag_library_magnets import N40H
+from mach_eval.machines.materials.miscellaneous_materials import CarbonFiber, Steel
+
+mat_dict = {**Arnon5, **N40H, **CarbonFiber, **Steel}
+
+
+class TestSPM_RotorStructuralBatchAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.r_sh = 5e-3
+        self.d_m = 3e-3
+        self.r_ro = 12.5e-3
+        self.d_sl = np.array([0.5e-3, 1e-3, 2e-3])
+        self.delta_sl = np.array([-1e-5, -5e-5, -1e-4])
+        self.deltaT = 0
+        self.N = 100e3
+
+    def test_material_names_passed_through(self):
+        problem = SPM_RotorStructuralBatchProblem(
+            self.r_sh, self.d_m, self.r_ro, self.d_sl, self.delta_sl, self.deltaT, self.N, mat_dict
+        )
+        self.assertEqual(problem.M, 3)
+        self.assertEqual(problem.mat_dict["core_material"], "Arnon5")
+        self.assertEqual(problem.mat_dict["magnetization_direction"], "Parallel")
+        np.testing.assert_array_equal(problem.mat_dict["core_youngs_modulus"], [185e9] * 3)
+
+    def test_matches_single_rotor_analyzer(self):
+        problem = SPM_RotorStructuralBatchProblem(
+            self.r_sh, self.d_m, self.r_ro, self.d_sl, self.delta_sl, self.deltaT, self.N, mat_dict
+        )
+        results = SPM_RotorStructuralBatchAnalyzer(n_points=5).analyze(problem)
+        for m, (d_sl, delta_sl) in enumerate(zip(self.d_sl, self.delta_sl)):
+            single = SPM_RotorStructuralProblem(
+                self.r_sh, self.d_m, self.r_ro, d_sl, delta_sl, self.deltaT, self.N, mat_dict
+            )
+            sigmas = SPM_RotorStructuralAnalyzer().analyze(single)
+            for k in range(4):
+                # the single rotor shaft stress is undefined at the shaft center
+                r = results.r[k, m] if k > 0 else results.r[k, m, 1:]
+                n = len(r)
+                np.testing.assert_allclose(results.sigma_r[k, m, -n:], sigmas[k].radial(r), rtol=1e-9, atol=1)
+                np.testing.assert_allclose(results.sigma_t[k, m, -n:], sigmas[k].tangential(r), rtol=1e-9, atol=1)
+
+    def test_array_valued_material(self):
+        mats = dict(mat_dict, sleeve_youngs_th_direction=np.array([100e9, 125e9, 150e9]))
+        problem = SPM_RotorStructuralBatchProblem(
+            self.r_sh, self.d_m, self.r_ro, 1e-3, -5e-5, self.deltaT, self.N, mats
+        )
+        results = SPM_RotorStructuralBatchAnalyzer(n_points=2).analyze(problem)
+        # a stiffer sleeve takes a larger share of the centrifugal load
+        sigma_t_sl = results.sigma_t[3, :, 0]
+        self.assertTrue(np.all(np.diff(sigma_t_sl) > 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.rotor_thermal import (
+    SPM_RotorThermalProblem,
+    SPM_RotorThermalAnalyzer,
+    AirflowProblem,
+    AirflowAnalyzer,
+)
+
+# example of the SPM Rotor Thermal Analyzer docs
+mat_dict = {
+    "shaft_therm_conductivity": 51.9,
+    "core_therm_conductivity": 28,
+    "magnet_therm_conductivity": 8.95,
+    "sleeve_therm_conductivity": 0.71,
+    "air_therm_conductivity": 0.02624,
+    "air_viscosity": 1.562e-5,
+    "air_cp": 1,
+    "rotor_hub_therm_conductivity": 205.0,
+}
+
+
+def rotor_problem(u_z):
+    r_sh, d_m, r_ro, d_sl = 5e-3, 3e-3, 12.5e-3, 1e-3
+    losses = {"rotor_iron_loss": 0.001, "magnet_loss": 135}
+    omega = 120e3 * 2 * np.pi / 60
+    return SPM_RotorThermalProblem(
+        mat_dict, r_sh, r_ro - r_sh - d_m, r_ro, d_sl, r_ro + d_sl + 1e-3, 50e-3, 3e-3, 25, u_z, losses, omega
+    )
+
+
+class TestSPM_RotorThermalAnalyzer(unittest.TestCase):
+    def test_resistances_positive(self):
+        res = SPM_RotorThermalAnalyzer().create_resistance_network(rotor_problem(1.0))
+        values = np.hstack([r.resistance_value for r in res])
+        self.assertTrue(np.all(values > 0))
+
+    def test_hub_paths_symmetric(self):
+        # paths 9 and 28 conduct from the magnet center into the hubs on either side of the rotor
+        res = SPM_RotorThermalAnalyzer().create_resistance_network(rotor_problem(1.0))
+        self.assertEqual(res[28].resistance_value, res[9].resistance_value)
+
+    def test_magnet_temperature_regression(self):
+        # values with the magnet cross section pi * (R_3**2 - R_2**2) of path 28
+        for u_z, T_pm in ((0, 108.37222788), (1.0, 73.02700833)):
+            T = SPM_RotorThermalAnalyzer().analyze(rotor_problem(u_z))
+            self.assertAlmostEqual(float(np.ravel(T)[5]), T_pm, places=6)
+
+
+def airflow_problem(magnet_loss=135, max_temp=80, rpm=120e3):
+    r_sh, d_m, r_ro, d_sl = 5e-3, 3e-3, 12.5e-3, 1e-3
+    losses = {"rotor_iron_loss": 0.001, "magnet_loss": magnet_loss}
+    omega = rpm * 2 * np.pi / 60
+    return AirflowProblem(
+        r_sh, r_ro - r_sh - d_m, r_ro, d_sl, r_ro + d_sl + 1e-3, 50e-3, 3e-3, 25, losses, omega, max_temp, mat_dict
+    )
+
+
+class TestAirflowAnalyzer(unittest.TestCase):
+    def assert_methods_agree(self, problem, bounds=(0.00001, 1.0)):
+        root = AirflowAnalyzer("root", bounds=bounds).analyze(problem)
+        minimize = AirflowAnalyzer("minimize", bounds=bounds).analyze(problem)
+        self.assertEqual(root["valid"], minimize["valid"])
+        self.assertAlmostEqual(
+            float(root["Required Airflow"][0]), float(minimize["Required Airflow"][0]), places=5
+        )
+        T_root = float(np.ravel(root["magnet Temp"])[0])
+        T_min = float(np.ravel(minimize["magnet Temp"])[0])
+        self.assertAlmostEqual(T_root, T_min, places=4)
+        np.testing.assert_allclose(root["Rotor Temperatures"], minimize["Rotor Temperatures"], atol=1e-4)
+        return root
+
+    def test_feasible_at_lower_bound(self):
+        # the magnet temperature rises with the airflow in this rotor
+        root = self.assert_methods_agree(airflow_problem())
+        self.assertTrue(root["valid"])
+        self.assertEqual(float(root["Required Airflow"][0]), 0.00001)
+
+    def test_infeasible_loss(self):
+        root = self.assert_methods_agree(airflow_problem(magnet_loss=300))
+        self.assertFalse(root["valid"])
+        self.assertAlmostEqual(float(np.ravel(root["magnet Temp"])[0]), 131.5647, places=3)
+
+    def test_infeasible_max_temp(self):
+        root = self.assert_methods_agree(airflow_problem(max_temp=60))
+        self.assertFalse(root["valid"])
+        self.assertAlmostEqual(float(np.ravel(root["magnet Temp"])[0]), 72.9543, places=3)
+
+    def test_root_with_falling_temperature(self):
+        # at low speed and large airflow the magnet temperature falls with the airflow
+        root = self.assert_methods_agree(airflow_problem(rpm=1e3, max_temp=400), bounds=(10, 100))
+        self.assertTrue(root["valid"])
+        self.assertLessEqual(float(np.ravel(root["magnet Temp"])[0]), 400)
+
+    def test_infeasible_falling_temperature(self):
+        root = self.assert_methods_agree(airflow_problem(rpm=1e3, max_temp=100), bounds=(10, 100))
+        self.assertFalse(root["valid"])
+        self.assertAlmostEqual(float(root["Required Airflow"][0]), 100)
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            AirflowAnalyzer("bisect")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.thermal_network import (
+    ThermalNetworkProblem,
+    ThermalNetworkBatchProblem,
+    ThermalNetworkAnalyzer,
+    Material,
+    plane_wall,
+    conv,
+)
+
+
+def ladder_network():
+    """Chain of plane walls between node 0 and the reference node 5, with a parallel path between nodes 1 and 3"""
+    mat = Material(k=20)
+    res = [plane_wall(mat, i, i + 1, L=0.01 * (i + 1), A=0.002) for i in range(5)]
+    res.append(conv(mat, 1, 3, h=50, A=0.01))
+    res.append(conv(mat, 3, 1, h=25, A=0.01))
+    return res
+
+
+def dense_solve(res, Q_dot, T_ref, N_nodes, values=None):
+    """Reference solution of the nodal equations with a dense matrix"""
+    if values is None:
+        values = [float(np.hstack([r.resistance_value])[0]) for r in res]
+    A = np.zeros((N_nodes, N_nodes))
+    for r, value in zip(res, values):
+        for a, b in ((r.Node1, r.Node2), (r.Node2, r.Node1)):
+            A[a, a] += 1 / value
+            A[a, b] -= 1 / value
+    b = np.array(Q_dot, dtype=float)
+    for node, temp in T_ref:
+        A[node] = 0
+        A[node, node] = 1
+        b[node] = temp
+    return np.linalg.solve(A, b)
+
+
+class TestThermalNetworkAnalyzer(unittest.TestCase):
+    def setUp(self):
+        self.res = ladder_network()
+        self.T_ref = [[5, 300.0]]
+        self.Q_dot = [10.0, 0.0, 5.0, 0.0, 2.0, 0.0]
+
+    def test_matches_dense_solution(self):
+        problem = ThermalNetworkProblem(self.res, self.Q_dot, self.T_ref, 6)
+        T = ThermalNetworkAnalyzer().analyze(problem)
+        expected = dense_solve(self.res, self.Q_dot, self.T_ref, 6)
+        np.testing.assert_allclose(T, expected, rtol=1e-12)
+        self.assertEqual(T[5], 300.0)
+
+    def test_parallel_resistances_combined(self):
+        G = ThermalNetworkAnalyzer.conductance_matrix(self.res, 6)
+        g = 50 * 0.01 + 25 * 0.01
+        self.assertAlmostEqual(G[1, 3], -g)
+        self.assertAlmostEqual(G[3, 1], -g)
+        np.testing.assert_allclose(np.asarray(G.sum(axis=1)).ravel(), 0, atol=1e-12)
+
+    def test_parallel_resistances_match_equivalent_resistance(self):
+        # the two resistances between nodes 1 and 3 act as a single one of 1 / (1 / R1 + 1 / R2)
+        R1, R2 = (r.resistance_value for r in self.res[-2:])
+        values = [r.resistance_value for r in self.res[:-2]] + [1 / (1 / R1 + 1 / R2)]
+        problem = ThermalNetworkProblem(self.res, self.Q_dot, self.T_ref, 6)
+        T = ThermalNetworkAnalyzer().analyze(problem)
+        expected = dense_solve(self.res[:-1], self.Q_dot, self.T_ref, 6, values=values)
+        np.testing.assert_allclose(T, expected, rtol=1e-12)
+
+    def test_array_valued_resistance(self):
+        self.res[0] = conv(Material(k=20), 0, 1, h=np.array([40.0]), A=0.01)
+        problem = ThermalNetworkProblem(self.res, self.Q_dot, self.T_ref, 6)
+        T = ThermalNetworkAnalyzer().analyze(problem)
+        expected = dense_solve(self.res, self.Q_dot, self.T_ref, 6)
+        np.testing.assert_allclose(T, expected, rtol=1e-12)
+
+    def test_batch_matches_single_cases(self):
+        rng = np.random.default_rng(0)
+        Q_dot = rng.random((4, 6))
+        values = np.array([r.resistance_value for r in self.res])
+        res_values = np.vstack([values, values, 2 * values, values])
+        problem = ThermalNetworkBatchProblem(self.res, Q_dot, self.T_ref, 6, res_values=res_values)
+        T = ThermalNetworkAnalyzer().analyze_batch(problem)
+        for Q, row, T_case in zip(Q_dot, res_values, T):
+            expected = dense_solve(self.res, Q, self.T_ref, 6, values=row)
+            np.testing.assert_allclose(T_case, expected, rtol=1e-12)
+
+
+class FixedResistance:
+    def __init__(self, Node1, Node2, resistance_value):
+        self.Node1 = Node1
+        self.Node2 = Node2
+        self.resistance_value = resistance_value
+
+
+class TestThermalNetworkBatch(unittest.TestCase):
+    def setUp(self):
+        self.res = ladder_network()
+        self.T_ref = [[5, 300.0]]
+        self.values = np.array([r.resistance_value for r in self.res])
+
+    def analyze_each(self, Q_dot, res_values):
+        """Reference solution analyzing one ThermalNetworkProblem per case"""
+        T = []
+        for Q, row in zip(Q_dot, res_values):
+            res = [FixedResistance(r.Node1, r.Node2, value) for r, value in zip(self.res, row)]
+            T.append(ThermalNetworkAnalyzer().analyze(ThermalNetworkProblem(res, Q, self.T_ref, 6)))
+        return np.array(T)
+
+    def test_matches_analyze_with_repeated_rows(self):
+        rng = np.random.default_rng(1)
+        Q_dot = rng.random((6, 6))
+        res_values = self.values * np.array([1, 1.5, 1, 0.5, 1.5, 1])[:, None]
+        problem = ThermalNetworkBatchProblem(self.res, Q_dot, self.T_ref, 6, res_values=res_values)
+        analyzer = ThermalNetworkAnalyzer()
+        with mock.patch.object(
+            ThermalNetworkAnalyzer, "conductance_matrix", wraps=ThermalNetworkAnalyzer.conductance_matrix
+        ) as assemble:
+            T = analyzer.analyze_batch(problem)
+        # one conductance matrix per distinct row of resistance values
+        self.assertEqual(assemble.call_count, 3)
+        np.testing.assert_allclose(T, self.analyze_each(Q_dot, res_values), rtol=1e-12)
+
+    def test_shared_sources(self):
+        Q = [10.0, 0.0, 5.0, 0.0, 2.0, 0.0]
+        res_values = self.values * np.array([1, 2, 3])[:, None]
+        problem = ThermalNetworkBatchProblem(self.res, Q, self.T_ref, 6, res_values=res_values)
+        T = ThermalNetworkAnalyzer().analyze_batch(problem)
+        np.testing.assert_allclose(T, self.analyze_each([Q] * 3, res_values), rtol=1e-12)
+
+    def test_shared_resistances(self):
+        Q_dot = np.random.default_rng(2).random((4, 6))
+        problem = ThermalNetworkBatchProblem(self.res, Q_dot, self.T_ref, 6)
+        T = ThermalNetworkAnalyzer().analyze_batch(problem)
+        np.testing.assert_allclose(T, self.analyze_each(Q_dot, [self.values] * 4), rtol=1e-12)
+        self.assertTrue(np.all(T[:, 5] == 300.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.analyzers.mechanical.thermal_network import (
+    ThermalNetworkProblem,
+    ThermalNetworkAnalyzer,
+    ThermalNetworkTransientProblem,
+    ThermalNetworkTransientAnalyzer,
+    Material,
+    plane_wall,
+    conv,
+)
+from mach_eval.analyzers.mechanical.rotor_thermal import (
+    SPM_RotorThermalProblem,
+    SPM_RotorThermalAnalyzer,
+)
+
+mat_dict = {
+    "shaft_therm_conductivity": 51.9,
+    "core_therm_conductivity": 28,
+    "magnet_therm_conductivity": 8.95,
+    "sleeve_therm_conductivity": 0.71,
+    "air_therm_conductivity": 0.02624,
+    "air_viscosity": 1.562e-5,
+    "air_cp": 1,
+    "rotor_hub_therm_conductivity": 205.0,
+}
+
+
+def rotor_problem():
+    r_sh, d_m, r_ro, d_sl = 5e-3, 3e-3, 12.5e-3, 1e-3
+    losses = {"rotor_iron_loss": 0.001, "magnet_loss": 135}
+    return SPM_RotorThermalProblem(
+        mat_dict, r_sh, r_ro - r_sh - d_m, r_ro, d_sl, r_ro + d_sl + 1e-3, 50e-3, 3e-3, 25, 1.0, losses, 12566
+    )
+
+
+def rc_network(R=2.0):
+    """Single capacitive node 1 connected to the reference node 0 through R = L / (k A)"""
+    return [plane_wall(Material(k=1.0), 1, 0, L=R, A=1.0)]
+
+
+class TestThermalNetworkTransientAnalyzer(unittest.TestCase):
+    def test_first_order_response(self):
+        R, C, Q, tau = 2.0, [0.0, 5.0], [0.0, 3.0], 10.0
+        t = np.linspace(0, 50, 501)
+        expected = 20 + Q[1] * R * (1 - np.exp(-t / tau))
+        errors = {}
+        for method in ("backward_euler", "bdf2"):
+            problem = ThermalNetworkTransientProblem(rc_network(R), C, Q, [[0, 20.0]], 2, t, 20.0)
+            T = ThermalNetworkTransientAnalyzer(method).analyze(problem).T
+            errors[method] = np.max(np.abs(T[1] - expected))
+        self.assertLess(errors["bdf2"], 1e-3)
+        self.assertLess(errors["bdf2"], errors["backward_euler"] / 10)
+
+    def test_converges_to_steady_state(self):
+        mat = Material(k=20)
+        res = [plane_wall(mat, i, i + 1, L=0.01, A=0.002) for i in range(4)]
+        res.append(conv(mat, 2, 0, h=50, A=0.01))
+        Q_dot = [0.0, 1.0, 0.0, 2.0, 4.0]
+        T_ref = [[0, 25.0]]
+        steady = ThermalNetworkAnalyzer().analyze(ThermalNetworkProblem(res, Q_dot, T_ref, 5))
+        t = np.linspace(0, 2000, 201)
+        problem = ThermalNetworkTransientProblem(res, [0, 1, 1, 0, 2], Q_dot, T_ref, 5, t, 25.0)
+        T = ThermalNetworkTransientAnalyzer("bdf2").analyze(problem).T
+        np.testing.assert_allclose(T[:, -1], steady, rtol=1e-8)
+
+    def test_sampled_sources_along_axis(self):
+        t = np.linspace(0, 10, 11)
+        Q = np.vstack([np.zeros_like(t), np.where(t < 5, 1.0, 0.0)])
+        ana = ThermalNetworkTransientAnalyzer()
+        problem = ThermalNetworkTransientProblem(rc_network(), [0, 1], Q, [[0, 0.0]], 2, t, 0.0, Q_dot_axis=1)
+        T = ana.analyze(problem).T
+        problem = ThermalNetworkTransientProblem(rc_network(), [0, 1], Q.T, [[0, 0.0]], 2, t, 0.0, Q_dot_axis=0)
+        np.testing.assert_array_equal(ana.analyze(problem).T, T)
+        problem = ThermalNetworkTransientProblem(
+            rc_network(), [0, 1], lambda t: [0, 1.0 if t < 5 else 0.0], [[0, 0.0]], 2, t, 0.0
+        )
+        np.testing.assert_allclose(ana.analyze(problem).T, T)
+
+    def test_sampled_sources_require_axis(self):
+        # as many time points as nodes, so the time axis cannot be deduced from the shape
+        t = np.linspace(0, 1, 2)
+        problem = ThermalNetworkTransientProblem(rc_network(), [0, 1], np.ones((2, 2)), [[0, 0.0]], 2, t, 0.0)
+        with self.assertRaises(ValueError):
+            ThermalNetworkTransientAnalyzer().analyze(problem)
+
+    def test_negative_resistance_raises(self):
+        res = [plane_wall(Material(k=1.0), 1, 0, L=1.0, A=-1.0)]
+        problem = ThermalNetworkTransientProblem(res, [0, 1], [0, 1], [[0, 0.0]], 2, [0, 1], 0.0)
+        with self.assertRaises(ValueError):
+            ThermalNetworkTransientAnalyzer().analyze(problem)
+
+
+class TestSPM_RotorThermalNetwork(unittest.TestCase):
+    def test_transient_reaches_steady_state(self):
+        ana = SPM_RotorThermalAnalyzer()
+        problem = rotor_problem()
+        res = ana.create_resistance_network(problem)
+        Q_dot = ana.create_loss_vector(problem)
+        T_ref = ana.create_reference_temps(problem)
+        C = np.zeros(ana.N_nodes)
+        C[[1, 3, 5, 7]] = [2.0, 10.0, 15.0, 1.0]
+        t = np.linspace(0, 1e4, 101)
+        transient = ThermalNetworkTransientProblem(res, C, Q_dot, T_ref, ana.N_nodes, t, 25.0)
+        T = ThermalNetworkTransientAnalyzer("bdf2").analyze(transient).T
+        np.testing.assert_allclose(T[:, -1], ana.analyze(problem)[:, 0], rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import unittest
+
+import numpy as np
+
+from mach_eval.machines.bspm.winding_layout import (
+    WindingLayout,
+    star_of_slots_layout,
+    enumerate_winding_layouts,
+    _excitation_bias_compensation_deg,
+)
+
+# (Qs, p, y) of the hand written DPNV layouts of WindingLayout
+HAND_WRITTEN = [(24, 2, 6), (24, 1, 9), (6, 2, 1), (6, 1, 2), (12, 2, 3), (12, 1, 5)]
+
+
+class TestStarOfSlotsLayout(unittest.TestCase):
+    def test_matches_hand_written_layouts(self):
+        for Qs, p, y in HAND_WRITTEN:
+            layout = star_of_slots_layout(Qs, p, y=y)
+            expected = WindingLayout(True, Qs, p)
+            self.assertEqual(list(layout.rightlayer_phase), expected.rightlayer_phase)
+            self.assertEqual(list(layout.rightlayer_polarity), expected.rightlayer_polarity)
+            self.assertEqual(list(layout.leftlayer_phase), expected.leftlayer_phase)
+            self.assertEqual(list(layout.leftlayer_polarity), expected.leftlayer_polarity)
+
+    def test_matches_hand_written_groups(self):
+        for Qs, p in [(24, 2), (12, 1)]:
+            layout = star_of_slots_layout(Qs, p)
+            self.assertEqual(list(layout.grouping_a), WindingLayout(True, Qs, p).grouping_a)
+
+    def test_winding_factors(self):
+        self.assertAlmostEqual(star_of_slots_layout(24, 2).Kw, 0.966, places=3)
+        self.assertAlmostEqual(star_of_slots_layout(12, 1).Kw, 0.933, places=3)
+        self.assertAlmostEqual(star_of_slots_layout(6, 1).Kw, 0.866, places=3)
+
+    def test_default_pitch(self):
+        self.assertEqual(star_of_slots_layout(24, 2).y, 6)
+        # full pitch coils link no ps = 2 suspension flux
+        self.assertEqual(star_of_slots_layout(24, 1).y, 11)
+        self.assertEqual(star_of_slots_layout(24, 1, DPNV=False).y, 12)
+        self.assertEqual(star_of_slots_layout(12, 4).y, 1)
+
+    def test_balanced_dpnv_groups(self):
+        layout = star_of_slots_layout(36, 2)
+        phase = np.array(layout.rightlayer_phase)
+        group = np.array(layout.grouping_a)
+        for name in "UVW":
+            self.assertEqual(np.sum((phase == name) & (group == "a")), np.sum((phase == name) & (group == "b")))
+        self.assertGreater(layout.Kw_s, 0)
+
+    def test_separate_winding(self):
+        layout = star_of_slots_layout(24, 2, no_winding_layer=1, DPNV=False)
+        self.assertIsNone(layout.grouping_a)
+        self.assertEqual(layout.y, 6)
+
+    def test_infeasible_combinations(self):
+        with self.assertRaises(ValueError):
+            star_of_slots_layout(10, 2)
+        with self.assertRaises(ValueError):
+            star_of_slots_layout(12, 1, m=2)
+        with self.assertRaises(ValueError):
+            star_of_slots_layout(12, 1, no_winding_layer=3)
+
+
+class TestEnumerateWindingLayouts(unittest.TestCase):
+    def test_feasible_combinations(self):
+        layouts = enumerate_winding_layouts(range(6, 25, 2), range(1, 5))
+        combinations = {(layout.Qs, layout.p) for layout in layouts}
+        self.assertIn((24, 2), combinations)
+        self.assertIn((12, 4), combinations)
+        self.assertNotIn((10, 2), combinations)
+        for layout in layouts:
+            self.assertEqual(layout, star_of_slots_layout(layout.Qs, layout.p))
+
+
+class TestWindingLayout(unittest.TestCase):
+    def test_derived_from_star_of_slots(self):
+        winding = WindingLayout(True, 18, 2)
+        layout = star_of_slots_layout(18, 2)
+        self.assertEqual(winding.rightlayer_phase, list(layout.rightlayer_phase))
+        self.assertEqual(winding.grouping_a, list(layout.grouping_a))
+        self.assertEqual(winding.y, layout.y)
+        self.assertEqual(winding.l41, winding.rightlayer_phase)
+
+    def test_hand_written_pitch(self):
+        self.assertEqual(WindingLayout(True, 24, 1).y, 9)
+
+    def test_excitation_bias_compensation_of_hand_written_layouts(self):
+        # Q24p2 is derived exactly as written by hand
+        for Qs, p in [(24, 2), (12, 4)]:
+            derived = WindingLayout.__new__(WindingLayout)
+            derived.from_star_of_slots(True, Qs, p)
+            self.assertAlmostEqual(
+                derived.initial_excitation_bias_compensation_deg,
+                WindingLayout(True, Qs, p).initial_excitation_bias_compensation_deg,
+            )
+
+    def test_excitation_bias_compensation_from_phase_axis(self):
+        # legacy formula 360 / Qs * 0.5 * (1 + y + q - 1) for integral slot
+        # windings whose U phase belt starts in slot 1 and concentrated
+        # windings, up to the sign of the winding (180 / p)
+        for no_winding_layer in (1, 2):
+            for layout in enumerate_winding_layouts(
+                range(6, 49, 6), range(1, 5), no_winding_layer=no_winding_layer
+            ):
+                q = layout.Qs / (2 * layout.p * 3)
+                if q % 1 and q != 0.5:
+                    continue
+                legacy = 360 / layout.Qs * 0.5 * (layout.y + max(q, 1))
+                deg = _excitation_bias_compensation_deg(layout)
+                self.assertGreaterEqual(deg, -180 / layout.p)
+                self.assertLess(deg, 180 / layout.p)
+                diff = (deg - legacy) % (180 / layout.p)
+                self.assertAlmostEqual(min(diff, 180 / layout.p - diff), 0, places=9)
+
+    def test_not_implemented(self):
+        with self.assertRaises(Exception):
+            WindingLayout(True, 10, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
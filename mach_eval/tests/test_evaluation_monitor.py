@@ -0,0 +1,105 @@
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from mach_eval import AnalysisStep, EvaluationMonitor, MachineEvaluator
+
+
+class ProblemDefinition:
+    def get_problem(self, state):
+        return state
+
+
+class Analyzer:
+    def analyze(self, problem):
+        return 1
+
+
+class PostAnalyzer:
+    def get_next_state(self, results, state_in):
+        return state_in.copy()
+
+
+class PlainStep:
+    def step(self, state_in):
+        return 2, state_in.copy()
+
+
+class OverridingStep(AnalysisStep):
+    """AnalysisStep subclass overriding step without the monitor argument"""
+
+    def step(self, state_in):
+        return super().step(state_in)
+
+
+def analysis_step():
+    return AnalysisStep(ProblemDefinition(), Analyzer(), PostAnalyzer())
+
+
+class TestEvaluationMonitor(unittest.TestCase):
+    def test_stages_of_each_step(self):
+        monitor = EvaluationMonitor()
+        evaluator = MachineEvaluator([analysis_step(), PlainStep()], monitor=monitor)
+        full_results = evaluator.evaluate(None)
+        stages = [(r["step"], r["name"], r["stage"]) for r in full_results.metrics]
+        self.assertEqual(
+            stages,
+            [
+                (0, "Analyzer", "get_problem"),
+                (0, "Analyzer", "analyze"),
+                (0, "Analyzer", "get_next_state"),
+                (1, "PlainStep", "step"),
+            ],
+        )
+        self.assertEqual(list(monitor.records), full_results.metrics)
+        self.assertTrue(all(r["wall_time"] >= 0 for r in full_results.metrics))
+        self.assertTrue(np.isnan(full_results.metrics[0]["peak_memory"]))
+
+    def test_subclass_without_monitor_argument(self):
+        monitor = EvaluationMonitor()
+        step = OverridingStep(ProblemDefinition(), Analyzer(), PostAnalyzer())
+        full_results = MachineEvaluator([step], monitor=monitor).evaluate(None)
+        self.assertEqual(full_results[0][1], 1)
+        self.assertEqual([r["stage"] for r in full_results.metrics], ["step"])
+
+    def test_records_bounded(self):
+        monitor = EvaluationMonitor(max_records=5)
+        evaluator = MachineEvaluator([analysis_step(), PlainStep()], monitor=monitor)
+        for _ in range(3):
+            full_results = evaluator.evaluate(None)
+        self.assertEqual(len(monitor.records), 5)
+        # the metrics of each design are complete regardless of the bound
+        self.assertEqual(len(full_results.metrics), 4)
+
+    def test_peak_memory(self):
+        monitor = EvaluationMonitor(trace_memory=True)
+        monitor.step, monitor.step_name = 0, "alloc"
+        with monitor.measure("outer"):
+            with monitor.measure("inner"):
+                data = np.ones(10**6)
+            del data
+        inner, outer = monitor.records
+        self.assertGreater(inner["peak_memory"], 8e6)
+        self.assertGreaterEqual(outer["peak_memory"], inner["peak_memory"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_export_histograms(self):
+        monitor = EvaluationMonitor()
+        evaluator = MachineEvaluator([analysis_step(), PlainStep()], monitor=monitor)
+        for _ in range(4):
+            evaluator.evaluate(None)
+        with tempfile.TemporaryDirectory() as tmp:
+            filepath = os.path.join(tmp, "histograms.csv")
+            monitor.export_histograms(filepath, bins=2)
+            df = pd.read_csv(filepath)
+        # 4 stages with wall and CPU time histograms of 2 bins each
+        self.assertEqual(len(df), 4 * 2 * 2)
+        self.assertTrue((df.groupby(["step", "stage", "metric"])["count"].sum() == 4).all())
+
+
+if __name__ == "__main__":
+    unittest.main()
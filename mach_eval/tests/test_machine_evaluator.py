@@ -0,0 +1,205 @@
+import os
+import tempfile
+import unittest
+
+from mach_eval import AnalysisStep, CheckpointStore, Conditions, CostOrderPolicy, MachineEvaluator, State
+from mach_opt import InvalidDesign
+
+
+class Machine:
+    def __init__(self, size):
+        self.size = size
+
+
+class Design:
+    def __init__(self, machine):
+        self.machine = machine
+
+
+class ProblemDefinition:
+    def get_problem(self, state):
+        return state
+
+
+class Analyzer:
+    def analyze(self, problem):
+        return problem.design.machine.size
+
+
+class PostAnalyzer:
+    """Doubles the machine size and records the input size under name"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def get_next_state(self, results, state_in):
+        state_out = state_in.copy()
+        state_out.design.machine = Machine(2 * results)
+        setattr(state_out.conditions, self.name, results)
+        return state_out
+
+
+def make_step(name):
+    return AnalysisStep(ProblemDefinition(), Analyzer(), PostAnalyzer(name))
+
+
+def depth(conditions):
+    n = 0
+    while conditions is not None:
+        conditions = conditions.__dict__["_parent"]
+        n += 1
+    return n
+
+
+class TestStateSharing(unittest.TestCase):
+    def test_recorded_states_unchanged(self):
+        evaluator = MachineEvaluator([make_step("a"), make_step("b"), make_step("c")])
+        full_results = evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual([r[1] for r in full_results], [1, 2, 4])
+        state_in, _, state_out = full_results[0]
+        self.assertEqual(state_in.design.machine.size, 1)
+        self.assertFalse(hasattr(state_in.conditions, "a"))
+        self.assertEqual(state_out.design.machine.size, 2)
+        self.assertEqual(state_out.conditions.changes(), {"a": 1})
+        self.assertFalse(hasattr(state_out.conditions, "b"))
+        final = full_results[-1][-1]
+        self.assertEqual((final.conditions.a, final.conditions.b, final.conditions.c), (1, 2, 4))
+
+    def test_one_conditions_level_per_step(self):
+        steps = [make_step("s%d" % i) for i in range(5)]
+        full_results = MachineEvaluator(steps).evaluate(Design(Machine(1)))
+        self.assertEqual(depth(full_results[-1][-1].conditions), 1 + len(steps))
+
+    def test_state_copy(self):
+        state = State(Design(Machine(1)), Conditions())
+        state.conditions.x = 1
+        copy = state.copy()
+        copy.conditions.x = 2
+        copy.design.machine = Machine(3)
+        self.assertEqual(state.conditions.x, 1)
+        self.assertEqual(state.design.machine.size, 1)
+
+
+class RecordingStep:
+    """Records the order in which steps run and the conditions they read"""
+
+    def __init__(self, name, log, reads=None):
+        self.name = name
+        self.log = log
+        self.reads = reads
+
+    def step(self, state_in):
+        self.log.append(self.name)
+        value = getattr(state_in.conditions, self.reads) if self.reads else None
+        state_out = state_in.copy()
+        setattr(state_out.conditions, self.name, self.name)
+        return value, state_out
+
+
+class TestGatesAndOrder(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.em = RecordingStep("em", self.log)
+        self.thermal = RecordingStep("thermal", self.log, reads="em")
+        self.check = RecordingStep("check", self.log)
+        self.steps = [self.em, self.thermal, self.check]
+
+    def test_gate_skips_remaining_steps(self):
+        evaluator = MachineEvaluator(self.steps, gates={self.em: lambda results, state_out: False})
+        with self.assertRaises(InvalidDesign):
+            evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual(self.log, ["em"])
+
+    def test_passing_gate_runs_all_steps(self):
+        evaluator = MachineEvaluator(self.steps, gates={self.em: lambda results, state_out: True})
+        evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual(self.log, ["em", "thermal", "check"])
+
+    def test_declared_order_kept_without_independent_steps(self):
+        policy = CostOrderPolicy({self.em: 10, self.thermal: 5, self.check: 1})
+        self.assertEqual(policy.order(self.steps), [0, 1, 2])
+
+    def test_independent_step_moved_first(self):
+        policy = CostOrderPolicy({self.em: 10, self.thermal: 5, self.check: 1}, independent=[self.check])
+        evaluator = MachineEvaluator(self.steps, order_policy=policy)
+        full_results = evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual(self.log, ["check", "em", "thermal"])
+        # results stay in the declared order of the steps
+        self.assertEqual([r[2].conditions.changes() for r in full_results], [{n: n} for n in ("em", "thermal", "check")])
+        self.assertEqual(full_results[1][1], "em")
+
+    def test_gated_independent_step_skips_expensive_steps(self):
+        policy = CostOrderPolicy({self.em: 10, self.thermal: 5, self.check: 1}, independent=[self.check])
+        evaluator = MachineEvaluator(
+            self.steps, gates={self.check: lambda results, state_out: False}, order_policy=policy
+        )
+        with self.assertRaises(InvalidDesign):
+            evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual(self.log, ["check"])
+
+    def test_independent_step_after_its_dependencies(self):
+        check = RecordingStep("check", self.log, reads="em")
+        steps = [self.em, self.thermal, check]
+        policy = CostOrderPolicy(
+            {self.em: 1, self.thermal: 5, check: 2}, independent=[check], depends_on={check: [self.em]}
+        )
+        self.assertEqual(policy.order(steps), [0, 2, 1])
+        MachineEvaluator(steps, order_policy=policy).evaluate(Design(Machine(1)))
+        self.assertEqual(self.log, ["em", "check", "thermal"])
+
+
+class FailingStep(RecordingStep):
+    """Raises error on the first runs, then behaves as a RecordingStep"""
+
+    def __init__(self, name, log, error, n_failures=1):
+        super().__init__(name, log)
+        self.error = error
+        self.n_failures = n_failures
+
+    def step(self, state_in):
+        if self.n_failures > 0:
+            self.n_failures -= 1
+            self.log.append(self.name + " failed")
+            raise self.error
+        return super().step(state_in)
+
+
+# InvalidDesign of another copy of mach_opt, such as the one of eMachPrivate
+ForeignInvalidDesign = type("InvalidDesign", (Exception,), {})
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = CheckpointStore(tmp.name, design_key=lambda design: "design")
+        self.log = []
+
+    def evaluator(self, error):
+        steps = [RecordingStep("em", self.log), FailingStep("fea", self.log, error), RecordingStep("thermal", self.log)]
+        return MachineEvaluator(steps, checkpoint=self.store)
+
+    def test_resume_after_failure(self):
+        evaluator = self.evaluator(RuntimeError("license server unavailable"))
+        with self.assertRaises(RuntimeError):
+            evaluator.evaluate(Design(Machine(1)))
+        self.assertTrue(os.path.exists(self.store.filepath("design")))
+        full_results = evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual(self.log, ["em", "fea failed", "fea", "thermal"])
+        self.assertEqual(full_results[-1][-1].conditions.em, "em")
+        self.assertFalse(os.path.exists(self.store.filepath("design")))
+
+    def test_removed_on_success(self):
+        evaluator = MachineEvaluator([RecordingStep("em", self.log)], checkpoint=self.store)
+        evaluator.evaluate(Design(Machine(1)))
+        self.assertEqual(os.listdir(self.store.directory), [])
+
+    def test_removed_on_invalid_design(self):
+        for error in (InvalidDesign(), ForeignInvalidDesign()):
+            with self.assertRaises(type(error)):
+                self.evaluator(error).evaluate(Design(Machine(1)))
+            self.assertFalse(os.path.exists(self.store.filepath("design")))
+
+
+if __name__ == "__main__":
+    unittest.main()
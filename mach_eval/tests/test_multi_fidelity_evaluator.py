@@ -0,0 +1,73 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from mach_eval import MultiFidelityEvaluator, ParetoPromotionPolicy
+from mach_opt import DataHandler
+
+
+class StubEvaluator:
+    """Evaluates a design, given by its objectives, with a fixed relative error"""
+
+    def __init__(self, name, error=0.0):
+        self.name = name
+        self.error = error
+        self.n_calls = 0
+
+    def evaluate(self, design):
+        self.n_calls += 1
+        return [(self.name, [(1 + self.error) * obj for obj in design])]
+
+
+class StubDesignSpace:
+    def get_objectives(self, full_results):
+        return full_results[-1][1]
+
+
+class TestMultiFidelityEvaluator(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dh = DataHandler(
+            os.path.join(self.tmp.name, "archive.pkl"), os.path.join(self.tmp.name, "designer.pkl")
+        )
+        self.low = StubEvaluator("low", error=0.02)
+        self.high = StubEvaluator("high")
+        self.evaluator = MultiFidelityEvaluator(
+            self.low, self.high, StubDesignSpace(), self.dh, ParetoPromotionPolicy(margin=0.05)
+        )
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_promotes_with_empty_archive(self):
+        results = self.evaluator.evaluate([1.0, 1.0])
+        self.assertEqual(results.fidelity, "high")
+        self.assertEqual([name for name, _ in results], ["low", "high"])
+        self.assertEqual((self.evaluator.n_low, self.evaluator.n_high), (1, 1))
+
+    def test_dominated_design_not_promoted(self):
+        self.dh.save_to_archive([0.0], None, [], [1.0, 1.0])
+        results = self.evaluator.evaluate([2.0, 2.0])
+        self.assertEqual(results.fidelity, "low")
+        self.assertEqual(self.high.n_calls, 0)
+
+    def test_design_within_margin_promoted(self):
+        self.dh.save_to_archive([0.0], None, [], [1.0, 1.0])
+        results = self.evaluator.evaluate([1.02, 1.02])
+        self.assertEqual(results.fidelity, "high")
+
+    def test_does_not_write_archive(self):
+        self.evaluator.evaluate([1.0, 1.0])
+        self.assertFalse(os.path.exists(self.dh.archive_filepath))
+
+    def test_copy_ranks_against_shared_archive(self):
+        # worker processes of DesignProblem.batch_fitness hold pickled copies of the evaluator
+        worker = pickle.loads(pickle.dumps(self.evaluator))
+        self.dh.save_to_archive([0.0], None, [], [1.0, 1.0])
+        results = worker.evaluate([2.0, 2.0])
+        self.assertEqual(results.fidelity, "low")
+
+
+if __name__ == "__main__":
+    unittest.main()
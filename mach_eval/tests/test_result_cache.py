@@ -0,0 +1,95 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from mach_eval import AnalysisStep, CachedAnalyzer, EvaluationMonitor, MachineEvaluator, ResultCache
+
+
+class Problem:
+    def __init__(self, data, params):
+        self.data = data
+        self.params = params
+
+
+# problems analyzed by CountingAnalyzer, kept outside the analyzer as its attributes are part of the cache key
+analyzed = []
+
+
+class CountingAnalyzer:
+    def __init__(self, scale=1.0):
+        self.scale = scale
+
+    def analyze(self, problem):
+        analyzed.append(problem)
+        return self.scale * np.sum(problem.data) * np.ones(1000)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        analyzed.clear()
+
+    def test_hit_and_miss(self):
+        analyzer = CountingAnalyzer()
+        cached = CachedAnalyzer(analyzer, ResultCache(self.tmp.name))
+        first = cached.analyze(Problem(np.arange(3.0), {"a": 1}))
+        np.testing.assert_array_equal(cached.analyze(Problem(np.arange(3.0), {"a": 1})), first)
+        self.assertEqual(len(analyzed), 1)
+        cached.analyze(Problem(np.arange(4.0), {"a": 1}))
+        self.assertEqual(len(analyzed), 2)
+
+    def test_key_is_canonical(self):
+        cache = ResultCache(self.tmp.name)
+        analyzer = CountingAnalyzer()
+        data = np.arange(6.0).reshape(2, 3)
+        key = cache.key(analyzer, Problem(data, {"a": 1.0, "b": [1, 2]}))
+        # same values with another memory layout, float type and dict insertion order
+        equal = Problem(np.asfortranarray(data), {"b": [1, 2], "a": np.float64(1.0)})
+        self.assertEqual(cache.key(analyzer, equal), key)
+        self.assertNotEqual(cache.key(analyzer, Problem(data, {"a": 2.0, "b": [1, 2]})), key)
+        self.assertNotEqual(cache.key(CountingAnalyzer(scale=2.0), Problem(data, {"a": 1.0, "b": [1, 2]})), key)
+
+    def test_key_of_cycles_and_unpicklable_values(self):
+        cache = ResultCache(self.tmp.name)
+        problem = Problem(np.arange(3.0), {})
+        problem.params["self"] = problem
+        self.assertIsNotNone(cache.key(CountingAnalyzer(), problem))
+        self.assertIsNone(cache.key(CountingAnalyzer(), Problem(np.arange(3.0), {"f": open(os.devnull)})))
+
+    def test_eviction_of_least_recently_used(self):
+        analyzer = CountingAnalyzer()
+        # each result takes about 8 kB
+        cache = ResultCache(self.tmp.name, max_size=20e3)
+        cached = CachedAnalyzer(analyzer, cache)
+        problems = [Problem(np.array([float(i)]), {}) for i in range(3)]
+        cached.analyze(problems[0])
+        cached.analyze(problems[1])
+        os.utime(cache.filepath(cache.key(analyzer, problems[0])), (0, 0))
+        cached.analyze(problems[2])
+        self.assertEqual(len(os.listdir(self.tmp.name)), 2)
+        self.assertFalse(os.path.exists(cache.filepath(cache.key(analyzer, problems[0]))))
+        cached.analyze(problems[1])
+        cached.analyze(problems[2])
+        self.assertEqual(len(analyzed), 3)
+
+    def test_step_named_after_wrapped_analyzer(self):
+        class ProblemDefinition:
+            def get_problem(self, state):
+                return Problem(np.arange(3.0), {})
+
+        class PostAnalyzer:
+            def get_next_state(self, results, state_in):
+                return state_in.copy()
+
+        cached = CachedAnalyzer(CountingAnalyzer(), ResultCache(self.tmp.name))
+        monitor = EvaluationMonitor()
+        step = AnalysisStep(ProblemDefinition(), cached, PostAnalyzer())
+        full_results = MachineEvaluator([step], monitor=monitor).evaluate(None)
+        self.assertEqual({r["name"] for r in full_results.metrics}, {"CountingAnalyzer"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,53 +7,111 @@ import pygmo as pg
 import pandas as pd
 from typing import Protocol, runtime_checkable, Any
 from abc import abstractmethod, ABC
+from contextlib import contextmanager
 import numpy as np
+import os
 import pickle
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    import msvcrt
+
+    fcntl = None
 
 __all__ = [
     "DesignOptimizationMOEAD",
+    "DesignOptimizationArchipelago",
     "DesignProblem",
     "Designer",
     "Design",
     "Evaluator",
     "DesignSpace",
+    "FitnessCache",
     "DataHandler",
+    "IndexedDataHandler",
     "OptiData",
+    "ParetoSet",
     "InvalidDesign",
 ]
 
 
 class DesignOptimizationMOEAD:
+    """Optimization of a DesignProblem with the MOEA/D algorithm of pygmo
+
+    The initial population, and a generation loaded to resume an optimization, are evaluated as one batch with
+    DesignProblem.batch_fitness. If the problem has several workers, each generation is evolved with pygmo's
+    generational MOEA/D (moead_gen), which evaluates all new individuals of a generation as one batch in parallel.
+    The worker processes are kept from the initial population until run_optimization returns. Use
+    DesignOptimizationArchipelago to evolve several populations concurrently.
+
+    Attributes:
+        design_problem: DesignProblem to optimize.
+    """
+
     def __init__(self, design_problem):
         self.design_problem = design_problem
         self.prob = pg.problem(self.design_problem)
 
     def initial_pop(self, pop_size):
-        pop = pg.population(self.prob, size=pop_size)
+        if self.prob.has_batch_fitness():
+            # evaluate the initial population as one batch
+            pop = pg.population(self.prob, size=pop_size, b=pg.bfe(pg.member_bfe()))
+        else:
+            pop = pg.population(self.prob, size=pop_size)
         return pop
 
-    def run_optimization(self, pop, gen_size, filepath=None):
-        algo = pg.algorithm(
-            pg.moead(
-                gen=1,
-                weight_generation="grid",
-                decomposition="tchebycheff",
-                neighbours=20,
-                CR=1,
-                F=0.5,
-                eta_m=20,
-                realb=0.9,
-                limit=2,
-                preserve_diversity=True,
-            )
+    def create_algorithm(self, batch=None):
+        """Returns the algorithm evolving the population by one generation
+
+        Args:
+            batch: Evaluate each generation as one batch with DesignProblem.batch_fitness. Defaults to True if the
+                problem has several workers.
+        """
+        if batch is None:
+            batch = getattr(self.design_problem, "n_workers", 1) > 1
+        settings = dict(
+            gen=1,
+            weight_generation="grid",
+            decomposition="tchebycheff",
+            neighbours=20,
+            CR=1,
+            F=0.5,
+            eta_m=20,
+            realb=0.9,
+            limit=2,
+            preserve_diversity=True,
         )
-        for _ in range(0, gen_size):
-            print("This is iteration", _)
-            pop = algo.evolve(pop)
-            print("Saving current generation")
-            self.save_pop(filepath, pop)
+        if batch:
+            uda = pg.moead_gen(**settings)
+            uda.set_bfe(pg.bfe())
+        else:
+            uda = pg.moead(**settings)
+        algo = pg.algorithm(uda)
+        return algo
+
+    def run_optimization(self, pop, gen_size, filepath=None):
+        algo = self.create_algorithm()
+        try:
+            for _ in range(0, gen_size):
+                print("This is iteration", _)
+                pop = algo.evolve(pop)
+                print("Saving current generation")
+                self.save_pop(filepath, pop)
+        finally:
+            self.close(pop.problem)
         return pop
 
+    def close(self, prob):
+        """Shuts down the worker processes of the DesignProblem held by pygmo problem prob"""
+        design_problem = prob.extract(DesignProblem)
+        if design_problem is not None:
+            design_problem.close()
+
     #  methods to save and load latest generation for resuming optimization
     def save_pop(self, filepath, pop):
         df = pd.DataFrame(pop.get_x())
@@ -65,12 +123,89 @@ class DesignOptimizationMOEAD:
         except FileNotFoundError:
             return None
         pop = pg.population(self.prob)
+        if self.prob.has_batch_fitness():
+            # re-evaluate the saved generation as one batch
+            xs = df.iloc[:pop_size].to_numpy()
+            fs = self.prob.batch_fitness(xs.ravel()).reshape(len(xs), -1)
+            for x, f in zip(xs, fs):
+                pop.push_back(x, f)
+            return pop
         for i in range(pop_size):
             print(df.iloc[i])
             pop.push_back(df.iloc[i])
         return pop
 
 
+class DesignOptimizationArchipelago(DesignOptimizationMOEAD):
+    """Island model optimization evolving several MOEA/D populations concurrently
+
+    Each island evolves its own population in a separate process, and individuals migrate between islands after
+    every generation along the connections of the migration topology. As islands run in separate processes, the
+    script starting the optimization must be guarded by `if __name__ == "__main__":`.
+
+    Attributes:
+        design_problem: DesignProblem to optimize.
+
+        n_islands: Number of islands.
+
+        topology: pygmo migration topology connecting the islands, pg.ring() by default.
+
+        island: pygmo user defined island evolving each population, pg.mp_island() by default.
+    """
+
+    def __init__(self, design_problem, n_islands, topology=None, island=None):
+        super().__init__(design_problem)
+        self.n_islands = n_islands
+        self.topology = pg.ring() if topology is None else topology
+        self.island = pg.mp_island() if island is None else island
+
+    def initial_pop(self, pop_size):
+        pops = [super(DesignOptimizationArchipelago, self).initial_pop(pop_size) for _ in range(self.n_islands)]
+        # islands evolve in their own processes, which start their own workers if needed
+        self.close(self.prob)
+        return self.create_archipelago(pops)
+
+    def create_archipelago(self, pops):
+        """Returns an archipelago with one island per population"""
+        archi = pg.archipelago(t=self.topology)
+        # each island evolves its population serially, the islands evolve in parallel
+        algo = self.create_algorithm(batch=False)
+        for pop in pops:
+            archi.push_back(udi=self.island, algo=algo, pop=pop)
+        return archi
+
+    def run_optimization(self, archi, gen_size, filepath=None):
+        for _ in range(0, gen_size):
+            print("This is iteration", _)
+            archi.evolve()
+            archi.wait_check()
+            print("Saving current generation")
+            self.save_pop(filepath, archi)
+        return archi
+
+    #  methods to save and load latest generation of each island for resuming optimization
+    def island_filepath(self, filepath, i):
+        """Returns the filepath of the i-th island checkpoint"""
+        root, ext = os.path.splitext(filepath)
+        return root + "_island" + str(i) + ext
+
+    def save_pop(self, filepath, archi):
+        if filepath is None:
+            return
+        for i, island in enumerate(archi):
+            super().save_pop(self.island_filepath(filepath, i), island.get_population())
+
+    def load_pop(self, filepath, pop_size):
+        pops = []
+        for i in range(self.n_islands):
+            pop = super().load_pop(self.island_filepath(filepath, i), pop_size)
+            if pop is None:
+                return None
+            pops.append(pop)
+        self.close(self.prob)
+        return self.create_archipelago(pops)
+
+
 class DesignProblem:
     """Class to create, evaluate, and optimize designs
 
@@ -84,6 +219,12 @@ class DesignProblem:
         dh: Data handlers which enable saving optimization results and its resumption.
 
         invalid_design_objs: List of (large) objective values to use for invalid designs
+
+        n_workers: Number of worker processes used by batch_fitness. Designs are evaluated serially if 1.
+
+        cache_size: Number of designs kept in the fitness cache. Fitness values are not cached if 0.
+
+        cache_tol: Tolerance, relative to the bounds, below which free variables are considered identical by the cache
     """
 
     def __init__(
@@ -93,11 +234,17 @@ class DesignProblem:
         design_space: "DesignSpace",
         dh: "DataHandler",
         invalid_design_objs=None,
+        n_workers: int = 1,
+        cache_size: int = 0,
+        cache_tol: float = 1e-9,
     ):
         self.__designer = designer
         self.__evaluator = evaluator
         self.__design_space = design_space
         self.__dh = dh
+        self.__n_workers = n_workers
+        # copies of the problem made by pygmo share the worker pool through this id
+        self.__pool_id = uuid.uuid4().hex
 
         if invalid_design_objs is None:
             self.__invalid_design_objs = 1e4 * np.ones([1, self.get_nobj()])
@@ -106,6 +253,18 @@ class DesignProblem:
                 raise Exception("Incorrect length for invalid_design_objs")
             self.__invalid_design_objs = invalid_design_objs
 
+        self.__cache = None
+        if cache_size > 0:
+            self.__cache = FitnessCache(self.get_bounds(), cache_tol, cache_size)
+            # seed cache with previously archived designs when resuming an optimization
+            if hasattr(dh, "get_archive_data"):
+                try:
+                    fitness, free_vars = dh.get_archive_data()
+                except FileNotFoundError:
+                    fitness, free_vars = [], []
+                for x, objs in zip(free_vars[-cache_size:], fitness[-cache_size:]):
+                    self.__cache.put(x, objs)
+
         dh.save_designer(designer)
 
     def fitness(self, x: "tuple") -> "tuple":
@@ -123,13 +282,105 @@ class DesignProblem:
         Raises:
             e: The errors encountered during design creation or evaluation apart from the InvalidDesign error
         """
+        if self.__cache is not None:
+            objs = self.__cache.get(x)
+            if objs is not None:
+                return objs
+        objs, record = self._evaluate(x)
+        self.__save(record)
+        return objs
+
+    def batch_fitness(self, dvs: "np.ndarray") -> "np.ndarray":
+        """Calculates the fitness of a batch of designs, in parallel if n_workers > 1.
+
+        This function is used by pygmo batch fitness evaluators (bfe). Designs are created and evaluated by a pool of
+        worker processes, while all results are saved to the archive by the calling process, one design at a time,
+        so that the archive is never written to concurrently. The pool is started on the first batch and reused by
+        later batches, including those of copies of the problem held by pygmo populations, until close is called.
+        When running with multiple workers, the script starting the
+        optimization must be guarded by `if __name__ == "__main__":`.
+
+        Args:
+            dvs: Free variables of all designs, concatenated into one flat array
+
+        Returns:
+            fvs: Fitness of all designs, concatenated into one flat array
+        """
+        xs = np.reshape(dvs, (-1, len(self.get_bounds()[0])))
+        fvs = [None] * len(xs)
+
+        # only evaluate designs which are neither cached nor repeated within the batch
+        pending = OrderedDict()
+        for i, x in enumerate(xs):
+            if self.__cache is None:
+                pending[i] = [i]
+                continue
+            objs = self.__cache.get(x)
+            if objs is not None:
+                fvs[i] = np.hstack(objs)
+            else:
+                pending.setdefault(self.__cache.key(x), []).append(i)
+        new_xs = [xs[idx[0]] for idx in pending.values()]
+
+        if self.__n_workers > 1 and len(new_xs) > 1:
+            evaluations = list(self.__get_pool().map(_evaluate_in_worker, new_xs))
+        else:
+            evaluations = [self._evaluate(x) for x in new_xs]
+
+        for idx, (objs, record) in zip(pending.values(), evaluations):
+            self.__save(record)
+            for i in idx:
+                fvs[i] = np.hstack(objs)
+        return np.concatenate(fvs)
+
+    @property
+    def n_workers(self):
+        """Number of worker processes used by batch_fitness"""
+        return self.__n_workers
+
+    def __pool_key(self):
+        # pools are only shared within the process that started them, e.g. not with forked island processes
+        return os.getpid(), self.__pool_id
+
+    def __get_pool(self):
+        """Returns the pool of worker processes, started on first use with a copy of the problem in each worker"""
+        pool = _pools.get(self.__pool_key())
+        if pool is None:
+            pool = ProcessPoolExecutor(max_workers=self.__n_workers, initializer=_init_worker, initargs=(self,))
+            _pools[self.__pool_key()] = pool
+        return pool
+
+    def close(self):
+        """Shuts down the worker processes used by batch_fitness, which are started again if needed"""
+        pool = _pools.pop(self.__pool_key(), None)
+        if pool is not None:
+            pool.shutdown()
+
+    def __save(self, record):
+        """Saves an evaluated design to the archive and fitness cache"""
+        if record is None:
+            return
+        self.__dh.save_to_archive(*record)
+        if self.__cache is not None:
+            x, design, full_results, objs = record
+            self.__cache.put(x, objs)
+
+    def _evaluate(self, x: "tuple") -> "tuple":
+        """Creates and evaluates a design without saving it to the archive.
+
+        Args:
+            x: The list of free variables required to create a complete design
+
+        Returns:
+            objs: Returns the fitness of the design
+            record: Arguments for DataHandler.save_to_archive, None for invalid designs
+        """
         try:
             design = self.__designer.create_design(x)
             full_results = self.__evaluator.evaluate(design)
             objs = self.__design_space.get_objectives(full_results)
-            self.__dh.save_to_archive(x, design, full_results, objs)
             # print('The fitness values are', objs)
-            return objs
+            return objs, (x, design, full_results, objs)
 
         except Exception as e:
             # Check if e is an InvalidDesign exception using the class name
@@ -137,14 +388,14 @@ class DesignProblem:
             if (e.__class__.__name__ == InvalidDesign().__class__.__name__): 
                 temp = tuple(map(tuple, self.__invalid_design_objs))
                 objs = temp[0]
-                return objs
+                return objs, None
 
             ################ Uncomment below block of code to prevent one off errors from JMAG ###################
             elif type(e) is FileNotFoundError:
                 print('**********ERROR*************')
                 temp = tuple(map(tuple, self.__invalid_design_objs))
                 objs = temp[0]
-                return objs
+                return objs, None
             else:
                 raise e
 
@@ -157,6 +408,47 @@ class DesignProblem:
         return self.__design_space.n_obj
 
 
+def _lock_file(f):
+    """ Blocks until an exclusive lock of the open file f is acquired"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        return
+    while 1:
+        try:
+            # lock the first byte, which is the same byte whether or not the file is empty
+            os.lseek(f.fileno(), 0, os.SEEK_SET)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            return
+        except OSError:
+            # LK_LOCK gives up after 10 attempts, one second apart
+            pass
+
+
+def _unlock_file(f):
+    """ Releases the lock of the open file f acquired by _lock_file"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        return
+    os.lseek(f.fileno(), 0, os.SEEK_SET)
+    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+# worker pools of batch_fitness, shared by all copies of a DesignProblem in a process
+_pools = {}
+
+_worker_problem = None
+
+
+def _init_worker(problem):
+    """Keeps the DesignProblem sent once to each worker process of batch_fitness"""
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _evaluate_in_worker(x):
+    return _worker_problem._evaluate(x)
+
+
 @runtime_checkable
 class Designer(Protocol):
     """Parent class for all designers"""
@@ -200,6 +492,50 @@ class DesignSpace(Protocol):
         raise NotImplementedError
 
 
+class FitnessCache:
+    """Bounded cache of fitness values keyed on free variables, discarding the least recently used designs first
+
+    Attributes:
+        bounds: Lower and upper bounds of the free variables.
+
+        tol: Tolerance, relative to the bounds, below which free variables are considered identical.
+
+        max_size: Maximum number of cached designs.
+    """
+
+    def __init__(self, bounds, tol=1e-9, max_size=10000):
+        self.lower = np.asarray(bounds[0], dtype=float)
+        self.span = np.asarray(bounds[1], dtype=float) - self.lower
+        self.span[self.span == 0] = 1
+        self.tol = tol
+        self.max_size = max_size
+        self.__objs = OrderedDict()
+
+    def __len__(self):
+        return len(self.__objs)
+
+    def key(self, x):
+        """Returns the key of free variables x, quantized to the tolerance of the cache"""
+        normalized = (np.hstack(x).astype(float) - self.lower) / self.span
+        return tuple(np.round(normalized / self.tol).astype(np.int64))
+
+    def get(self, x):
+        """Returns cached fitness values of free variables x, None if x is not cached"""
+        key = self.key(x)
+        objs = self.__objs.get(key)
+        if objs is not None:
+            self.__objs.move_to_end(key)
+        return objs
+
+    def put(self, x, objs):
+        """Caches fitness values objs of free variables x"""
+        key = self.key(x)
+        self.__objs[key] = objs
+        self.__objs.move_to_end(key)
+        while len(self.__objs) > self.max_size:
+            self.__objs.popitem(last=False)
+
+
 class DataHandler():
     """ Parent class for data handlers"""
 
@@ -218,9 +554,34 @@ class DataHandler():
         """
         # assign relevant data to OptiData class attributes
         opti_data = OptiData(x=x, design=design, full_results=full_results, objs=objs)
+        data = pickle.dumps(opti_data, -1)
+        with self.archive_lock():
+            pareto = self.read_pareto()
+            offset = self.append_to_archive(data)
+            self.update_pareto(pareto, offset, len(data), x, objs)
+
+    def append_to_archive(self, data):
+        """ Append a pickled design to the archive and return its offset in the archive"""
+
         # write to pkl file. 'ab' indicates binary append
         with open(self.archive_filepath, 'ab') as archive:
-            pickle.dump(opti_data, archive, -1)
+            offset = archive.seek(0, os.SEEK_END)
+            archive.write(data)
+        return offset
+
+    @contextmanager
+    def archive_lock(self):
+        """ Lock the archive against writes from other processes, such as other islands of an archipelago
+
+        The lock is held by the operating system on the file archive_filepath + '.lock', so it is released if the
+        process holding it exits, however long it has been held.
+        """
+        with open(self.archive_filepath + '.lock', 'ab') as lock_file:
+            _lock_file(lock_file)
+            try:
+                yield
+            finally:
+                _unlock_file(lock_file)
 
     def load_from_archive(self):
         """ Load data from Pickle optimization archive """
@@ -255,6 +616,14 @@ class DataHandler():
                     break
             return obj
 
+    def get_metrics(self):
+        """ Return the evaluation metrics recorded for all archived designs, see mach_eval.EvaluationMonitor"""
+
+        metrics = []
+        for data in self.load_from_archive():
+            metrics.extend(getattr(data.full_results, "metrics", []))
+        return metrics
+
     def get_archive_data(self):
         archive = self.load_from_archive()
         fitness = []
@@ -264,29 +633,220 @@ class DataHandler():
             free_vars.append(data.x)
         return fitness, free_vars
     
+    @property
+    def pareto_filepath(self):
+        """ Filepath of the Pareto set stored alongside the archive"""
+        return self.archive_filepath + '.pareto'
+
+    def read_pareto(self):
+        """ Read the Pareto set of the archive, rebuilding it if it is out of date. The archive must be locked."""
+
+        try:
+            size = os.path.getsize(self.archive_filepath)
+        except FileNotFoundError:
+            return ParetoSet()
+        try:
+            with open(self.pareto_filepath, 'rb') as f:
+                pareto = pickle.load(f)
+            if pareto.archive_size == size:
+                return pareto
+        except FileNotFoundError:
+            pass
+        return self.rebuild_pareto()
+
+    def write_pareto(self, pareto):
+        """ Replace the stored Pareto set of the archive"""
+
+        temp_filepath = self.pareto_filepath + '.tmp'
+        with open(temp_filepath, 'wb') as f:
+            pickle.dump(pareto, f, -1)
+        os.replace(temp_filepath, self.pareto_filepath)
+
+    def update_pareto(self, pareto, offset, size, x, objs):
+        """ Offer a newly archived design to the Pareto set and store the updated set
+
+        Args:
+            pareto: Pareto set of the archive before the design was appended
+            offset: Position of the pickled design in the archive
+            size: Size of the pickled design in bytes
+            x: Free variables used to create design
+            objs: Fitness values corresponding to a design
+        """
+        pareto.add(offset, x, objs)
+        pareto.archive_size = offset + size
+        self.write_pareto(pareto)
+
+    def rebuild_pareto(self):
+        """ Build the Pareto set from all designs in the archive"""
+
+        pareto = ParetoSet()
+        with open(self.archive_filepath, 'rb') as archive:
+            while 1:
+                offset = archive.tell()
+                try:
+                    data = pickle.load(archive)
+                except EOFError:
+                    break
+                pareto.add(offset, data.x, data.objs)
+            pareto.archive_size = archive.tell()
+        self.write_pareto(pareto)
+        return pareto
+
     def get_pareto_data(self):
         """ Return data of Pareto optimal designs"""
-        archive = self.load_from_archive()
-        fitness, free_vars = self.get_archive_data()
-        ndf, dl, dc, ndr = pg.fast_non_dominated_sorting(fitness)
-        fronts_index = ndf[0]
-        
-        i = 0
-        for data in archive:
-            if i in fronts_index:
-                yield data
-            i = i+1
+        with self.archive_lock():
+            pareto = self.read_pareto()
+        with open(self.archive_filepath, 'rb') as archive:
+            for offset in pareto.offsets:
+                archive.seek(offset)
+                yield pickle.load(archive)
 
     def get_pareto_fitness_freevars(self):
         """ Extract fitness and free variables for Pareto optimal designs """
 
-        archive = self.get_pareto_data()
-        fitness = []
-        free_vars = []
-        for data in archive:
-            fitness.append(data.objs)
-            free_vars.append(data.x)
-        return fitness, free_vars
+        with self.archive_lock():
+            pareto = self.read_pareto()
+        return list(pareto.fitness), list(pareto.free_vars)
+
+
+class IndexedDataHandler(DataHandler):
+    """ Data handler keeping a compact index of the optimization archive
+
+    The archive file holds the same stream of pickled OptiData objects as DataHandler. Alongside it, an index file
+    holds a header [n_x, n_obj] followed by one fixed width row [offset, size, x, objs] per design, where offset and
+    size locate the pickled design within the archive. Fitness and free variable queries only read the index, and
+    single designs are loaded in O(1).
+
+    Attributes:
+        archive_filepath: Filepath of the archive holding the pickled designs
+
+        designer_filepath: Filepath of the pickled designer
+
+        index_filepath: Filepath of the index, archive_filepath + '.idx' by default
+    """
+
+    def __init__(self, archive_filepath, designer_filepath, index_filepath=None):
+        super().__init__(archive_filepath, designer_filepath)
+        if index_filepath is None:
+            index_filepath = archive_filepath + '.idx'
+        self.index_filepath = index_filepath
+
+    def save_to_archive(self, x, design, full_results, objs):
+        """ Save machine evaluation data to optimization archive and index its free variables and fitness
+
+        Args:
+            x: Free variables used to create design
+            design: Created design
+            full_results: Input, output, and results corresponding to each step of an evaluator
+            objs: Fitness values corresponding to a design
+        """
+        opti_data = OptiData(x=x, design=design, full_results=full_results, objs=objs)
+        data = pickle.dumps(opti_data, -1)
+        with self.archive_lock():
+            pareto = self.read_pareto()
+            offset = self.append_to_archive(data)
+            # the index row is written after the design, so designs are only indexed once fully written
+            self.append_to_index(offset, len(data), x, objs)
+            self.update_pareto(pareto, offset, len(data), x, objs)
+
+    def append_to_index(self, offset, size, x, objs):
+        """ Append a row locating a pickled design to the index
+
+        Args:
+            offset: Position of the pickled design in the archive
+            size: Size of the pickled design in bytes
+            x: Free variables used to create design
+            objs: Fitness values corresponding to a design
+        """
+        x = np.hstack(x).astype(float)
+        objs = np.hstack(objs).astype(float)
+        with open(self.index_filepath, 'ab') as index:
+            if index.seek(0, os.SEEK_END) == 0:
+                index.write(np.array([len(x), len(objs)], dtype=np.int64).tobytes())
+            else:
+                n_x, n_obj = self.read_index_header()
+                if (n_x, n_obj) != (len(x), len(objs)):
+                    raise Exception("Free variables and fitness do not match the archive index")
+            index.write(np.hstack([offset, size, x, objs]).tobytes())
+
+    def read_index_header(self):
+        """ Returns number of free variables and objectives stored in the index"""
+        with open(self.index_filepath, 'rb') as index:
+            n_x, n_obj = np.frombuffer(index.read(16), dtype=np.int64)
+        return int(n_x), int(n_obj)
+
+    def read_index(self):
+        """ Read all rows of the index
+
+        Returns:
+            offsets: Position of each pickled design in the archive
+            sizes: Size of each pickled design in bytes
+            free_vars: Array of free variables, one row per design
+            fitness: Array of fitness values, one row per design
+        """
+        with open(self.index_filepath, 'rb') as index:
+            n_x, n_obj = np.frombuffer(index.read(16), dtype=np.int64)
+            table = np.fromfile(index, dtype=np.float64)
+        width = 2 + n_x + n_obj
+        # ignore a partially written last row
+        table = table[: len(table) // width * width].reshape(-1, width)
+        offsets = table[:, 0].astype(np.int64)
+        sizes = table[:, 1].astype(np.int64)
+        return offsets, sizes, table[:, 2 : 2 + n_x], table[:, 2 + n_x :]
+
+    def rebuild_index(self):
+        """ Index an existing archive, such as one written by DataHandler"""
+
+        with self.archive_lock():
+            if os.path.exists(self.index_filepath):
+                os.remove(self.index_filepath)
+            with open(self.archive_filepath, 'rb') as archive:
+                while 1:
+                    offset = archive.tell()
+                    try:
+                        data = pickle.load(archive)
+                    except EOFError:
+                        break
+                    self.append_to_index(offset, archive.tell() - offset, data.x, data.objs)
+
+    def load_record(self, i):
+        """ Load the i-th design of the archive
+
+        Args:
+            i: Index of the design in order of archiving
+
+        Returns:
+            opti_data: OptiData of the design
+        """
+        with open(self.index_filepath, 'rb') as index:
+            n_x, n_obj = np.frombuffer(index.read(16), dtype=np.int64)
+            width = 2 + int(n_x + n_obj)
+            # a partially written last row is not counted
+            n_rows = (index.seek(0, os.SEEK_END) - 16) // (width * 8)
+            if not -n_rows <= i < n_rows:
+                raise IndexError("Design index out of range")
+            index.seek(16 + (i % n_rows) * width * 8)
+            offset, size = np.frombuffer(index.read(16), dtype=np.float64).astype(np.int64)
+        with open(self.archive_filepath, 'rb') as archive:
+            archive.seek(offset)
+            return pickle.loads(archive.read(size))
+
+    def get_archive_data(self):
+        _, _, free_vars, fitness = self.read_index()
+        return list(fitness), list(free_vars)
+
+    def rebuild_pareto(self):
+        """ Build the Pareto set from the archive index"""
+
+        if not os.path.exists(self.index_filepath):
+            return super().rebuild_pareto()
+        offsets, sizes, free_vars, fitness = self.read_index()
+        pareto = ParetoSet()
+        for offset, x, objs in zip(offsets, free_vars, fitness):
+            pareto.add(offset, x, objs)
+        pareto.archive_size = offsets[-1] + sizes[-1] if len(offsets) else 0
+        self.write_pareto(pareto)
+        return pareto
 
 
 class OptiData:
@@ -299,6 +859,51 @@ class OptiData:
         self.objs = objs
 
 
+class ParetoSet:
+    """Non-dominated subset of the designs in an optimization archive, assuming minimization of all objectives
+
+    Attributes:
+        offsets: Position of each non-dominated design in the archive, in order of archiving
+
+        free_vars: Free variables of each non-dominated design
+
+        fitness: Fitness values of each non-dominated design
+
+        archive_size: Size of the archive in bytes when the set was last updated
+    """
+
+    def __init__(self):
+        self.offsets = []
+        self.free_vars = []
+        self.fitness = []
+        self.archive_size = 0
+
+    def add(self, offset, x, objs):
+        """ Add a design to the set if no design of the set dominates it, removing the designs it dominates
+
+        Args:
+            offset: Position of the design in the archive
+            x: Free variables used to create design
+            objs: Fitness values corresponding to a design
+
+        Returns:
+            added: True if the design is non-dominated
+        """
+        objs = np.hstack(objs).astype(float)
+        if len(self.fitness) > 0:
+            fitness = np.array(self.fitness)
+            if np.any(np.all(fitness <= objs, axis=1) & np.any(fitness < objs, axis=1)):
+                return False
+            keep = ~(np.all(objs <= fitness, axis=1) & np.any(objs < fitness, axis=1))
+            self.offsets = [o for o, k in zip(self.offsets, keep) if k]
+            self.free_vars = [v for v, k in zip(self.free_vars, keep) if k]
+            self.fitness = [f for f, k in zip(self.fitness, keep) if k]
+        self.offsets.append(offset)
+        self.free_vars.append(np.hstack(x).astype(float))
+        self.fitness.append(objs)
+        return True
+
+
 class InvalidDesign(Exception):
     """Exception raised for invalid designs"""
 
@@ -0,0 +1,99 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+from mach_opt import DataHandler, DesignOptimizationArchipelago, DesignProblem
+
+
+class Designer:
+    def create_design(self, x):
+        return x
+
+
+class Evaluator:
+    def evaluate(self, design):
+        return design
+
+
+class DesignSpace:
+    n_obj = 2
+    bounds = ([0, 0], [1, 1])
+
+    def get_objectives(self, full_results):
+        x = full_results
+        return (x[0], 1 - x[0] + x[1])
+
+
+def hold_lock(dh, locked, seconds):
+    with dh.archive_lock():
+        locked.set()
+        time.sleep(seconds)
+
+
+class TestArchiveLock(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.dh = DataHandler(os.path.join(self.tmp.name, "archive.pkl"), os.path.join(self.tmp.name, "designer.pkl"))
+
+    def test_waits_for_other_process(self):
+        locked = multiprocessing.Event()
+        holder = multiprocessing.Process(target=hold_lock, args=(self.dh, locked, 0.5))
+        holder.start()
+        locked.wait()
+        start = time.time()
+        with self.dh.archive_lock():
+            waited = time.time() - start
+        holder.join()
+        self.assertGreater(waited, 0.2)
+
+    def test_released_when_holder_dies(self):
+        locked = multiprocessing.Event()
+        holder = multiprocessing.Process(target=hold_lock, args=(self.dh, locked, 60))
+        holder.start()
+        locked.wait()
+        holder.kill()
+        holder.join()
+        start = time.time()
+        with self.dh.archive_lock():
+            self.assertLess(time.time() - start, 1)
+
+
+class TestDesignOptimizationArchipelago(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        dh = DataHandler(os.path.join(self.tmp.name, "archive.pkl"), os.path.join(self.tmp.name, "designer.pkl"))
+        self.opt = DesignOptimizationArchipelago(DesignProblem(Designer(), Evaluator(), DesignSpace(), dh), 3)
+
+    def test_island_filepath(self):
+        filepath = os.path.join(self.tmp.name, "pop.csv")
+        paths = [self.opt.island_filepath(filepath, i) for i in range(3)]
+        self.assertEqual(paths[1], os.path.join(self.tmp.name, "pop_island1.csv"))
+        self.assertEqual(len(set(paths)), 3)
+
+    def test_checkpoint_round_trip(self):
+        filepath = os.path.join(self.tmp.name, "pop.csv")
+        self.assertIsNone(self.opt.load_pop(filepath, 24))
+        archi = self.opt.initial_pop(24)
+        self.opt.save_pop(filepath, archi)
+        loaded = self.opt.load_pop(filepath, 24)
+        self.assertEqual(len(loaded), 3)
+        for island, loaded_island in zip(archi, loaded):
+            pop, loaded_pop = island.get_population(), loaded_island.get_population()
+            np.testing.assert_allclose(loaded_pop.get_x(), pop.get_x())
+            np.testing.assert_allclose(loaded_pop.get_f(), pop.get_f())
+
+    def test_load_requires_every_island(self):
+        filepath = os.path.join(self.tmp.name, "pop.csv")
+        self.opt.save_pop(filepath, self.opt.initial_pop(24))
+        os.remove(self.opt.island_filepath(filepath, 2))
+        self.assertIsNone(self.opt.load_pop(filepath, 24))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pygmo as pg
+
+from mach_opt import DesignProblem, DesignOptimizationMOEAD, InvalidDesign
+
+
+class Designer:
+    def __init__(self, x_max=0.9):
+        self.x_max = x_max
+
+    def create_design(self, x):
+        if x[0] > self.x_max:
+            raise InvalidDesign("x[0] too large")
+        return x
+
+
+class PidEvaluator:
+    """Returns the design along with the process evaluating it"""
+
+    def evaluate(self, design):
+        return [design, os.getpid()]
+
+
+class DesignSpace:
+    n_obj = 2
+    bounds = ([0, 0], [1, 1])
+
+    def get_objectives(self, full_results):
+        x = full_results[0]
+        return (x[0], 1 - x[0] + x[1])
+
+
+class DataHandler:
+    """Archives the free variables, evaluating process and archiving process of each design to a text file, which
+    is shared by the copies of the problem made by pygmo"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+    def save_designer(self, designer):
+        pass
+
+    def save_to_archive(self, x, design, full_results, objs):
+        with open(self.filepath, "a") as f:
+            f.write(" ".join(map(repr, [*map(float, x), full_results[1], os.getpid()])) + "\n")
+
+    @property
+    def records(self):
+        if not os.path.exists(self.filepath):
+            return []
+        with open(self.filepath) as f:
+            rows = [line.split() for line in f]
+        return [(tuple(float(v) for v in row[:-2]), int(row[-2]), int(row[-1])) for row in rows]
+
+
+class TestBatchFitness(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dh = DataHandler(os.path.join(tmp.name, "archive.txt"))
+        self.problem = DesignProblem(Designer(), PidEvaluator(), DesignSpace(), self.dh, n_workers=2)
+        self.addCleanup(self.problem.close)
+        self.xs = np.random.default_rng(0).random((12, 2)) * [0.8, 1]
+
+    def test_results_in_order(self):
+        fvs = self.problem.batch_fitness(self.xs.ravel()).reshape(len(self.xs), -1)
+        expected = [self.problem.fitness(x) for x in self.xs]
+        np.testing.assert_allclose(fvs, expected)
+
+    def test_archive_written_by_parent(self):
+        self.problem.batch_fitness(self.xs.ravel())
+        self.assertEqual([r[0] for r in self.dh.records], [tuple(x) for x in self.xs])
+        # designs are evaluated by the workers and archived by the calling process
+        self.assertNotIn(os.getpid(), {r[1] for r in self.dh.records})
+        self.assertEqual({r[2] for r in self.dh.records}, {os.getpid()})
+
+    def test_invalid_designs(self):
+        xs = self.xs.copy()
+        xs[[1, 4], 0] = 0.95
+        fvs = self.problem.batch_fitness(xs.ravel()).reshape(len(xs), -1)
+        np.testing.assert_array_equal(fvs[[1, 4]], 1e4)
+        self.assertEqual(len(self.dh.records), len(xs) - 2)
+
+    def test_pool_persists_until_closed(self):
+        self.problem.batch_fitness(self.xs.ravel())
+        workers = {r[1] for r in self.dh.records}
+        self.problem.batch_fitness(self.xs.ravel())
+        self.assertEqual({r[1] for r in self.dh.records[len(self.xs):]}, workers)
+        self.problem.close()
+        self.problem.batch_fitness(self.xs.ravel())
+        self.assertTrue(workers.isdisjoint({r[1] for r in self.dh.records[2 * len(self.xs):]}))
+
+    def test_pickled_copy_shares_pool(self):
+        self.problem.batch_fitness(self.xs.ravel())
+        workers = {r[1] for r in self.dh.records}
+        copy = pickle.loads(pickle.dumps(self.problem))
+        copy.batch_fitness(self.xs.ravel())
+        self.assertEqual({r[1] for r in self.dh.records[-len(self.xs):]}, workers)
+        copy.close()
+        self.problem.batch_fitness(self.xs.ravel())
+        self.assertTrue(workers.isdisjoint({r[1] for r in self.dh.records[-len(self.xs):]}))
+
+
+class TestDesignOptimizationMOEAD(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.filepath = os.path.join(tmp.name, "archive.txt")
+
+    def test_batch_algorithm_with_workers(self):
+        dh = DataHandler(self.filepath)
+        problem = DesignProblem(Designer(x_max=1), PidEvaluator(), DesignSpace(), dh, n_workers=2)
+        opt = DesignOptimizationMOEAD(problem)
+        self.assertIn("Generational", opt.create_algorithm().get_name())
+        pop = opt.initial_pop(28)
+        opt.run_optimization(pop, 2)
+        # the initial population and both generations are evaluated by the same workers
+        self.assertEqual(len(dh.records), 3 * 28)
+        self.assertEqual(len({r[1] for r in dh.records}), 2)
+        self.assertNotIn(os.getpid(), {r[1] for r in dh.records})
+
+    def test_serial_algorithm_without_workers(self):
+        problem = DesignProblem(Designer(), PidEvaluator(), DesignSpace(), DataHandler(self.filepath))
+        algo = DesignOptimizationMOEAD(problem).create_algorithm()
+        self.assertNotIn("Generational", algo.get_name())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import unittest
+
+import numpy as np
+
+from mach_opt import DesignProblem, FitnessCache
+
+
+class Designer:
+    def create_design(self, x):
+        return x
+
+
+class CountingEvaluator:
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, design):
+        self.calls += 1
+        return design
+
+
+class DesignSpace:
+    n_obj = 2
+    bounds = ([0, 0], [1, 10])
+
+    def get_objectives(self, full_results):
+        return tuple(np.hstack(full_results))
+
+
+class DataHandler:
+    def __init__(self):
+        self.records = []
+
+    def save_designer(self, designer):
+        pass
+
+    def save_to_archive(self, x, design, full_results, objs):
+        self.records.append(x)
+
+
+class TestFitnessCache(unittest.TestCase):
+    def test_tolerance_relative_to_bounds(self):
+        cache = FitnessCache(([0, 0], [1, 10]), tol=1e-6)
+        cache.put([0.5, 5.0], (1, 2))
+        self.assertEqual(cache.get([0.5 + 1e-8, 5.0 + 1e-7]), (1, 2))
+        self.assertIsNone(cache.get([0.5, 5.0 + 1e-3]))
+
+    def test_least_recently_used_discarded(self):
+        cache = FitnessCache(([0], [1]), max_size=2)
+        cache.put([0.1], (1,))
+        cache.put([0.2], (2,))
+        cache.get([0.1])
+        cache.put([0.3], (3,))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get([0.2]))
+        self.assertEqual(cache.get([0.1]), (1,))
+
+
+class TestDesignProblemCache(unittest.TestCase):
+    def test_fitness_evaluates_once(self):
+        evaluator = CountingEvaluator()
+        dh = DataHandler()
+        problem = DesignProblem(Designer(), evaluator, DesignSpace(), dh, cache_size=10)
+        x = np.array([0.25, 4.0])
+        self.assertEqual(problem.fitness(x), problem.fitness(x.copy()))
+        self.assertEqual(evaluator.calls, 1)
+        self.assertEqual(len(dh.records), 1)
+
+    def test_batch_fitness_skips_repeated_designs(self):
+        evaluator = CountingEvaluator()
+        problem = DesignProblem(Designer(), evaluator, DesignSpace(), DataHandler(), cache_size=10)
+        xs = np.array([[0.25, 4.0], [0.5, 1.0], [0.25, 4.0]])
+        fvs = problem.batch_fitness(xs.ravel()).reshape(3, 2)
+        np.testing.assert_array_equal(fvs, xs)
+        self.assertEqual(evaluator.calls, 2)
+        problem.batch_fitness(xs.ravel())
+        self.assertEqual(evaluator.calls, 2)
+
+    def test_without_cache(self):
+        evaluator = CountingEvaluator()
+        problem = DesignProblem(Designer(), evaluator, DesignSpace(), DataHandler())
+        x = np.array([0.25, 4.0])
+        problem.fitness(x)
+        problem.fitness(x)
+        self.assertEqual(evaluator.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from mach_opt import DataHandler, IndexedDataHandler
+
+
+class TestIndexedDataHandler(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        self.xs = rng.random((20, 3))
+        self.objs = rng.random((20, 2))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def filepath(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def fill(self, dh):
+        for i, (x, objs) in enumerate(zip(self.xs, self.objs)):
+            dh.save_to_archive(x, "design %d" % i, [i], objs)
+
+    def test_index_matches_archive(self):
+        dh = IndexedDataHandler(self.filepath("archive.pkl"), self.filepath("designer.pkl"))
+        self.fill(dh)
+        offsets, sizes, free_vars, fitness = dh.read_index()
+        np.testing.assert_array_equal(free_vars, self.xs)
+        np.testing.assert_array_equal(fitness, self.objs)
+        self.assertEqual(offsets[-1] + sizes[-1], os.path.getsize(dh.archive_filepath))
+
+    def test_load_record(self):
+        dh = IndexedDataHandler(self.filepath("archive.pkl"), self.filepath("designer.pkl"))
+        self.fill(dh)
+        for i in (0, 7, 19):
+            data = dh.load_record(i)
+            self.assertEqual(data.design, "design %d" % i)
+            np.testing.assert_array_equal(data.x, self.xs[i])
+        self.assertEqual(dh.load_record(-1).design, "design 19")
+        with self.assertRaises(IndexError):
+            dh.load_record(20)
+
+    def test_load_record_ignores_partial_row(self):
+        dh = IndexedDataHandler(self.filepath("archive.pkl"), self.filepath("designer.pkl"))
+        self.fill(dh)
+        with open(dh.index_filepath, "ab") as index:
+            index.write(np.zeros(3).tobytes())
+        self.assertEqual(dh.load_record(-1).design, "design 19")
+        with self.assertRaises(IndexError):
+            dh.load_record(20)
+
+    def test_archive_data_matches_data_handler(self):
+        dh = IndexedDataHandler(self.filepath("archive.pkl"), self.filepath("designer.pkl"))
+        self.fill(dh)
+        fitness, free_vars = dh.get_archive_data()
+        fitness_ref, free_vars_ref = DataHandler.get_archive_data(dh)
+        np.testing.assert_array_equal(fitness, fitness_ref)
+        np.testing.assert_array_equal(free_vars, free_vars_ref)
+
+    def test_rebuild_index_of_data_handler_archive(self):
+        archive = self.filepath("archive.pkl")
+        self.fill(DataHandler(archive, self.filepath("designer.pkl")))
+        dh = IndexedDataHandler(archive, self.filepath("designer.pkl"))
+        dh.rebuild_index()
+        _, _, free_vars, fitness = dh.read_index()
+        np.testing.assert_array_equal(free_vars, self.xs)
+        np.testing.assert_array_equal(fitness, self.objs)
+        self.assertEqual(dh.load_record(5).design, "design 5")
+
+    def test_mismatched_row_raises(self):
+        dh = IndexedDataHandler(self.filepath("archive.pkl"), self.filepath("designer.pkl"))
+        self.fill(dh)
+        with self.assertRaises(Exception):
+            dh.save_to_archive(np.zeros(4), "design", [], self.objs[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from mach_opt import DataHandler, IndexedDataHandler, ParetoSet
+
+
+def non_dominated(fitness):
+    """Brute force indices of the non-dominated rows of fitness, assuming minimization"""
+    keep = []
+    for i, f in enumerate(fitness):
+        dominated = np.all(fitness <= f, axis=1) & np.any(fitness < f, axis=1)
+        if not dominated.any():
+            keep.append(i)
+    return keep
+
+
+class TestParetoSet(unittest.TestCase):
+    def test_add_dominated_design(self):
+        pareto = ParetoSet()
+        self.assertTrue(pareto.add(0, [0.0], [1.0, 1.0]))
+        self.assertFalse(pareto.add(1, [1.0], [2.0, 1.0]))
+        self.assertEqual(pareto.offsets, [0])
+
+    def test_add_removes_dominated_designs(self):
+        pareto = ParetoSet()
+        pareto.add(0, [0.0], [2.0, 2.0])
+        pareto.add(1, [1.0], [3.0, 1.0])
+        self.assertTrue(pareto.add(2, [2.0], [1.0, 1.0]))
+        self.assertEqual(pareto.offsets, [2])
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(1)
+        fitness = rng.random((200, 3))
+        pareto = ParetoSet()
+        for i, objs in enumerate(fitness):
+            pareto.add(i, [i], objs)
+        self.assertEqual(sorted(pareto.offsets), non_dominated(fitness))
+
+
+class TestDataHandlerPareto(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(2)
+        self.xs = rng.random((50, 2))
+        self.objs = rng.random((50, 2))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def check_handler(self, dh):
+        for i, (x, objs) in enumerate(zip(self.xs, self.objs)):
+            dh.save_to_archive(x, i, [], objs)
+        fitness, free_vars = dh.get_pareto_fitness_freevars()
+        expected = non_dominated(self.objs)
+        self.assertEqual(sorted(data.design for data in dh.get_pareto_data()), expected)
+        np.testing.assert_array_equal(
+            np.array(sorted(map(tuple, fitness))), np.array(sorted(map(tuple, self.objs[expected])))
+        )
+
+        # a stale Pareto file is rebuilt from the archive
+        os.remove(dh.pareto_filepath)
+        with dh.archive_lock():
+            pareto = dh.read_pareto()
+        self.assertEqual(len(pareto.offsets), len(expected))
+
+    def test_data_handler(self):
+        archive = os.path.join(self.tmp.name, "archive.pkl")
+        self.check_handler(DataHandler(archive, archive + ".designer"))
+
+    def test_indexed_data_handler(self):
+        archive = os.path.join(self.tmp.name, "archive.pkl")
+        self.check_handler(IndexedDataHandler(archive, archive + ".designer"))
+
+
+if __name__ == "__main__":
+    unittest.main()